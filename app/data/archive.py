@@ -0,0 +1,153 @@
+"""
+A columnar, on-disk archive of completed seasons.
+
+Data for a completed season never changes, so `python -m app.data.archive_builder`
+snapshots it once (teams, standings, and every team's roster and regular schedule) and
+the DAL serves it from here instead of the NHL API.  Frames are stored as uncompressed
+Arrow IPC (Feather v2) files, one per season and kind, and read through a memory map, so
+opening a historical season costs a file map rather than API calls and JSON transforms.
+
+    archive/
+        manifest.json                   archived seasons (season rules, build time, file counts)
+        20222023/teams.arrow
+        20222023/standings.arrow
+        20222023/roster-SJS.arrow
+        20222023/schedule-SJS.arrow
+
+The archive is used when the directory holds a manifest; the current season is never in it.
+pandas and pyarrow are imported by the first read or write, the manifest alone needs neither.
+"""
+import json
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+from app.helpers.file_utilities import PROJECT_ROOT
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR_ENV = "NHL_ARCHIVE_DIR"
+ARCHIVE_DISABLED_ENV = "NHL_ARCHIVE_DISABLED"
+DEFAULT_ARCHIVE_DIR = PROJECT_ROOT / "archive"
+MANIFEST_NAME = "manifest.json"
+FORMAT_VERSION = 1
+
+
+class SeasonArchive:
+    """Read and write archived seasons under a root directory."""
+    def __init__(self, root: str | os.PathLike, enabled: bool = True):
+        self.root = pathlib.Path(root)
+        self.enabled = enabled
+        self._manifest: dict[str, Any] = {}
+        self._manifest_mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def manifest(self) -> dict[str, Any]:
+        """The manifest, reloaded whenever the file changes (e.g. after a build)."""
+        path = self.root / MANIFEST_NAME
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return {"format": FORMAT_VERSION, "seasons": {}}
+        with self._lock:
+            if mtime != self._manifest_mtime:
+                try:
+                    self._manifest = json.loads(path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    logger.warning("Ignoring unreadable archive manifest %s", path, exc_info=True)
+                    self._manifest = {"format": FORMAT_VERSION, "seasons": {}}
+                self._manifest_mtime = mtime
+            return self._manifest
+
+    def has_season(self, season_id: int | str) -> bool:
+        return self.enabled and str(season_id) in self.manifest().get("seasons", {})
+
+    def season_rules(self) -> list[dict[str, Any]]:
+        """The season rules (as returned by the API) of every archived season."""
+        if not self.enabled:
+            return []
+        return [entry["season"] for entry in self.manifest().get("seasons", {}).values()]
+
+    def season_for_start_date(self, start_date: str) -> Optional[str]:
+        """The id of the archived season starting on start_date, if any."""
+        if not self.enabled:
+            return None
+        for season_id, entry in self.manifest().get("seasons", {}).items():
+            if entry["season"]["startDate"][:10] == start_date:
+                return season_id
+        return None
+
+    def read_frame(self, season_id: int | str, name: str) -> Optional["pd.DataFrame"]:
+        """Read an archived frame through a memory map, None when the season or the file is not archived."""
+        table = self._read_table(season_id, name)
+        return None if table is None else table.to_pandas()
+
+    def read_records(self, season_id: int | str, name: str) -> Optional[list[dict[str, Any]]]:
+        """Read an archived frame as a list of row dicts, without going through pandas."""
+        table = self._read_table(season_id, name)
+        return None if table is None else table.to_pylist()
+
+    def write_frame(self, season_id: int | str, name: str, df: "pd.DataFrame") -> None:
+        import pyarrow as pa
+        from pyarrow import feather
+
+        path = self._path(season_id, name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Uncompressed, so reads can map the column buffers rather than decode them
+        feather.write_feather(pa.Table.from_pandas(df), str(path), compression="uncompressed")
+
+    def write_records(self, season_id: int | str, name: str, records: list[dict[str, Any]]) -> None:
+        import pandas as pd
+
+        self.write_frame(season_id, name, pd.DataFrame.from_records(records))
+
+    def add_season(self, season_rule: dict[str, Any], info: dict[str, Any]) -> None:
+        """Record a fully written season in the manifest, making it visible to readers."""
+        manifest = self.manifest()
+        seasons = dict(manifest.get("seasons", {}))
+        seasons[str(season_rule["id"])] = {"season": season_rule, **info}
+        self._write_manifest({"format": FORMAT_VERSION, "seasons": seasons})
+
+    def remove_season(self, season_id: int | str) -> None:
+        """Drop a season from the manifest and delete its files."""
+        manifest = self.manifest()
+        seasons = {k: v for k, v in manifest.get("seasons", {}).items() if k != str(season_id)}
+        self._write_manifest({"format": FORMAT_VERSION, "seasons": seasons})
+        shutil.rmtree(self.root / str(season_id), ignore_errors=True)
+
+    def _read_table(self, season_id: int | str, name: str) -> Optional["pa.Table"]:
+        if not self.has_season(season_id):
+            return None
+        path = self._path(season_id, name)
+        if not path.exists():
+            return None
+        from pyarrow import feather
+
+        return feather.read_table(str(path), memory_map=True)
+
+    def _path(self, season_id: int | str, name: str) -> pathlib.Path:
+        return self.root / str(season_id) / f"{name}.arrow"
+
+    def _write_manifest(self, manifest: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename, so readers never see a partial manifest
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+        os.replace(tmp_name, self.root / MANIFEST_NAME)
+        with self._lock:
+            self._manifest = manifest
+            self._manifest_mtime = (self.root / MANIFEST_NAME).stat().st_mtime
+
+
+# The archive consulted by the DAL
+season_archive = SeasonArchive(os.environ.get(ARCHIVE_DIR_ENV) or DEFAULT_ARCHIVE_DIR,
+                               enabled=not os.environ.get(ARCHIVE_DISABLED_ENV))
@@ -0,0 +1,117 @@
+"""
+Snapshot completed seasons into the on-disk archive (see app.data.archive).
+
+For each completed season, the teams, the standings, and every team's roster and regular
+schedule are fetched through the DAL (so they are processed exactly as the app would) and
+written as Arrow files.  A season is added to the manifest only once all its files are
+written; seasons already archived are skipped unless --force is given.  Needs network access.
+
+    python -m app.data.archive_builder [--seasons 20222023 20232024] [--since 20002001]
+                                       [--dir archive] [--force]
+"""
+import argparse
+import datetime as dt
+import logging
+import pathlib
+import sys
+import time
+from typing import Any, Optional
+
+from app.data.archive import SeasonArchive, season_archive
+from app.data.roster_dal import get_team_roster
+from app.data.schedule_dal import get_regular_schedule
+from app.data.season_dal import get_seasons
+from app.data.standings_dal import get_season_standings
+from app.data.team_dal import get_teams_for_season
+from app.helpers.data_cache import invalidate_season
+from app.helpers.season_utilities import is_completed_season
+from app.model.season import Season
+from app.model.team import Team
+
+logger = logging.getLogger(__name__)
+
+
+def season_rule(season: Season) -> dict[str, Any]:
+    """The season as the API's season rules record, which is how the manifest stores it."""
+    return {
+        "id": season.id,
+        "formattedSeasonId": season.formatted_id,
+        "startDate": season.start_date,
+        "endDate": season.end_date,
+        "numberOfGames": season.num_of_games,
+    }
+
+
+def team_record(team: Team) -> dict[str, Any]:
+    return {
+        "abbr": team.abbr,
+        "name": team.name,
+        "common_name": team.common_name,
+        "logo_url": team.logo_url,
+        "conference": team.conference,
+        "division": team.division,
+        "division_abbr": team.division_abbr,
+        "conference_abbr": team.conference_abbr,
+    }
+
+
+def archive_season(archive: SeasonArchive, season: Season) -> dict[str, Any]:
+    """Write one season's files and add it to the manifest, returns the manifest entry info."""
+    archive.remove_season(season.id)
+    teams = get_teams_for_season(season.start_date)
+    archive.write_records(season.id, "teams", [team_record(t) for t in teams])
+    standings = get_season_standings(season.id)
+    archive.write_frame(season.id, "standings", standings.frame.reset_index(drop=True))
+
+    missing = []
+    for team in teams:
+        for name, fetch in ((f"roster-{team.abbr}", lambda: get_team_roster(season, team)),
+                            (f"schedule-{team.abbr}", lambda: get_regular_schedule(team.abbr, season.id))):
+            try:
+                archive.write_frame(season.id, name, fetch())
+            except Exception as e:
+                # Left out of the archive, the DAL falls back to the API for it
+                logger.warning("Could not archive %s for %s: %s", name, season.id, e)
+                missing.append(name)
+
+    info = {
+        "built_at": dt.datetime.now().isoformat(timespec="seconds"),
+        "teams": len(teams),
+        "standings": len(standings),
+        "missing": missing,
+    }
+    archive.add_season(season_rule(season), info)
+    # Keep the build's memory flat, the archive is the copy now
+    invalidate_season(season.id)
+    return info
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seasons", nargs="*", help="season ids to archive (default: every completed season)")
+    parser.add_argument("--since", help="only archive seasons from this season id on, e.g. 20002001")
+    parser.add_argument("--dir", type=pathlib.Path, default=season_archive.root, help="archive directory")
+    parser.add_argument("--force", action="store_true", help="rebuild seasons that are already archived")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+
+    archive = SeasonArchive(args.dir)
+    seasons = [s for s in get_seasons() if is_completed_season(s.id)]
+    if args.seasons:
+        seasons = [s for s in seasons if str(s.id) in args.seasons]
+    if args.since:
+        seasons = [s for s in seasons if int(s.id) >= int(args.since)]
+
+    for season in sorted(seasons, key=lambda s: s.id):
+        if archive.has_season(season.id) and not args.force:
+            logger.info("%s is already archived", season.formatted_id)
+            continue
+        start = time.perf_counter()
+        info = archive_season(archive, season)
+        logger.info("Archived %s: %d teams, %d files missing, %.1fs", season.formatted_id, info["teams"],
+                    len(info["missing"]), time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Career totals of every player on a roster, side by side, for the career leaderboard.
+
+The career stats of the roster's players are fetched concurrently through the cached
+get_career_stats (usually already prefetched while the roster was on screen).  Their regular
+season totals are gathered into one set of columns in a single pass over the payloads,
+instead of normalizing each player's payload into its own frame, and aggregated per player
+with vectorized group-bys: career totals, per game rates and save percentage, over all
+leagues and over the NHL only.  The result is one frame per roster, cached for a few minutes:
+when it expires it is kept as is unless the roster changed or some players' career stats
+could not be fetched, those are fetched again.
+"""
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import numpy as np
+import pandas as pd
+
+from app.data.roster_dal import get_team_roster
+from app.data.stats import REGULAR_SEASON, get_career_stats
+from app.helpers.data_cache import DAY, MINUTE, cached, season_tag, team_tag
+from app.helpers.dataframe_utilities import compact_frame
+from app.helpers.timing import submit_with_context
+from app.model.season import Season
+from app.model.team import Team
+
+logger = logging.getLogger(__name__)
+
+NHL = "NHL"
+# Season total fields summed over a career, goalie fields are missing (summed to nothing) for skaters
+TOTAL_FIELDS = ["gamesPlayed", "goals", "assists", "points", "pim", "wins", "shutouts", "goalsAgainst",
+                "shotsAgainst"]
+PLAYER_COLUMNS = ["sweaterNumber", "lastName", "firstName", "positionCode"]
+RATE_COLUMNS = ["points_per_game", "goals_per_game", "save_pct"]
+# Columns aggregated for each split, prefixed with "nhl_" or "all_"
+SPLITS = ("nhl", "all")
+SPLIT_COLUMNS = ["seasons", *TOTAL_FIELDS, *RATE_COLUMNS]
+
+# Shared by all sessions, a roster's career stats are fetched a few players at a time
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="career-leaderboard")
+
+
+@dataclass
+class CareerLeaderboard:
+    """The career totals of a roster's players, one row per player indexed by player id."""
+    frame: pd.DataFrame
+    # Players whose career stats could not be fetched, their totals are missing
+    failed: tuple[int, ...] = ()
+
+    # Computed once, the same frames on every rerun (arrow_table converts each frame once)
+    @functools.cached_property
+    def goalies(self) -> pd.DataFrame:
+        return self.frame[self.frame["positionCode"] == "G"]
+
+    @functools.cached_property
+    def skaters(self) -> pd.DataFrame:
+        return self.frame[self.frame["positionCode"] != "G"]
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+
+@cached("career_leaderboard",
+        key=lambda season, team: (season.id, team.abbr),
+        ttl=5 * MINUTE,
+        tags=lambda season, team: (season_tag(season.id), team_tag(team.abbr)),
+        refresh=lambda stale, season, team: _refresh_leaderboard(stale, season, team),
+        stale_while_revalidate=DAY)
+def get_career_leaderboard(season: Season, team: Team) -> CareerLeaderboard:
+    """Return the career totals of every player on the team's roster for the season."""
+    return _build_leaderboard(season, team, get_team_roster(season, team))
+
+
+def _refresh_leaderboard(stale: CareerLeaderboard, season: Season, team: Team) -> CareerLeaderboard:
+    """Keep the expired leaderboard unless the roster changed or some players failed, rebuild it then."""
+    roster = get_team_roster(season, team)
+    if not stale.failed and set(roster.index.astype("int64")) == set(stale.frame.index):
+        return stale
+    return _build_leaderboard(season, team, roster)
+
+
+def _build_leaderboard(season: Season, team: Team, roster: pd.DataFrame) -> CareerLeaderboard:
+    # The career stats already fetched are cached, only the players that failed or are new are fetched
+    payloads, failed = fetch_career_stats(roster.index)
+    frame = build_career_leaderboard(roster, payloads)
+    rates = [f"{split}_{c}" for split in SPLITS for c in RATE_COLUMNS]
+    return CareerLeaderboard(compact_frame(frame, f"career leaderboard {team.abbr} {season.id}", exclude=rates),
+                             tuple(failed))
+
+
+def fetch_career_stats(player_ids: Iterable[int]) -> tuple[dict[int, dict], list[int]]:
+    """The career stats payload of each player, fetched concurrently, and the players that failed."""
+    futures = {int(player_id): submit_with_context(_executor, get_career_stats, int(player_id))
+               for player_id in player_ids}
+    payloads: dict[int, dict] = {}
+    failed: list[int] = []
+    for player_id, future in futures.items():
+        try:
+            payloads[player_id] = future.result()
+        except Exception as e:
+            logger.warning("Could not fetch the career stats of player %s: %r", player_id, e)
+            failed.append(player_id)
+    return payloads, failed
+
+
+def season_totals(payloads: dict[int, dict]) -> pd.DataFrame:
+    """The regular season totals of every player, one row per player, season and team, in one frame."""
+    player_ids: list[int] = []
+    seasons: list[Any] = []
+    leagues: list[Any] = []
+    values: dict[str, list[Any]] = {field: [] for field in TOTAL_FIELDS}
+    for player_id, payload in payloads.items():
+        for row in payload.get("seasonTotals", ()):
+            if row.get("gameTypeId") != REGULAR_SEASON:
+                continue
+            player_ids.append(player_id)
+            seasons.append(row.get("season"))
+            leagues.append(row.get("leagueAbbrev"))
+            for field, column in values.items():
+                column.append(row.get(field))
+    return pd.DataFrame({
+        "player_id": np.array(player_ids, dtype="int64"),
+        "season": seasons,
+        "leagueAbbrev": leagues,
+        # Missing fields (None) become NaN
+        **{field: np.array(column, dtype="float64") for field, column in values.items()},
+    })
+
+
+def aggregate_careers(totals: pd.DataFrame) -> pd.DataFrame:
+    """Career totals, rates and save percentage per player (the SPLIT_COLUMNS), indexed by player id."""
+    grouped = totals.groupby("player_id", sort=False)
+    careers = grouped[TOTAL_FIELDS].sum(min_count=1)
+    careers.insert(0, "seasons", grouped["season"].nunique())
+    games = careers["gamesPlayed"].where(careers["gamesPlayed"] > 0)
+    careers["points_per_game"] = careers["points"] / games
+    careers["goals_per_game"] = careers["goals"] / games
+    shots = careers["shotsAgainst"].where(careers["shotsAgainst"] > 0)
+    careers["save_pct"] = 1 - careers["goalsAgainst"] / shots
+    return careers
+
+
+def build_career_leaderboard(roster: pd.DataFrame, payloads: dict[int, dict]) -> pd.DataFrame:
+    """The roster's player columns joined with their all-league and NHL career aggregates."""
+    totals = season_totals(payloads)
+    all_leagues = aggregate_careers(totals).add_prefix("all_")
+    nhl = aggregate_careers(totals[totals["leagueAbbrev"] == NHL]).add_prefix("nhl_")
+    players = roster.reindex(columns=PLAYER_COLUMNS)
+    players.index = players.index.astype("int64")
+    frame = players.join([nhl, all_leagues], how="left")
+    # Every split column, even when no player has a row in that split (e.g. a roster of rookies)
+    columns = PLAYER_COLUMNS + [f"{split}_{c}" for split in SPLITS for c in SPLIT_COLUMNS]
+    return frame.reindex(columns=columns).sort_values("nhl_points", ascending=False, na_position="last")
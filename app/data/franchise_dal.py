@@ -0,0 +1,137 @@
+"""
+A team's standing in every season it played, for the franchise history.
+
+The history is aggregated from the league standings of every season (get_season_standings,
+cached per season and read from the archive for completed seasons).  The ~100 seasons are
+fetched a few at a time on a pool shared by all sessions rather than one after the other,
+as bulk calls (their own lower rate limit, the pages' calls go first), and the result is
+one frame cached per team.  When it expires only the seasons that can still change (the
+current season, and any season that could not be fetched) are fetched again; the rows of
+completed seasons are kept.
+"""
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+import pandas as pd
+
+from app.data.season_dal import get_seasons
+from app.data.standings_dal import get_season_standings
+from app.helpers.api_helper import bulk_calls
+from app.helpers.data_cache import HOUR, MINUTE, cached, team_tag
+from app.helpers.dataframe_utilities import compact_frame
+from app.helpers.season_utilities import is_completed_season
+from app.helpers.timing import submit_with_context
+from app.model.season import Season
+from app.model.season_standings import SeasonStandings
+from app.model.team_summary import TeamSummary
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_ENV = "NHL_HISTORY_CONCURRENCY"
+DEFAULT_CONCURRENCY = 8
+
+# One row per season played, most recent first
+HISTORY_COLUMNS = ["season_id", "season", "games_played", "wins", "losses", "ties", "ot_losses", "points",
+                   "point_pct", "goal_for", "goal_against", "league_seq", "league_teams",
+                   "conference", "conference_seq", "division", "division_seq"]
+
+# Bounds the standings fetched at a time across all sessions
+_executor = ThreadPoolExecutor(max_workers=int(os.environ.get(CONCURRENCY_ENV, 0)) or DEFAULT_CONCURRENCY,
+                               thread_name_prefix="franchise-history")
+
+
+@dataclass
+class FranchiseHistory:
+    """A team's standing in every season it played (under its current abbreviation)."""
+    team_abbrev: str
+    frame: pd.DataFrame
+    # Completed seasons whose standings were fetched, their row (or its absence) never changes
+    final_seasons: frozenset[int] = frozenset()
+    # Seasons whose standings could not be fetched, fetched again on the next refresh
+    failed: tuple[int, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+
+@cached("franchise_history",
+        key=lambda team_abbrev: (team_abbrev,),
+        ttl=5 * MINUTE,
+        tags=lambda team_abbrev: (team_tag(team_abbrev),),
+        refresh=lambda stale, team_abbrev: _refresh_history(stale, team_abbrev),
+        stale_while_revalidate=HOUR)
+def get_franchise_history(team_abbrev: str) -> FranchiseHistory:
+    """Return the team's standing in every season, fetching the seasons' standings concurrently."""
+    rows, final_seasons, failed = _fetch_rows(team_abbrev, get_seasons())
+    return FranchiseHistory(team_abbrev, _build_frame(rows, team_abbrev), frozenset(final_seasons), tuple(failed))
+
+
+def _refresh_history(stale: FranchiseHistory, team_abbrev: str) -> FranchiseHistory:
+    """Fetch only the seasons that are not final yet and merge them with the kept rows."""
+    seasons = [s for s in get_seasons() if s.id not in stale.final_seasons]
+    rows, final_seasons, failed = _fetch_rows(team_abbrev, seasons)
+    kept = stale.frame[stale.frame["season_id"].isin(stale.final_seasons)]
+    rows.extend(kept.to_dict("records"))
+    return FranchiseHistory(team_abbrev, _build_frame(rows, team_abbrev),
+                            stale.final_seasons | final_seasons, tuple(failed))
+
+
+def _fetch_rows(team_abbrev: str, seasons: Iterable[Season]) -> tuple[list[dict[str, Any]], set[int], list[int]]:
+    """The team's row of each season it played, the completed seasons fetched and the seasons that failed."""
+    futures = {submit_with_context(_executor, _bulk_standings, season.id): season for season in seasons}
+    rows: list[dict[str, Any]] = []
+    final_seasons: set[int] = set()
+    failed: list[int] = []
+    for future, season in futures.items():
+        try:
+            standings = future.result()
+        except Exception as e:
+            logger.warning("Could not fetch the %s standings for the %s history: %r", season.id, team_abbrev, e)
+            failed.append(season.id)
+            continue
+        if is_completed_season(season.id):
+            final_seasons.add(season.id)
+        standing = standings.team(team_abbrev)
+        if standing is not None:
+            rows.append(_history_row(season, standing, len(standings)))
+    if failed:
+        logger.warning("The %s history is missing %d of %d seasons", team_abbrev, len(failed), len(futures))
+    return rows, final_seasons, failed
+
+
+def _bulk_standings(season_id: int) -> SeasonStandings:
+    with bulk_calls():
+        return get_season_standings(season_id)
+
+
+def _history_row(season: Season, standing: TeamSummary, league_teams: int) -> dict[str, Any]:
+    return {
+        "season_id": season.id,
+        "season": season.formatted_id,
+        "games_played": standing.games_played,
+        "wins": standing.wins,
+        "losses": standing.losses,
+        "ties": standing.ties,
+        "ot_losses": standing.ot_losses,
+        "points": standing.points,
+        "point_pct": standing.points / (2 * standing.games_played) if standing.games_played else float("nan"),
+        "goal_for": standing.goal_for,
+        "goal_against": standing.goal_against,
+        "league_seq": standing.league_seq,
+        "league_teams": league_teams,
+        "conference": standing.conference,
+        "conference_seq": standing.conference_seq,
+        "division": standing.division,
+        "division_seq": standing.division_seq,
+    }
+
+
+def _build_frame(rows: list[dict[str, Any]], team_abbrev: str) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame(columns=HISTORY_COLUMNS)
+    frame = pd.DataFrame.from_records(rows, columns=HISTORY_COLUMNS)
+    frame = frame.sort_values("season_id", ascending=False, ignore_index=True)
+    return compact_frame(frame, f"franchise history {team_abbrev}", exclude=["point_pct"])
@@ -0,0 +1,95 @@
+"""
+Live game data for the scoreboard: today's scores, the selected team's game, and how
+often to poll it.
+
+Every session watching a game polls get_daily_scores, which is cached for a few seconds,
+so however many sessions are open the API sees at most one scores call per interval.  When
+a game ends, the schedules and standings it changes are refreshed once, by the first session
+that sees the final score.
+"""
+import threading
+from typing import Optional
+
+from app.data.schedule_dal import refresh_regular_schedule
+from app.data.standings_dal import clear_season_standings
+from app.helpers import client
+from app.helpers.data_cache import cached
+from app.model.live_game import LiveGame
+
+# Shorter than the fastest poll interval, long enough to share one fetch between sessions
+SCORES_TTL = 4
+
+# Poll intervals in seconds by game situation
+CRITICAL_POLL = 5
+LIVE_POLL = 10
+INTERMISSION_POLL = 30
+PRE_GAME_POLL = 60
+
+# Games whose results were refreshed by refresh_final_results
+_refreshed_finals: set[int] = set()
+_refreshed_finals_lock = threading.Lock()
+
+
+@cached("daily_scores", key=lambda: ("now",), ttl=SCORES_TTL)
+def get_daily_scores() -> list[LiveGame]:
+    """Return the state of every game today"""
+    scores = client.game_center.daily_scores()
+    return [LiveGame(g) for g in scores.get('games', [])]
+
+
+def get_team_game(team_abbrev: str) -> Optional[LiveGame]:
+    """Return today's game for a team, None if it does not play today"""
+    return next((g for g in get_daily_scores() if g.involves(team_abbrev)), None)
+
+
+def poll_interval(game: Optional[LiveGame]) -> Optional[float]:
+    """
+    Seconds until the game should be polled again, None when it no longer changes (or there is
+    no game).  Late close games are polled the most, intermissions and pre-game the least.
+    """
+    if game is None or game.is_final:
+        return None
+    if game.state == 'CRIT':
+        return CRITICAL_POLL
+    if game.is_live:
+        return INTERMISSION_POLL if game.in_intermission else LIVE_POLL
+    # Pre-game and upcoming games only need to notice the puck drop
+    return PRE_GAME_POLL
+
+
+def refresh_final_results(game: LiveGame, season_id: int) -> bool:
+    """
+    Refresh what a finished game changes, both teams' schedules and the season's standings, once
+    per game however many sessions watched it.  Returns False when it was already refreshed; when
+    the refresh fails it raises, and the next session to see the game final tries again.
+    """
+    with _refreshed_finals_lock:
+        if game.game_id in _refreshed_finals:
+            return False
+        _refreshed_finals.add(game.game_id)
+    try:
+        for team_abbrev in (game.away_abbrev, game.home_abbrev):
+            refresh_regular_schedule(team_abbrev, season_id)
+        clear_season_standings(season_id)
+    except Exception:
+        with _refreshed_finals_lock:
+            _refreshed_finals.discard(game.game_id)
+        raise
+    return True
+
+
+def diff_live_games(previous: Optional[LiveGame], current: LiveGame) -> list[str]:
+    """Describe what changed between two polls of a game, e.g. goals, period or state changes"""
+    if previous is None or previous.game_id != current.game_id:
+        return []
+    changes = []
+    for abbrev, before, after in ((current.away_abbrev, previous.away_score, current.away_score),
+                                  (current.home_abbrev, previous.home_score, current.home_score)):
+        if after is not None and after > (before or 0):
+            changes.append(f"{abbrev} goal! {current.away_abbrev} {current.away_score} - "
+                           f"{current.home_score} {current.home_abbrev}")
+    if current.state != previous.state and (current.is_live or current.is_final):
+        changes.append("Game on!" if current.is_live and not previous.is_live else current.period_label)
+    elif (current.period, current.in_intermission) != (previous.period, previous.in_intermission):
+        changes.append(current.period_label)
+    return changes
@@ -0,0 +1,67 @@
+"""
+Load everything the main board needs for a (season, team) selection in one go.
+
+The roster, the team's standing and its regular schedule are independent API calls,
+so they are fetched concurrently on a shared thread pool instead of one after the other.
+A failure in one fetch is recorded on the bundle and does not prevent the others from rendering.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from app.data.roster_dal import get_team_roster
+from app.data.schedule_dal import get_regular_schedule
+from app.data.standings_dal import get_team_standing
+from app.helpers.timing import submit_with_context
+from app.model.season import Season
+from app.model.team import Team
+from app.model.team_summary import TeamSummary
+
+logger = logging.getLogger(__name__)
+
+# Shared by all sessions, sized for a few concurrent page loads of three fetches each
+_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="board-loader")
+
+
+@dataclass
+class BoardData:
+    """The data rendered by the main board for one season and team."""
+    season: Season
+    team: Optional[Team]
+    roster: Optional[pd.DataFrame] = None
+    standing: Optional[TeamSummary] = None
+    schedule: Optional[pd.DataFrame] = None
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    def failed(self, part: str) -> bool:
+        """Return True if fetching the given part (roster, standing, schedule) raised."""
+        return part in self.errors
+
+
+def load_board_data(season: Season, team: Optional[Team]) -> BoardData:
+    """
+    Fetch the roster, standing and regular schedule for the selection concurrently.
+
+    Nothing is fetched when no team is selected.  Exceptions are logged and stored in
+    BoardData.errors keyed by part name, leaving that part as None.
+    """
+    board = BoardData(season=season, team=team)
+    if not (season and team):
+        return board
+
+    fetches: dict[str, Callable[[], Any]] = {
+        "roster": lambda: get_team_roster(season, team),
+        "standing": lambda: get_team_standing(team.abbr, season.id),
+        "schedule": lambda: get_regular_schedule(team.abbr, season.id),
+    }
+    futures = {part: submit_with_context(_executor, fetch) for part, fetch in fetches.items()}
+    for part, future in futures.items():
+        try:
+            setattr(board, part, future.result())
+        except Exception as e:
+            logger.exception("Failed to load %s for %s %s", part, team.abbr, season.id)
+            board.errors[part] = e
+    return board
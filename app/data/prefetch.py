@@ -0,0 +1,78 @@
+"""
+Warm the data cache in the background for pages the user is likely to open next.
+
+Opening a player profile fetches that player's career stats.  While a roster is on
+screen, :func:`prefetch_career_stats` fetches the stats of every player on it in the
+background so the profile opens from the cache.  The work runs on a small pool shared by
+all sessions, so the number of concurrent prefetch calls to the API is bounded no matter
+how many rosters are open, and a job can be cancelled when its roster is replaced.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Hashable, Iterable
+
+from app.data.stats import get_career_stats
+from app.helpers.data_cache import data_cache
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_ENV = "NHL_PREFETCH_CONCURRENCY"
+DEFAULT_CONCURRENCY = 4
+
+# Bounds the prefetch calls in flight across all sessions
+_executor = ThreadPoolExecutor(max_workers=int(os.environ.get(CONCURRENCY_ENV, 0)) or DEFAULT_CONCURRENCY,
+                               thread_name_prefix="career-prefetch")
+
+
+class PrefetchJob:
+    """The background fetches started for one roster, identified by key (e.g. season id and team)."""
+    def __init__(self, key: Hashable):
+        self.key = key
+        self.futures: list[Future] = []
+        self.skipped = 0
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Drop the fetches that have not started yet; fetches already in flight finish and are cached."""
+        self._cancelled.set()
+        for future in self.futures:
+            future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def done(self) -> bool:
+        return all(f.done() for f in self.futures)
+
+    def __str__(self):
+        finished = sum(1 for f in self.futures if f.done())
+        return f"PrefetchJob({self.key}: {finished}/{len(self.futures)} done, {self.skipped} already cached)"
+
+    def _fetch(self, player_id: int) -> None:
+        if self.cancelled:
+            return
+        try:
+            get_career_stats(player_id)
+        except Exception as e:
+            # Only a warm-up, the profile page fetches (and reports) again on open
+            logger.debug("Prefetching career stats for %s failed: %s", player_id, e)
+
+
+def prefetch_career_stats(player_ids: Iterable[int], key: Hashable) -> PrefetchJob:
+    """
+    Fetch the career stats of the given players in the background, skipping those already cached.
+
+    Returns immediately with the job, which the caller keeps to cancel it when the roster changes.
+    """
+    job = PrefetchJob(key)
+    for player_id in player_ids:
+        player_id = int(player_id)
+        if data_cache.contains(get_career_stats.cache_key(player_id)):
+            job.skipped += 1
+            continue
+        job.futures.append(_executor.submit(job._fetch, player_id))
+    logger.debug("Started %s", job)
+    return job
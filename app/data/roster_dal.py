@@ -1,22 +1,46 @@
-from functools import lru_cache
-
 import pandas as pd
 
+from app.data.archive import season_archive
 from app.helpers import client
+from app.helpers.data_cache import HOUR, cached, season_tag, team_tag
+from app.helpers.dataframe_utilities import compact_frame
+from app.helpers.season_utilities import ttl_for_season
 from app.model.season import Season
 from app.model.team import Team
 
+# Roster columns used by the roster table and the player profile
+ROSTER_COLUMNS = [
+    'firstName', 'lastName', 'sweaterNumber', 'positionCode', 'shootsCatches', 'heightInInches',
+    'weightInPounds', 'birthDate', 'birthCity', 'birthStateProvince', 'birthCountry', 'headshot',
+]
+
 
-@lru_cache(maxsize=16)
+@cached("roster",
+        key=lambda season, team: (season.id, team.abbr),
+        ttl=lambda season, team: ttl_for_season(season.id, 6 * HOUR),
+        tags=lambda season, team: (season_tag(season.id), team_tag(team.abbr)),
+        stale_while_revalidate=HOUR)
 def get_team_roster(season: Season, team: Team) -> pd.DataFrame:
     """
     Return a DataFrame with the team roster from the selected season.
     """
+    archived = season_archive.read_frame(season.id, f"roster-{team.abbr}")
+    if archived is not None:
+        return archived
     roster_json = client.teams.team_roster(team.abbr, season.id)
+    return compact_frame(build_team_roster(roster_json), f"roster {team.abbr} {season.id}", keep=ROSTER_COLUMNS)
+
+
+def build_team_roster(roster_json: dict) -> pd.DataFrame:
+    """
+    Flatten a roster payload (forwards, defensemen, goalies) to one row per player indexed by player id.
+    """
     players = []
     for key in ("forwards", "defensemen", "goalies"):
         players.extend(roster_json.get(key, []))
+    # An empty roster (e.g. before it is published) or one where no player has a field still gets every column
     result_df = pd.DataFrame(players)
+    result_df = result_df.reindex(columns=list(dict.fromkeys(['id', *result_df.columns, *ROSTER_COLUMNS])))
     result_df['birthStateProvince'] = result_df['birthStateProvince'].fillna('')
     for col in ("firstName", "lastName", "birthCity", "birthStateProvince"):  # only have a province for USA and CAN
         result_df[col] = result_df[col].map(
@@ -1,13 +1,31 @@
-from functools import lru_cache
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable
 
 import pandas as pd
 import numpy as np
 
+from app.data.archive import season_archive
 from app.helpers import client
-from app.helpers.dataframe_utilities import col_or_blank, safe_numeric_col
+from app.helpers.data_cache import HOUR, MINUTE, cached, data_cache, season_tag, team_tag
+from app.helpers.season_utilities import ttl_for_season
+from app.helpers.dataframe_utilities import (col_or_blank, compact_frame, prune_columns, safe_numeric_col,
+                                               upsert_rows)
+from app.model.season import Season
 
+logger = logging.getLogger(__name__)
 
-@lru_cache(maxsize=16)
+# Game states after which a game no longer changes
+FINAL_GAME_STATES = ('OFF', 'FINAL')
+
+
+@cached("schedule",
+        key=lambda team_abbrev, season: (team_abbrev, str(season)),
+        ttl=lambda team_abbrev, season: ttl_for_season(season, 5 * MINUTE),
+        tags=lambda team_abbrev, season: (season_tag(season), team_tag(team_abbrev)),
+        refresh=lambda stale, team_abbrev, season: _refresh_stale_schedule(stale, team_abbrev, season),
+        stale_while_revalidate=HOUR)
 def get_regular_schedule(team_abbrev: str, season: str) -> pd.DataFrame:
     """
     Fetches and processes the regular season schedule for a specified team and season.
@@ -29,116 +47,373 @@ def get_regular_schedule(team_abbrev: str, season: str) -> pd.DataFrame:
         A dataframe representing the team's regular season schedule. It includes columns
         such as game scores, win/loss/tie information, goal differentials, and other game
         details. The dataframe uses the game ID as the index.
+
+    Once the cached schedule expires it is refreshed incrementally, see update_regular_schedule.
+    """
+    archived = season_archive.read_frame(season, f"schedule-{team_abbrev}")
+    if archived is not None:
+        return archived
+    schedule_json = client.schedule.team_season_schedule(team_abbrev, season)
+    return _compact_schedule(build_regular_schedule(schedule_json, team_abbrev), team_abbrev, season)
+
+
+def _compact_schedule(schedule_df: pd.DataFrame, team_abbrev: str, season: str) -> pd.DataFrame:
+    return compact_frame(schedule_df, f"schedule {team_abbrev} {season}",
+                         keep=REGULAR_SCHEDULE_COLUMNS, exclude=FLOAT_SCHEDULE_COLUMNS)
+
+
+@dataclass
+class ScheduleRefreshReport:
+    """What an incremental schedule refresh changed."""
+    team_abbrev: str
+    season: str
+    games: int = 0
+    added: list[int] = field(default_factory=list)
+    updated: list[int] = field(default_factory=list)
+    removed: list[int] = field(default_factory=list)
+    full_rebuild: bool = False
+    duration_ms: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed or self.full_rebuild)
+
+    def __str__(self):
+        mode = "full rebuild" if self.full_rebuild else "incremental"
+        return (f"{self.team_abbrev} {self.season} schedule refresh ({mode}): {self.games} games, "
+                f"{len(self.added)} added, {len(self.updated)} updated, {len(self.removed)} removed "
+                f"in {self.duration_ms:.1f} ms")
+
+
+def update_regular_schedule(schedule_df: pd.DataFrame, schedule_json: dict, team_abbrev: str,
+                            season: str) -> tuple[pd.DataFrame, ScheduleRefreshReport]:
+    """
+    Merge a freshly fetched schedule payload into a previously built schedule frame.
+
+    Games already in a final state are kept as they are.  The other games are compared by
+    game id on their state, date, start time and scores, and only the new or changed ones
+    are rebuilt; games no longer in the payload are dropped.  schedule_df is not modified.
+    """
+    start = time.perf_counter()
+    report = ScheduleRefreshReport(team_abbrev, str(season))
+    games = [g for g in schedule_json.get('games', []) if g.get('gameType') == 2]
+    report.games = len(games)
+    game_ids = [g['id'] for g in games]
+
+    # The signature of each cached game, as plain values (None for missing) comparable with the payload
+    signature_columns = [schedule_df[c].tolist() if c in schedule_df.columns else [None] * len(schedule_df)
+                         for c in ('gameState', 'gameDate', 'startTimeUTC', 'awayTeamScore', 'homeTeamScore')]
+    previous = {game_id: tuple(None if pd.isna(v) else v for v in values)
+                for game_id, *values in zip(schedule_df.index, *signature_columns)}
+    changed_games = []
+    for game in games:
+        signature = previous.get(game['id'])
+        if signature is None:
+            report.added.append(game['id'])
+            changed_games.append(game)
+        elif signature[0] not in FINAL_GAME_STATES and _game_signature(game) != signature:
+            report.updated.append(game['id'])
+            changed_games.append(game)
+    fetched_ids = set(game_ids)
+    report.removed = [i for i in previous if i not in fetched_ids]
+
+    if changed_games or report.removed:
+        # Cast to the cached frame's dtypes when merged, so the few rebuilt rows are not compacted
+        rows = prune_columns(build_regular_schedule({'games': changed_games}, team_abbrev), REGULAR_SCHEDULE_COLUMNS)
+        try:
+            schedule_df = upsert_rows(schedule_df, rows, report.removed).reindex(game_ids)
+        except (TypeError, ValueError):
+            # A value that no longer fits the compacted dtypes, rebuild everything
+            logger.warning("Could not merge the %s %s schedule, rebuilding it", team_abbrev, season, exc_info=True)
+            schedule_df = _compact_schedule(build_regular_schedule(schedule_json, team_abbrev), team_abbrev, season)
+            report.full_rebuild = True
+    report.duration_ms = (time.perf_counter() - start) * 1e3
+    return schedule_df, report
+
+
+def _game_signature(game: dict) -> tuple:
+    played = game.get('gameState') != 'FUT'
+    return (game.get('gameState'), game.get('gameDate'), game.get('startTimeUTC'),
+            game.get('awayTeam', {}).get('score') if played else None,
+            game.get('homeTeam', {}).get('score') if played else None)
+
+
+def _refresh_stale_schedule(stale_df: pd.DataFrame, team_abbrev: str, season: str) -> pd.DataFrame:
+    """Bring an expired cached schedule up to date, see update_regular_schedule."""
+    schedule_json = client.schedule.team_season_schedule(team_abbrev, season)
+    schedule_df, report = update_regular_schedule(stale_df, schedule_json, team_abbrev, season)
+    logger.info("%s", report)
+    return schedule_df
+
+
+def refresh_regular_schedule(team_abbrev: str, season: str) -> ScheduleRefreshReport:
     """
+    Refresh a team's cached schedule now, rebuilding only the games that changed, and
+    report what changed.  Builds the whole schedule when nothing is cached yet.
+    """
+    stale_df = data_cache.peek(get_regular_schedule.cache_key(team_abbrev, season))
+    if stale_df is None:
+        start = time.perf_counter()
+        schedule_df = get_regular_schedule(team_abbrev, season)
+        return ScheduleRefreshReport(team_abbrev, str(season), games=len(schedule_df), full_rebuild=True,
+                                     duration_ms=(time.perf_counter() - start) * 1e3)
     schedule_json = client.schedule.team_season_schedule(team_abbrev, season)
+    schedule_df, report = update_regular_schedule(stale_df, schedule_json, team_abbrev, season)
+    get_regular_schedule.cache_set(schedule_df, team_abbrev, season)
+    logger.info("%s", report)
+    return report
 
-    # Keep only regular season games (gameType=2)
-    regular_season_games = [g for g in schedule_json.get('games', []) if g.get('gameType') == 2]
 
-    # Flatten nested JSON to columns like 'awayTeam.score', 'homeTeam.abbrev', etc.
-    regular_season_games_df = pd.json_normalize(regular_season_games, sep='.').set_index('id')
+def build_regular_schedule(schedule_json: dict, team_abbrev: str) -> pd.DataFrame:
+    """
+    Transform a club season schedule payload into the team's regular season dataframe.
 
+    Every derived column is computed with whole-column operations: the team-perspective
+    values (team score, opponent score, goal differential) are selected once with the
+    home/away mask, and the display strings are built by element-wise concatenation of
+    object arrays, so there are no per-row Python callbacks.  The derived columns are
+    attached to the flattened games in a single concat.
+    """
+    df = normalize_regular_games(schedule_json.get('games', []))
+    game_columns = derive_game_columns(df)
+    home_game = col_or_blank(df, 'homeTeam.abbrev').eq(team_abbrev).to_numpy()
+    team_columns = derive_team_columns(game_columns, home_game)
+
+    derived = {
+        'awayTeamScore': game_columns['awayTeamScore'],
+        'homeTeamScore': game_columns['homeTeamScore'],
+        'awayScore': game_columns['awayScore'],
+        'homeScore': game_columns['homeScore'],
+        'awayTeam': game_columns['awayTeam'],
+        'homeTeam': game_columns['homeTeam'],
+        'goalDiff': team_columns['goalDiff'],
+        'winLossTie': team_columns['winLossTie'],
+        'opponent': team_columns['opponent'],
+        'gameOutcome': game_columns['gameOutcome'],
+        'scoreSummary': team_columns['scoreSummary'],
+        'winningGoalieDisplay': game_columns['winningGoalieDisplay'],
+        'winningGoalScorerDisplay': game_columns['winningGoalScorerDisplay'],
+    }
+    return pd.concat([df, pd.DataFrame(derived, index=df.index)], axis=1)
+
+
+def normalize_regular_games(games: list[dict]) -> pd.DataFrame:
+    """Flatten the regular season games (gameType=2) to columns like 'awayTeam.score', indexed by game id."""
+    regular_season_games = [g for g in games if g.get('gameType') == 2]
+    if not regular_season_games:
+        # Nothing to flatten (e.g. a week without regular season games), the game columns are still expected
+        return pd.DataFrame(columns=LEAGUE_GAME_COLUMNS, index=pd.Index([], name='id'))
+    return pd.json_normalize(regular_season_games, sep='.').set_index('id')
+
+
+def derive_game_columns(df: pd.DataFrame) -> dict[str, Any]:
+    """
+    Derive the columns that do not depend on which team is looking at the game:
+    played flag, scores, team names, outcome and the winning goalie/scorer displays.
+    """
     # Determine which games have been played (FUT = future)
-    game_played = regular_season_games_df['gameState'].ne('FUT')
-
-    # Scores only for played games (nullable integers for display)
-    away_raw = safe_numeric_col(regular_season_games_df, "awayTeam.score")
-    home_raw = safe_numeric_col(regular_season_games_df, "homeTeam.score")
-    regular_season_games_df["awayTeamScore"] = away_raw.where(game_played).astype("Int64")
-    regular_season_games_df["homeTeamScore"] = home_raw.where(game_played).astype("Int64")
-
-    # Coerce to nullable float for safe arithmetic
-    regular_season_games_df['awayScore'] = regular_season_games_df['awayTeamScore'].astype('Float64')
-    regular_season_games_df['homeScore'] = regular_season_games_df['homeTeamScore'].astype('Float64')
-
-    # Team name columns
-    regular_season_games_df['awayTeam'] = regular_season_games_df.get('awayTeam.commonName.default')
-    regular_season_games_df['homeTeam'] = regular_season_games_df.get('homeTeam.commonName.default')
-
-    # Compute goalDiff from TEAM perspective (NaN for unplayed)
-    home_game = regular_season_games_df.get('homeTeam.abbrev', '').eq(team_abbrev)
-    regular_season_games_df['goalDiff'] = np.where(
-        game_played,
-        np.where(home_game,
-                 regular_season_games_df['homeScore'] - regular_season_games_df['awayScore'],
-                 regular_season_games_df['awayScore'] - regular_season_games_df['homeScore']),
-        np.nan
-    )
-
-    # W/L/T for played games
-    sign_series: pd.Series = np.sign(pd.to_numeric(regular_season_games_df['goalDiff'], errors='coerce'))
-    regular_season_games_df['winLossTie'] = np.where(
-        game_played, sign_series.map({1.0: 'W', -1.0: 'L', 0.0: 'T'}), ''
-    )
-    regular_season_games_df['opponent'] = np.where(
-        home_game,
-        'vs ' + regular_season_games_df['awayTeam'],
-        '@' + regular_season_games_df['homeTeam'])
+    game_played = df['gameState'].ne('FUT').to_numpy()
+
+    # Scores only for played games (nullable integers for display, nullable floats for arithmetic)
+    away_score = safe_numeric_col(df, "awayTeam.score").where(game_played).astype("Int64")
+    home_score = safe_numeric_col(df, "homeTeam.score").where(game_played).astype("Int64")
 
     # Outcome and award fields: only show when played; empty otherwise
-    outcome_series = col_or_blank(regular_season_games_df, 'gameOutcome.lastPeriodType', '')
-    regular_season_games_df['gameOutcome'] = np.where(game_played, outcome_series, '')
+    outcome = np.where(game_played, _object_col(df, 'gameOutcome.lastPeriodType', ''), '').astype(object)
 
-    # Build integer-like score strings (e.g., "2" not "2.0"), blank when not applicable
-    home_score_str: pd.Series = regular_season_games_df['homeScore'].apply(
-        lambda v: '' if pd.isna(v) else f'{int(v)}'
-    )
-    away_score_str: pd.Series = regular_season_games_df['awayScore'].apply(
-        lambda v: '' if pd.isna(v) else f'{int(v)}'
-    )
+    return {
+        'gamePlayed': game_played,
+        'awayTeamScore': away_score,
+        'homeTeamScore': home_score,
+        'awayScore': away_score.astype('Float64'),
+        'homeScore': home_score.astype('Float64'),
+        'awayTeam': _object_col(df, 'awayTeam.commonName.default'),
+        'homeTeam': _object_col(df, 'homeTeam.commonName.default'),
+        'gameOutcome': outcome,
+        'winningGoalieDisplay': _player_display(df, 'winningGoalie', game_played),
+        'winningGoalScorerDisplay': _player_display(df, 'winningGoalScorer', game_played),
+    }
+
+
+def derive_team_columns(game_columns: dict[str, Any] | pd.DataFrame, home_game: np.ndarray) -> dict[str, Any]:
+    """
+    Derive the columns seen from one team's perspective (goalDiff, winLossTie, opponent,
+    scoreSummary) from the game columns and a mask of the games the team played at home.
+    """
+    game_played = np.asarray(game_columns['gamePlayed'], dtype=bool)
+    away_score = game_columns['awayTeamScore']
+    home_score = game_columns['homeTeamScore']
+
+    # Scores from the TEAM perspective, as plain float arrays (NaN for unplayed)
+    away_values = away_score.to_numpy(dtype='float64', na_value=np.nan)
+    home_values = home_score.to_numpy(dtype='float64', na_value=np.nan)
+    goal_diff = np.where(game_played,
+                         np.where(home_game, home_values - away_values, away_values - home_values),
+                         np.nan)
+
+    # W/L/T for played games, blank for future games (and NaN for a played game without a score)
+    sign = np.sign(goal_diff)
+    win_loss_tie = np.select([sign > 0, sign < 0, sign == 0], ['W', 'L', 'T'], '').astype(object)
+    win_loss_tie[game_played & np.isnan(goal_diff)] = np.nan
+
+    away_team = np.asarray(game_columns['awayTeam'], dtype=object)
+    home_team = np.asarray(game_columns['homeTeam'], dtype=object)
+    opponent = np.where(home_game, _concat('vs ', away_team), _concat('@', home_team))
 
     # A regulation outcome is assumed unless overtime or shootout
     # No need to annotate a tie as OT, that's assumed
-    game_outcome_str: pd.Series = np.where(
-        (regular_season_games_df['winLossTie'] == 'T') |
-        (regular_season_games_df['gameOutcome'].isna()) |
-        (regular_season_games_df['gameOutcome'] == '') |
-        (regular_season_games_df['gameOutcome'] == 'REG'),
-        '',
-        regular_season_games_df['gameOutcome']
-    )
-
-    regular_season_games_df['scoreSummary'] = np.where(
-        game_played,
-        np.where(home_game,
-                 home_score_str + '-' +
-                 away_score_str + ' ' +
-                 regular_season_games_df['winLossTie'] + ' ' +
-                 game_outcome_str,
-
-                 away_score_str + '-' +
-                 home_score_str + ' ' +
-                 regular_season_games_df['winLossTie'] + ' ' +
-                 game_outcome_str),
-        ''
-    )
-
-    wg_first: pd.Series = col_or_blank(regular_season_games_df, 'winningGoalie.firstInitial.default', '')
-    wg_last: pd.Series  = col_or_blank(regular_season_games_df, 'winningGoalie.lastName.default', '')
-    regular_season_games_df['winningGoalieDisplay'] = np.where(
-        game_played,
-        wg_first.astype('string').str.cat(wg_last.astype('string'), sep=' ').str.strip(),
-        ''
-    )
-
-    wgs_first: pd.Series = col_or_blank(regular_season_games_df, 'winningGoalScorer.firstInitial.default', '')
-    wgs_last: pd.Series = col_or_blank(regular_season_games_df, 'winningGoalScorer.lastName.default', '')
-    regular_season_games_df['winningGoalScorerDisplay'] = np.where(
-        game_played,
-        wgs_first.astype('string').str.cat(wgs_last.astype('string'), sep=' ').str.strip(),
-        ''
-    )
-    return regular_season_games_df
+    outcome = np.asarray(game_columns['gameOutcome'], dtype=object)
+    outcome_suffix = np.where((win_loss_tie == 'T') | np.isin(outcome, ['', 'REG']), '', outcome)
+
+    # Integer-like score strings (e.g., "2" not "2.0"), blank when not applicable
+    home_score_str = home_score.astype('string').fillna('').to_numpy(dtype=object)
+    away_score_str = away_score.astype('string').fillna('').to_numpy(dtype=object)
+    score_summary = _concat(np.where(home_game, home_score_str, away_score_str), '-',
+                            np.where(home_game, away_score_str, home_score_str), ' ',
+                            win_loss_tie, ' ', outcome_suffix)
+
+    return {
+        'goalDiff': goal_diff,
+        'winLossTie': win_loss_tie,
+        'opponent': opponent,
+        'scoreSummary': np.where(game_played, score_summary, ''),
+    }
+
+
+def _object_col(df: pd.DataFrame, col: str, fill: object = np.nan) -> np.ndarray:
+    """Return a column as an object array (for element-wise string building), `fill` when missing."""
+    if col in df.columns:
+        return df[col].to_numpy(dtype=object, na_value=fill)
+    return np.full(len(df), fill, dtype=object)
+
+
+def _concat(*parts: np.ndarray | str) -> np.ndarray:
+    """Concatenate object arrays and literals element-wise, NaN in any part gives NaN."""
+    result = np.full(len(next(p for p in parts if not isinstance(p, str))), '', dtype=object)
+    missing = np.zeros(len(result), dtype=bool)
+    for part in parts:
+        if not isinstance(part, str):
+            part_missing = pd.isna(part)
+            if part_missing.any():
+                missing |= part_missing
+                part = np.where(part_missing, '', part)
+        result = result + part
+    result[missing] = np.nan
+    return result
+
+
+def _player_display(df: pd.DataFrame, prefix: str, game_played: np.ndarray) -> np.ndarray:
+    """Build "F. Last" for a player column group (e.g. winningGoalie), blank for unplayed games."""
+    first = _object_col(df, f'{prefix}.firstInitial.default', '')
+    last = _object_col(df, f'{prefix}.lastName.default', '')
+    display = np.char.strip((first + ' ' + last).astype(str)).astype(object)
+    return np.where(game_played, display, '')
+
+
+# Columns of the flattened games kept in the league schedule, alongside the derived game columns
+LEAGUE_GAME_COLUMNS = [
+    'season', 'gameDate', 'startTimeUTC', 'gameState', 'venue.default', 'neutralSite',
+    'awayTeam.abbrev', 'homeTeam.abbrev', 'awayTeam.logo', 'homeTeam.logo',
+]
+
+
+# Columns kept in the cached team schedule, the rest of the flattened payload is not used
+REGULAR_SCHEDULE_COLUMNS = LEAGUE_GAME_COLUMNS + [
+    'awayTeamScore', 'homeTeamScore', 'awayScore', 'homeScore', 'awayTeam', 'homeTeam', 'goalDiff',
+    'winLossTie', 'opponent', 'gameOutcome', 'scoreSummary', 'winningGoalieDisplay', 'winningGoalScorerDisplay',
+]
+# Float columns meant for arithmetic, kept as floats when compacting
+FLOAT_SCHEDULE_COLUMNS = ['awayScore', 'homeScore', 'goalDiff']
+# Columns shown in the board's schedule table
+SCHEDULE_DISPLAY_COLUMNS = ['gameDate', 'opponent', 'scoreSummary', 'winningGoalieDisplay', 'winningGoalScorerDisplay']
+
+
+@cached("league_schedule",
+        key=lambda season: (str(season.id),),
+        ttl=lambda season: ttl_for_season(season.id, 5 * MINUTE),
+        tags=lambda season: (season_tag(season.id),),
+        stale_while_revalidate=HOUR)
+def get_league_schedule(season: Season) -> pd.DataFrame:
+    """
+    Return every regular season game of a season, one row per game indexed by game id.
+
+    Games are fetched week by week from the league schedule, so each game is downloaded
+    once rather than once per participating team, and the team-independent columns
+    (scores, team names, outcome, winning goalie/scorer) are derived once for the whole
+    league.  Use team_schedule_view to project a single team's schedule from it, or
+    cache_team_schedules to cache every team's regular schedule from it.
+    """
+    games: dict[int, dict] = {}
+    week_start = season.start_date
+    while week_start and week_start <= season.end_date:
+        week_json = client.schedule.weekly_schedule(week_start)
+        for day in week_json.get('gameWeek', []):
+            for game in day.get('games', []):
+                # The weekly schedule dates the day rather than each of its games
+                game.setdefault('gameDate', day['date'])
+                games.setdefault(game['id'], game)  # de-duplicate, a game belongs to one week only
+        next_start = week_json.get('nextStartDate')
+        if not next_start or next_start <= week_start:
+            break
+        week_start = next_start
+
+    return compact_frame(build_league_schedule(list(games.values())), f"league schedule {season.id}",
+                         exclude=FLOAT_SCHEDULE_COLUMNS)
+
+
+def build_league_schedule(games: list[dict]) -> pd.DataFrame:
+    """Flatten league games to the kept game columns plus the team-independent derived columns, by date."""
+    df = normalize_regular_games(games)
+    game_columns = derive_game_columns(df)
+    kept = df[[c for c in LEAGUE_GAME_COLUMNS if c in df.columns]]
+    league_df = pd.concat([kept, pd.DataFrame(game_columns, index=df.index)], axis=1)
+    return league_df.sort_values(['gameDate', 'startTimeUTC'] if 'startTimeUTC' in league_df else 'gameDate')
+
+
+def team_schedule_view(league_df: pd.DataFrame, team_abbrev: str) -> pd.DataFrame:
+    """
+    Project one team's regular schedule out of the league schedule, adding the
+    team-perspective columns (goalDiff, winLossTie, opponent, scoreSummary).
+    """
+    home_game = league_df['homeTeam.abbrev'].eq(team_abbrev).to_numpy()
+    team_games = home_game | league_df['awayTeam.abbrev'].eq(team_abbrev).to_numpy()
+    team_df = league_df[team_games]
+    team_columns = derive_team_columns(team_df, home_game[team_games])
+    return team_df.assign(**team_columns)
+
+
+def get_team_schedule_view(team_abbrev: str, season: Season) -> pd.DataFrame:
+    """Return a team's regular schedule as a projection of the cached league schedule."""
+    return team_schedule_view(get_league_schedule(season), team_abbrev)
+
+
+def cache_team_schedules(season: Season, team_abbrevs: Iterable[str]) -> int:
+    """
+    Cache each team's regular schedule (as get_regular_schedule returns it) as a projection of
+    the league schedule, so the schedules of a whole season cost the weekly league calls, each
+    game downloaded once, instead of one call per team.  Teams whose schedule is already cached
+    are skipped; returns the number of schedules cached.
+    """
+    season_id = str(season.id)
+    pending = [abbrev for abbrev in team_abbrevs
+               if not data_cache.contains(get_regular_schedule.cache_key(abbrev, season_id))]
+    if not pending:
+        return 0
+    league_df = get_league_schedule(season)
+    # Plain columns again, so each team's schedule is compacted on its own values, as when fetched by team
+    league_df = league_df.astype({c: dtype.categories.dtype for c, dtype in league_df.dtypes.items()
+                                  if isinstance(dtype, pd.CategoricalDtype)})
+    for abbrev in pending:
+        schedule_df = _compact_schedule(team_schedule_view(league_df, abbrev), abbrev, season_id)
+        get_regular_schedule.cache_set(schedule_df, abbrev, season_id)
+    return len(pending)
 
 
 def clear_schedule_cache():
     get_regular_schedule.cache_clear()
+    get_league_schedule.cache_clear()
 
 
 def trim_schedule_df_for_display(schedule_df: pd.DataFrame) -> pd.DataFrame:
-    display_columns = [
-        'gameDate', 'opponent',
-        'scoreSummary', 'winningGoalieDisplay', 'winningGoalScorerDisplay'
-    ]
-    display_df = schedule_df[display_columns].copy()
+    display_df = schedule_df[SCHEDULE_DISPLAY_COLUMNS].copy()
     return display_df
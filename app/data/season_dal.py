@@ -1,17 +1,27 @@
-from functools import lru_cache
-from typing import List
+import logging
 
+from app.data.archive import season_archive
 from app.helpers import client
+from app.helpers.data_cache import DAY, cached
+from app.model.catalog import SeasonCatalog
 from app.model.season import Season
 
+logger = logging.getLogger(__name__)
 
-@lru_cache(maxsize=1)
-def get_seasons() -> List[Season]:
-    """Retrieve all seasons from the NHL API (cached for the lifetime of the process)"""
-    season_rules = client.misc.season_specific_rules_and_info()
-    seasons = [Season(d) for d in season_rules]
-    seasons = sorted(seasons, key=lambda s: s.formatted_id, reverse=True)  # current season first
-    return seasons
+
+@cached("seasons", ttl=DAY, stale_while_revalidate=DAY)
+def get_seasons() -> SeasonCatalog:
+    """Retrieve all seasons from the NHL API, current season first (cached for a day)"""
+    try:
+        season_rules = client.misc.season_specific_rules_and_info()
+    except Exception:
+        # Without the API, the archived (completed) seasons can still be browsed
+        season_rules = season_archive.season_rules()
+        if not season_rules:
+            raise
+        logger.warning("Seasons are not available from the API, using the %d archived seasons", len(season_rules),
+                       exc_info=True)
+    return SeasonCatalog(Season.from_rule(d) for d in season_rules)
 
 
 def refresh_seasons_cache() -> None:
@@ -1,27 +1,53 @@
-from functools import lru_cache
 from typing import Optional, Any
 
+from app.data.archive import season_archive
 from app.helpers import client
+from app.helpers.data_cache import DAY, HOUR, MINUTE, cached, data_cache, season_tag
+from app.helpers.season_utilities import ttl_for_season
+from app.model.season_standings import SeasonStandings
 from app.model.team_summary import TeamSummary
 
 
-@lru_cache(maxsize=16)
+@cached("standings_manifest", ttl=DAY, stale_while_revalidate=DAY)
+def get_standings_end_dates() -> dict[int, str]:
+    """The date of each season's final standings (standingsEnd), from the manifest of every season."""
+    return {season['id']: season['standingsEnd'] for season in client.standings.season_standing_manifest()}
+
+
 def get_standings(season_id: str) -> list[dict[str, Any]]:
-    standings_json = client.standings.league_standings(season=season_id)
+    """Fetch the raw league standings JSON for a season (use get_season_standings for the cached, indexed form)."""
+    # Asked by season, nhlpy fetches the whole manifest again to find the date, the cached manifest is used instead
+    end_date = get_standings_end_dates().get(int(season_id))
+    if end_date is None:
+        # A season newer than the cached manifest
+        standings_json = client.standings.league_standings(season=season_id)
+    else:
+        standings_json = client.standings.league_standings(date=end_date)
     return standings_json['standings']
 
 
+@cached("standings",
+        key=lambda season_id: (str(season_id),),
+        ttl=lambda season_id: ttl_for_season(season_id, 5 * MINUTE),
+        tags=lambda season_id: (season_tag(season_id),),
+        stale_while_revalidate=HOUR)
+def get_season_standings(season_id: str) -> SeasonStandings:
+    """Return the indexed standings for a season, TeamSummary objects are built once per fetch."""
+    archived = season_archive.read_records(season_id, "standings")
+    if archived is not None:
+        return SeasonStandings.from_records(season_id, archived)
+    return SeasonStandings(season_id, get_standings(season_id))
+
+
 def clear_standings_cache() -> None:
-    get_standings.cache_clear()
+    get_season_standings.cache_clear()
+
+
+def clear_season_standings(season_id: str) -> None:
+    """Drop the cached standings of one season, e.g. after a game changed them."""
+    data_cache.delete(get_season_standings.cache_key(season_id))
 
 
 def get_team_standing(team_abbrev: str, season_id: str) -> Optional[TeamSummary]:
-    standings = get_standings(season_id)
-    # if the season asked for has no data, the standings list will be empty
-    if not standings:
-        return None
-    # Find the team we want and build the TeamSummary
-    for standing in standings:
-        if standing['teamAbbrev']['default'] == team_abbrev:
-            return TeamSummary(standing)
-    return None
+    # if the season asked for has no data, the standings will be empty and this returns None
+    return get_season_standings(season_id).team(team_abbrev)
@@ -1,16 +1,109 @@
 """ NHL Stats API """
-from functools import lru_cache
+from dataclasses import dataclass, replace
+from typing import Optional
+
+import pandas as pd
 
 from app.helpers import client
+from app.helpers.data_cache import DAY, cached, player_tag
+from app.helpers.dataframe_utilities import compact_frame
+
+REGULAR_SEASON = 2
+PLAYOFFS = 3
+
+GOALIE_COLUMNS = ['formatted_season', 'leagueAbbrev', 'teamName.default', 'gamesPlayed', 'goalsAgainstAvg',
+                  'goalsAgainst', 'shutouts', 'wins', 'losses']
+GOALIE_OPTIONAL_COLUMNS = ['assists', 'gamesStarted', 'goals', 'pim', 'shotsAgainst', 'timeOnIce', 'otLosses']
+SKATER_COLUMNS = ['formatted_season', 'leagueAbbrev', 'teamName.default', 'gamesPlayed', 'goals', 'assists',
+                  'points', 'pim']
+SKATER_OPTIONAL_COLUMNS = ['plusMinus', 'avgToi', 'shots', 'shootingPctg', 'faceoffWinningPctg']
+# Averages and percentages stay floats, even when a career's values are all whole (e.g. a 0.0 or 1.0 save pct)
+RATE_COLUMNS = ['goalsAgainstAvg', 'savePctg', 'shootingPctg', 'faceoffWinningPctg']
+
+
+@dataclass
+class CareerFrames:
+    """A player's season totals, split into regular season and playoffs and trimmed to the display columns."""
+    player_id: int
+    goalie: bool
+    regular: pd.DataFrame
+    playoffs: pd.DataFrame
 
+    @property
+    def columns(self) -> list[str]:
+        return list(self.regular.columns)
 
-@lru_cache(maxsize=16)
+
+@cached("career_stats",
+        key=lambda player_id: (int(player_id),),
+        ttl=DAY,
+        tags=lambda player_id: (player_tag(player_id),),
+        stale_while_revalidate=DAY)
 def get_career_stats(player_id: int) -> dict:
     """ Get the career stats for a player """
     stats = client.stats.player_career_stats(player_id)
     return stats
 
 
+@cached("career_frames",
+        key=lambda player_id, position_code=None: (int(player_id), position_code),
+        ttl=DAY,
+        tags=lambda player_id, position_code=None: (player_tag(player_id),),
+        stale_while_revalidate=DAY)
+def get_career_frames(player_id: int, position_code: Optional[str] = None) -> CareerFrames:
+    """ Get a player's regular season and playoff totals, ready to display (see build_career_frames) """
+    frames = build_career_frames(int(player_id), get_career_stats(player_id), position_code)
+    return replace(frames,
+                   regular=compact_frame(frames.regular, f"career {player_id} regular season", exclude=RATE_COLUMNS),
+                   playoffs=compact_frame(frames.playoffs, f"career {player_id} playoffs", exclude=RATE_COLUMNS))
+
+
+def build_career_frames(player_id: int, career_stats: dict, position_code: Optional[str] = None) -> CareerFrames:
+    """
+    Normalize the season totals of a career stats payload, format the seasons and select the
+    goalie or skater columns (plus whichever optional columns the payload has).
+
+    The goalie columns are chosen by the roster's position code when given, as the profile
+    always did, and by the position in the payload otherwise (e.g. a player not on a roster).
+    """
+    season_totals_df = pd.json_normalize(career_stats.get('seasonTotals', []), sep='.')
+    goalie = (position_code or career_stats.get('position')) == 'G'
+    columns = display_columns(season_totals_df.columns, goalie)
+
+    if 'season' in season_totals_df.columns:
+        season_totals_df['formatted_season'] = format_seasons(season_totals_df['season'])
+    game_types = season_totals_df.get('gameTypeId', pd.Series(index=season_totals_df.index, dtype=float))
+
+    return CareerFrames(
+        player_id=player_id,
+        goalie=goalie,
+        regular=season_totals_df.loc[game_types == REGULAR_SEASON].reindex(columns=columns),
+        playoffs=season_totals_df.loc[game_types == PLAYOFFS].reindex(columns=columns),
+    )
+
+
+def display_columns(available: pd.Index, goalie: bool) -> list[str]:
+    """ The career table columns for a goalie or a skater, given the columns in the payload """
+    if goalie:
+        columns = list(GOALIE_COLUMNS)
+        if 'savePctg' in available:
+            columns.insert(columns.index('goalsAgainstAvg') + 1, 'savePctg')
+        if 'ties' in available:
+            columns.insert(columns.index('wins') + 1, 'ties')
+        optional = GOALIE_OPTIONAL_COLUMNS
+    else:
+        columns = list(SKATER_COLUMNS)
+        optional = SKATER_OPTIONAL_COLUMNS
+    return columns + [c for c in optional if c in available]
+
+
+def format_seasons(seasons: pd.Series) -> pd.Series:
+    """ Format season ids (20232024) as readable strings (2023-24), keeping 1999-2000 in full """
+    s = seasons.astype(str)
+    return (s.str[:4] + "-" + s.str[-2:]).where(s != "19992000", "1999-2000")
+
+
 def clear_career_stats():
     """ Clear the career stats """
     get_career_stats.cache_clear()
+    get_career_frames.cache_clear()
@@ -1,28 +1,30 @@
-from functools import lru_cache
-from typing import List
-
+from app.data.archive import season_archive
 from app.helpers import client
+from app.helpers.data_cache import DAY, cached
+from app.model.catalog import TeamCatalog
 from app.model.team import Team
 
 
-@lru_cache(maxsize=16)
-def get_teams_for_season(start_date: str) -> List[Team]:
+# Teams as of a past season's start date never change, the current teams (no date) are refreshed daily
+@cached("teams", ttl=lambda start_date: DAY if not start_date else None, stale_while_revalidate=DAY)
+def get_teams_for_season(start_date: str) -> TeamCatalog:
     """Get the teams for a given season.  Special case for the current season, pass no date."""
+    archived_season = season_archive.season_for_start_date(start_date) if start_date else None
+    if archived_season:
+        archived = season_archive.read_records(archived_season, "teams")
+        if archived is not None:
+            return TeamCatalog(Team.from_record(t) for t in archived)
+
     teams_json = client.teams.teams(start_date) if start_date else client.teams.teams()
-    teams: List[Team] = []
-    for team in teams_json:
-        teams.append(Team({
-            'abbr': team['abbr'],
-            'name': team['name'],
-            'common_name': team['common_name'],
-            'logo_url': team['logo'],
-            'conference': team['conference']['name'],
-            'division': team['division']['name'],
-            'division_abbr': team['division']['abbr'],
-            'conference_abbr': team['conference']['abbr'],
-        }))
-    teams = sorted(teams, key=lambda t: t.name)
-    return teams
+    return TeamCatalog(Team(abbr=team['abbr'],
+                            name=team['name'],
+                            common_name=team['common_name'],
+                            logo_url=team['logo'],
+                            conference=team['conference']['name'],
+                            division=team['division']['name'],
+                            division_abbr=team['division']['abbr'],
+                            conference_abbr=team['conference']['abbr'])
+                       for team in teams_json)
 
 
 def refresh_teams_cache() -> None:
@@ -0,0 +1,176 @@
+"""
+Warm the caches for a whole season before users arrive.
+
+After a deploy or a cache flush, the first visitor to each team page would otherwise pay
+for the roster, schedule and standings misses.  :func:`warm_season` loads the season list,
+then the season's teams and standings, then every team's roster and regular schedule, through
+the DAL (so the values are processed and cached exactly as the pages would), a bounded number
+at a time.  The schedules are projected from the one league schedule (each game downloaded
+once) when the data cache they land in serves the pages, and fetched team by team otherwise,
+so the response cache holds what the pages ask for.
+
+Run as a command, before traffic is shifted to a new instance:
+
+    python -m app.data.warmup [--season 20252026] [--concurrency 4]
+
+A separate process warms the on-disk response cache, and the data cache when it is a
+shared backend (see app.helpers.cache_backends).  Set NHL_WARMUP_ON_START to also warm the
+in-process cache of each app process in the background, once, when its first page runs.
+"""
+import argparse
+import logging
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from app.data.archive import season_archive
+from app.data.roster_dal import get_team_roster
+from app.data.schedule_dal import cache_team_schedules, get_regular_schedule
+from app.data.season_dal import get_seasons
+from app.data.standings_dal import get_season_standings
+from app.data.team_dal import get_teams_for_season
+from app.helpers.data_cache import DataCache, data_cache
+from app.helpers.timing import API, DAL, start_rerun, submit_with_context
+from app.model.season import Season
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_ENV = "NHL_WARMUP_CONCURRENCY"
+ON_START_ENV = "NHL_WARMUP_ON_START"
+DEFAULT_CONCURRENCY = 4
+# The regular schedules of every team, warmed at once from the league schedule
+SCHEDULES = "schedules"
+
+# Receives the number of values done, the total, and the name of the value just done
+Progress = Callable[[int, int, str], None]
+
+
+@dataclass
+class WarmupReport:
+    """What a warm-up loaded, and what it cost."""
+    season: str = ""
+    teams: int = 0
+    values: int = 0
+    already_cached: int = 0
+    api_calls: int = 0
+    elapsed_s: float = 0.0
+    failed: list[str] = field(default_factory=list)
+
+    def __str__(self):
+        return (f"warmed {self.season}: {self.values} values for {self.teams} teams "
+                f"({self.already_cached} already cached), {self.api_calls} api calls, "
+                f"{len(self.failed)} failed, {self.elapsed_s:.1f}s")
+
+
+def log_progress(done: int, total: int, name: str) -> None:
+    logger.info("warm-up %d/%d %s", done, total, name)
+
+
+def warm_season(season: Optional[Season] = None,
+                concurrency: Optional[int] = None,
+                progress: Optional[Progress] = log_progress,
+                team_schedules: bool = False) -> WarmupReport:
+    """
+    Load the season list, then the teams, standings, rosters and regular schedules of a season
+    (the current season by default) into the caches, `concurrency` values at a time.
+
+    The schedules are projected from the league schedule, unless `team_schedules` is set: then
+    each team's schedule is fetched on its own, as the pages fetch it, so the response cache
+    holds it (for a warm-up process whose data cache the pages do not share).
+
+    Failures are logged and listed in the report, the pages fetch (and report) them again.
+    """
+    concurrency = concurrency or int(os.environ.get(CONCURRENCY_ENV, 0)) or DEFAULT_CONCURRENCY
+    timings = start_rerun("warmup")
+    seasons = get_seasons()
+    season = season or seasons.current
+    # The current season's teams are cached without a date, as the sidebar asks for them
+    teams = get_teams_for_season(season.start_date if season != seasons.current else None)
+
+    fetches: dict[str, Callable[[], Any]] = {"standings": lambda: get_season_standings(season.id)}
+    if team_schedules or season_archive.has_season(season.id):
+        # One per team: archived schedules are read from disk, or the response cache is to hold each
+        for team in teams:
+            fetches[f"schedule {team.abbr}"] = lambda team=team: get_regular_schedule(team.abbr, season.id)
+    else:
+        # Submitted early, its weekly calls run alongside the rosters; returns the schedules it cached
+        fetches[SCHEDULES] = lambda: cache_team_schedules(season, [team.abbr for team in teams])
+    for team in teams:
+        fetches[f"roster {team.abbr}"] = lambda team=team: get_team_roster(season, team)
+
+    report = WarmupReport(season=season.formatted_id, teams=len(teams), values=len(fetches))
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="warmup") as executor:
+        futures = {submit_with_context(executor, fetch): name for name, fetch in fetches.items()}
+        for done, future in enumerate(as_completed(futures), start=1):
+            name = futures[future]
+            try:
+                result = future.result()
+                if name == SCHEDULES and result == 0:
+                    report.already_cached += 1
+            except Exception as e:
+                logger.warning("Could not warm %s for %s: %s", name, season.formatted_id, e)
+                report.failed.append(name)
+            if progress:
+                progress(done, len(fetches), name)
+
+    timings.finish()
+    spans = timings.spans
+    report.api_calls = sum(1 for s in spans if s.kind == API and s.cache_hit is not True)
+    # Only the fetches submitted above, not the DAL calls nested in them
+    report.already_cached += sum(1 for s in spans if s.kind == DAL and s.cache_hit
+                                and s.name in ("get_season_standings", "get_team_roster", "get_regular_schedule"))
+    report.elapsed_s = timings.total_ms / 1e3
+    logger.info("%s", report)
+    return report
+
+
+_startup_lock = threading.Lock()
+_startup_thread: Optional[threading.Thread] = None
+
+
+def start_warmup_once() -> Optional[threading.Thread]:
+    """
+    When NHL_WARMUP_ON_START is set, warm the current season in a background thread, once per
+    process (later calls return the same thread).  Meant to be called by every page run.
+    """
+    global _startup_thread
+    if not os.environ.get(ON_START_ENV):
+        return None
+    with _startup_lock:
+        if _startup_thread is None:
+            _startup_thread = threading.Thread(target=_warm_in_background, name="warmup-on-start", daemon=True)
+            _startup_thread.start()
+        return _startup_thread
+
+
+def _warm_in_background() -> None:
+    try:
+        warm_season(progress=None)
+    except Exception:
+        # e.g. the season list is unavailable; the pages report it
+        logger.exception("Warming the caches on start failed")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--season", type=int, help="season id to warm (default: the current season)")
+    parser.add_argument("--concurrency", type=int, help=f"values loaded at a time (default {DEFAULT_CONCURRENCY})")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s - %(message)s")
+
+    season = None
+    if args.season:
+        season = get_seasons().season(args.season)
+        if season is None:
+            logger.error("Unknown season %s", args.season)
+            return 2
+    # Another process's in-process data cache is lost with it, only the response cache on disk is shared
+    report = warm_season(season, args.concurrency, team_schedules=isinstance(data_cache, DataCache))
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from .api_helper import client
+from .api_helper import client, use_client
 from .logging_utilities import setup_logging
 
-__all__ = ["client", "setup_logging"]
+__all__ = ["client", "use_client", "setup_logging"]
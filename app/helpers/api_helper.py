@@ -1,17 +1,129 @@
+import contextlib
+import contextvars
 import logging
+import os
+import threading
+from typing import Any, Callable, Iterator, Optional
 
-# I had an issue once while running in Streamlit Cloud, and I wanted more info, so adding this
-# defensive logging
-try:
-    from nhlpy import NHLClient
-except Exception as e:
-    # Log enough context to debug missing/incorrect dependency on Streamlit Cloud
-    logging.exception(
-        "Failed to import NHLClient from 'nhlpy'. "
-        "This typically means the required pip package isn't installed or the version is incompatible."
-    )
-    # Re-raise so the app still fails visibly (details will be in logs)
-    raise
-
-# Define the NHL client once and reuse it throughout the application
-client = NHLClient()
+from app.helpers.timing import API, span
+
+# Set to skip the on-disk response cache and always call the NHL API
+CACHE_DISABLED_ENV = "NHL_API_CACHE_DISABLED"
+# Per call timeout and retries of the resilient client (app.helpers.resilient_client)
+TIMEOUT_ENV = "NHL_API_TIMEOUT"
+RETRIES_ENV = "NHL_API_RETRIES"
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+
+# Set by bulk_calls for the calls made within it
+_bulk = contextvars.ContextVar("nhl_api_bulk", default=False)
+
+
+class ClientProxy:
+    """
+    Forward attribute access to the client currently in use.  Modules import the proxy
+    once (``from app.helpers import client``), so swapping the client underneath, e.g. for
+    a fake in benchmarks, takes effect everywhere.  Every endpoint call is timed as an api span.
+
+    Unless one is given, the client is created by `factory` on first use, so importing the app
+    neither imports nhlpy nor builds an HTTP client.
+    """
+    def __init__(self, target: Any = None, factory: Optional[Callable[[], Any]] = None):
+        self._target = target
+        self._factory = factory
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        return _TimedGroup(name, getattr(self.target(), name))
+
+    def target(self) -> Any:
+        """The client in use, created on first use."""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = self._factory()
+        return self._target
+
+
+class _TimedGroup:
+    """One endpoint group of the client (teams, schedule, ...), with each method call timed."""
+    def __init__(self, group: str, target: Any):
+        self._group = group
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def timed_call(*args, **kwargs):
+            with span(f"{self._group}.{name}", API, args=",".join(str(a) for a in args)):
+                return attr(*args, **kwargs)
+        return timed_call
+
+
+@contextlib.contextmanager
+def bulk_calls() -> Iterator[None]:
+    """
+    Mark the API calls made within as a bulk fetch (e.g. every season's standings for a franchise
+    history).  The resilient client limits them to their own lower rate, and lets them take from
+    the shared budget only while it keeps half its burst for the interactive calls, so a bulk
+    fetch never starves the pages.
+    """
+    token = _bulk.set(True)
+    try:
+        yield
+    finally:
+        _bulk.reset(token)
+
+
+def in_bulk_calls() -> bool:
+    return _bulk.get()
+
+
+def call_deadline() -> float:
+    """The longest an API call can take through the resilient client, every attempt timing out."""
+    timeout = float(os.environ.get(TIMEOUT_ENV) or DEFAULT_TIMEOUT)
+    return timeout * (int(os.environ.get(RETRIES_ENV) or DEFAULT_RETRIES) + 1)
+
+
+def use_client(new_client: Any) -> Any:
+    """
+    Route every API call through new_client, returns the client previously in use (None when
+    it was not created yet; passing None back creates it on the next call).
+    """
+    previous = client._target
+    client._target = new_client
+    return previous
+
+
+def create_client(base: Any = None) -> Any:
+    """
+    The NHL client behind the proxy: rate limited, retried and guarded by a circuit breaker, with
+    raw responses persisted on disk, so a restart or redeploy does not have to refetch everything.
+    The stack wraps `base` when given (e.g. a fake in benchmarks), an NHLClient otherwise.
+    """
+    from app.helpers.resilient_client import resilient_client_from_env
+    from app.helpers.response_cache import ResponseCache
+
+    if base is None:
+        # I had an issue once while running in Streamlit Cloud, and I wanted more info, so adding this
+        # defensive logging
+        try:
+            from nhlpy import NHLClient
+        except Exception:
+            # Log enough context to debug missing/incorrect dependency on Streamlit Cloud
+            logging.exception(
+                "Failed to import NHLClient from 'nhlpy'. "
+                "This typically means the required pip package isn't installed or the version is incompatible."
+            )
+            # Re-raise so the app still fails visibly (details will be in logs)
+            raise
+        base = NHLClient(timeout=float(os.environ.get(TIMEOUT_ENV) or DEFAULT_TIMEOUT))
+    resilient = resilient_client_from_env(base)
+    return resilient if os.environ.get(CACHE_DISABLED_ENV) else ResponseCache(resilient)
+
+
+# Define the NHL client once and reuse it throughout the application.  It is created with the
+# first API call, nhlpy and httpx are imported then rather than when the app starts.
+client = ClientProxy(factory=create_client)
@@ -0,0 +1,371 @@
+"""
+Data cache backends shared by the app's worker processes.
+
+Each worker keeping its own DataCache holds its own copy of every season, roster and
+schedule, and fetches each of them from the NHL API itself.  A :class:`SharedCache` keeps the
+entries in a :class:`Store` that all the workers read and write instead:
+
+- :class:`SQLiteStore`, a SQLite database file, for workers on one host (the default store).
+- :class:`RedisStore`, a Redis server, for workers on several hosts.  It only needs the
+  handful of commands a ``redis.Redis`` client provides (get, set, getrange, sadd, smembers,
+  delete, scan_iter), so any client or local stand-in with those methods can be used.
+
+Values are stored as pickle protocol 5, where DataFrame columns are written as their raw
+binary buffers.  Each worker keeps the values it has decoded in a small in-process DataCache,
+checked against the stored entry's version on every lookup: a hit on an unchanged entry only
+reads the version, and a change made by any worker is seen by all of them.  Only point the
+backend at a store the app controls, values are unpickled when read.
+"""
+import logging
+import os
+import pathlib
+import pickle
+import random
+import sqlite3
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Hashable, Iterable, Optional
+
+from app.helpers.memory_cache import DAY, CacheBackend, CacheStats, DataCache
+from app.helpers.file_utilities import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+SQLITE_BACKEND = "sqlite"
+REDIS_BACKEND = "redis"
+
+SQLITE_PATH_ENV = "NHL_DATA_CACHE_PATH"
+REDIS_URL_ENV = "NHL_DATA_CACHE_REDIS_URL"
+LOCAL_BYTES_ENV = "NHL_DATA_CACHE_LOCAL_MB"
+DEFAULT_SQLITE_PATH = PROJECT_ROOT / ".cache" / "data-cache.sqlite"
+DEFAULT_LOCAL_BYTES = 64 * 1024 * 1024
+DEFAULT_REDIS_PREFIX = "nhl-data:"
+
+# Redis drops expired keys, they are kept this long past their TTL for incremental refreshes
+STALE_GRACE = DAY
+
+_MISSING = object()
+
+
+def encode_value(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=5)
+
+
+def decode_value(blob: bytes) -> Any:
+    return pickle.loads(blob)
+
+
+def store_key(key: Hashable) -> str:
+    """The string a cache key is stored under, keys are tuples of plain values."""
+    return repr(key)
+
+
+class Store(ABC):
+    """Versioned blobs with TTL and tags, readable by several processes."""
+    @abstractmethod
+    def version(self, key: str, max_stale: Optional[float] = 0.0) -> Optional[int]:
+        """
+        The version of the entry for key, None when there is none or it expired more than
+        max_stale seconds ago (None accepts any expired entry).
+        """
+
+    @abstractmethod
+    def read(self, key: str, max_stale: Optional[float] = 0.0) -> Optional[tuple[int, bytes]]:
+        """The version and blob of the entry for key, None as for version()."""
+
+    @abstractmethod
+    def write(self, key: str, blob: bytes, ttl: Optional[float], tags: Iterable[str]) -> int:
+        """Store blob under key, returns the entry's new version."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, tag: str) -> int:
+        """Delete every entry carrying tag, returns the number of entries deleted."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def info(self) -> dict[str, Any]:
+        return {}
+
+
+def _new_version() -> int:
+    # Random rather than a counter, writers in other processes can't collide on it
+    return random.getrandbits(63)
+
+
+class SQLiteStore(Store):
+    """
+    A SQLite database shared by the processes on one host, bounded by the total size of the blobs.
+
+    Expired rows are kept (for incremental refreshes) until the budget is exceeded; then expired
+    rows go first, followed by the oldest writes.
+    """
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            stored_at REAL NOT NULL,
+            expires_at REAL,
+            tags TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at);
+    """
+
+    def __init__(self, path: str | os.PathLike, max_bytes: int):
+        self.path = pathlib.Path(path)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._local = threading.local()
+        self._connect()
+
+    def version(self, key: str, max_stale: Optional[float] = 0.0) -> Optional[int]:
+        row = self._connect().execute("SELECT version, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None or _expired(row[1], max_stale):
+            return None
+        return row[0]
+
+    def read(self, key: str, max_stale: Optional[float] = 0.0) -> Optional[tuple[int, bytes]]:
+        row = self._connect().execute("SELECT version, expires_at, value FROM entries WHERE key = ?",
+                                      (key,)).fetchone()
+        if row is None or _expired(row[1], max_stale):
+            return None
+        return row[0], row[2]
+
+    def write(self, key: str, blob: bytes, ttl: Optional[float], tags: Iterable[str]) -> int:
+        version = _new_version()
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)",
+                         (key, version, blob, len(blob), now, None if ttl is None else now + ttl,
+                          _tag_list(tags)))
+            self._evict(conn, now)
+        return version
+
+    def delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def invalidate(self, tag: str) -> int:
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM entries WHERE instr(tags, ?) > 0", (_tag_list([tag]),)).rowcount
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def info(self) -> dict[str, Any]:
+        entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"path": str(self.path), "entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "evictions": self.evictions}
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = conn.execute("SELECT key, size FROM entries "
+                            "ORDER BY expires_at IS NULL OR expires_at > ?, stored_at", (now,)).fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection, sqlite3 connections can't be shared between threads."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            # Readers don't block the writer (and the other way round) across processes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self._SCHEMA)
+            self._local.conn = conn
+        return conn
+
+
+class RedisStore(Store):
+    """
+    A Redis server shared by processes on any number of hosts.
+
+    Each entry is one string value: a header holding the version and expiry time, then the blob,
+    so checking the version reads only the header (GETRANGE).  Tags are sets of keys.  Redis
+    expires the entries itself (STALE_GRACE after their TTL) and bounds memory with its own
+    maxmemory policy.
+    """
+    _HEADER = struct.Struct(">qd")
+
+    def __init__(self, client: Any, prefix: str = DEFAULT_REDIS_PREFIX):
+        self.client = client
+        self.prefix = prefix
+
+    def version(self, key: str, max_stale: Optional[float] = 0.0) -> Optional[int]:
+        header = self.client.getrange(self.prefix + key, 0, self._HEADER.size - 1)
+        if not header or len(header) < self._HEADER.size:
+            return None
+        version, expires_at = self._HEADER.unpack(header)
+        if _expired(expires_at or None, max_stale):
+            return None
+        return version
+
+    def read(self, key: str, max_stale: Optional[float] = 0.0) -> Optional[tuple[int, bytes]]:
+        data = self.client.get(self.prefix + key)
+        if not data or len(data) < self._HEADER.size:
+            return None
+        version, expires_at = self._HEADER.unpack_from(data)
+        if _expired(expires_at or None, max_stale):
+            return None
+        return version, data[self._HEADER.size:]
+
+    def write(self, key: str, blob: bytes, ttl: Optional[float], tags: Iterable[str]) -> int:
+        version = _new_version()
+        expires_at = 0.0 if ttl is None else time.time() + ttl
+        px = None if ttl is None else int((ttl + STALE_GRACE) * 1000)
+        self.client.set(self.prefix + key, self._HEADER.pack(version, expires_at) + blob, px=px)
+        for tag in tags:
+            self.client.sadd(self._tag_key(tag), key)
+        return version
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def invalidate(self, tag: str) -> int:
+        keys = [k.decode() if isinstance(k, bytes) else k for k in self.client.smembers(self._tag_key(tag))]
+        removed = self.client.delete(*[self.prefix + k for k in keys]) if keys else 0
+        self.client.delete(self._tag_key(tag))
+        return removed
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def info(self) -> dict[str, Any]:
+        return {"prefix": self.prefix}
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+
+class SharedCache(CacheBackend):
+    """A CacheBackend over a Store, with this process's decoded values kept in a local DataCache."""
+    def __init__(self, store: Store, local_max_bytes: int = DEFAULT_LOCAL_BYTES):
+        self.store = store
+        self.stats = CacheStats()
+        # Decoded values as (version, value), only served while the store holds the same version
+        self._local = DataCache(local_max_bytes)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._load(key)
+        if value is _MISSING:
+            self.stats.misses += 1
+            return default
+        self.stats.hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None, max_stale: Optional[float] = None) -> Any:
+        value = self._load(key, max_stale)
+        return default if value is _MISSING else value
+
+    def contains(self, key: Hashable) -> bool:
+        return self.store.version(store_key(key)) is not None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()) -> None:
+        try:
+            blob = encode_value(value)
+        except Exception:
+            self.stats.rejected += 1
+            logger.warning("Not caching %s, the value can't be serialized", key, exc_info=True)
+            return
+        version = self.store.write(store_key(key), blob, ttl, tags)
+        self._local.set(key, (version, value), ttl, size=len(blob))
+
+    def delete(self, key: Hashable) -> None:
+        self.store.delete(store_key(key))
+        self._local.delete(key)
+
+    def invalidate(self, tag: str) -> int:
+        # Local copies of the removed entries are dropped on their next lookup
+        removed = self.store.invalidate(tag)
+        self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        self.store.clear()
+        self._local.clear()
+
+    def info(self) -> dict[str, Any]:
+        local = self._local.info()
+        return {
+            "backend": type(self.store).__name__,
+            **self.store.info(),
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "hit_rate": round(self.stats.hit_rate(), 3),
+            "invalidations": self.stats.invalidations,
+            "rejected": self.stats.rejected,
+            "local_entries": local["entries"],
+            "local_bytes": local["bytes"],
+        }
+
+    def _load(self, key: Hashable, max_stale: Optional[float] = 0.0) -> Any:
+        """The value stored for key, decoded only when this process does not hold its current version."""
+        skey = store_key(key)
+        local = self._local.peek(key)
+        version = self.store.version(skey, max_stale)
+        if version is None:
+            if local is not None:
+                self._local.delete(key)
+            return _MISSING
+        if local is not None and local[0] == version:
+            return local[1]
+        found = self.store.read(skey, max_stale=None)
+        if found is None:
+            return _MISSING
+        version, blob = found
+        try:
+            value = decode_value(blob)
+        except Exception:
+            # e.g. written by an older release whose classes have changed since
+            logger.warning("Ignoring undecodable data cache entry %s", key, exc_info=True)
+            return _MISSING
+        # The encoded size stands in for the decoded one, estimating it costs more than decoding
+        self._local.set(key, (version, value), size=len(blob))
+        return value
+
+
+def _expired(expires_at: Optional[float], max_stale: Optional[float] = 0.0) -> bool:
+    """True when an entry expiring at expires_at expired more than max_stale seconds ago (None: never)."""
+    return max_stale is not None and expires_at is not None and time.time() >= expires_at + max_stale
+
+
+def _tag_list(tags: Iterable[str]) -> str:
+    """Tags as one delimited string, so a tag can be matched exactly with instr()."""
+    return "".join(f"|{tag}|" for tag in tags)
+
+
+def create_shared_cache(backend: str, max_bytes: int) -> SharedCache:
+    """Create the shared cache for a backend name (sqlite or redis), configured from the environment."""
+    local_bytes = int(float(os.environ.get(LOCAL_BYTES_ENV, 0)) * 1024 * 1024) or DEFAULT_LOCAL_BYTES
+    if backend == SQLITE_BACKEND:
+        store = SQLiteStore(os.environ.get(SQLITE_PATH_ENV) or DEFAULT_SQLITE_PATH, max_bytes)
+    elif backend == REDIS_BACKEND:
+        import redis  # optional, only needed for this backend
+        store = RedisStore(redis.Redis.from_url(os.environ[REDIS_URL_ENV]))
+    else:
+        raise ValueError(f"Unknown data cache backend {backend!r}")
+    logger.info("Data cache backend %s (%s)", backend, store.info())
+    return SharedCache(store, local_bytes)
@@ -0,0 +1,280 @@
+"""
+A unified, memory-bounded, TTL-aware cache for the data access layer.
+
+Every DAL function is decorated with :func:`cached`, which stores results in one shared
+cache.  Entries are keyed by plain values (season id, team abbreviation, player id) rather
+than model objects, carry their own TTL, and are tagged so that everything cached for a
+season or a team can be invalidated at once.
+
+The cache is a :class:`CacheBackend`, chosen with NHL_DATA_CACHE_BACKEND.  The default,
+:class:`DataCache` (app.helpers.memory_cache), keeps values in process, bounded in bytes.  The
+backends in app.helpers.cache_backends share one cache between the app's worker processes.
+"""
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from app.helpers.api_helper import call_deadline
+# Re-exported, the DAL imports the TTL units and the backends from here
+from app.helpers.memory_cache import (DAY, DEFAULT_MAX_BYTES, HOUR, MEMORY_BACKEND, MINUTE,  # noqa: F401
+                                      CacheBackend, CacheStats, DataCache, estimate_size)
+from app.helpers.timing import DAL, mark_cache_hit, span
+
+logger = logging.getLogger(__name__)
+
+MAX_BYTES_ENV = "NHL_DATA_CACHE_MAX_MB"
+BACKEND_ENV = "NHL_DATA_CACHE_BACKEND"
+
+
+def season_tag(season_id: int | str) -> str:
+    return f"season:{season_id}"
+
+
+def team_tag(team_abbrev: str) -> str:
+    return f"team:{team_abbrev}"
+
+
+def player_tag(player_id: int | str) -> str:
+    return f"player:{player_id}"
+
+
+def namespace_tag(namespace: str) -> str:
+    return f"ns:{namespace}"
+
+
+_MISSING = object()
+
+
+def create_cache() -> CacheBackend:
+    """Create the backend named by NHL_DATA_CACHE_BACKEND, the in-process DataCache by default."""
+    max_bytes = int(float(os.environ.get(MAX_BYTES_ENV, 0)) * 1024 * 1024) or DEFAULT_MAX_BYTES
+    backend = os.environ.get(BACKEND_ENV) or MEMORY_BACKEND
+    if backend != MEMORY_BACKEND:
+        # Imported here, the in-process cache needs none of the shared backends' dependencies
+        from app.helpers.cache_backends import create_shared_cache
+        try:
+            return create_shared_cache(backend, max_bytes)
+        except Exception:
+            logger.exception("Could not set up the %s data cache, using the in-process cache", backend)
+    return DataCache(max_bytes)
+
+
+# The single cache shared by the whole data access layer
+data_cache = create_cache()
+
+
+class _Flight:
+    """One computation of a value, awaited by the callers that missed the cache while it ran."""
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent computations of the same cache key within the process.
+
+    The first caller to miss a key computes it; callers missing the same key while it runs
+    wait for it and share its result, or its exception.  They wait at most `wait_timeout`
+    seconds (by default the longest a single API call can take), then fail with TimeoutError.
+    """
+    def __init__(self, enabled: bool = True, wait_timeout: Optional[float] = None):
+        self.enabled = enabled
+        self.wait_timeout = wait_timeout or call_deadline()
+        self.computed = 0
+        self.coalesced = 0
+        self.shared_failures = 0
+        self.timeouts = 0
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def join(self, key: Hashable) -> tuple[_Flight, bool]:
+        """Return the flight computing key and whether the caller leads it (and must compute)."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None or not self.enabled:
+                flight = _Flight()
+                self._flights.setdefault(key, flight)
+                self.computed += 1
+                return flight, True
+            flight.waiters += 1
+            self.coalesced += 1
+            return flight, False
+
+    def start(self, key: Hashable) -> Optional[_Flight]:
+        """Start a flight for key that nobody waits on, None when key is already being computed."""
+        with self._lock:
+            if key in self._flights:
+                return None
+            flight = self._flights[key] = _Flight()
+            self.computed += 1
+            return flight
+
+    def wait(self, flight: _Flight) -> Any:
+        if not flight.done.wait(self.wait_timeout):
+            with self._lock:
+                self.timeouts += 1
+            raise TimeoutError(f"Timed out after {self.wait_timeout:g}s waiting for a value computed by another call")
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def land(self, key: Hashable, flight: _Flight, value: Any = None, error: Optional[BaseException] = None) -> None:
+        """Publish the leader's result (or error) to the waiting callers."""
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+            if error is not None and flight.waiters:
+                self.shared_failures += flight.waiters
+        flight.value, flight.error = value, error
+        flight.done.set()
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {"in_flight": len(self._flights), "computed": self.computed, "coalesced": self.coalesced,
+                    "shared_failures": self.shared_failures, "timeouts": self.timeouts}
+
+
+# Shared by every cached DAL function
+single_flight = SingleFlight()
+
+# Refreshes values served stale (see stale_while_revalidate), away from the sessions' reruns
+_revalidator = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-revalidate")
+
+
+def cached(namespace: str,
+           key: Optional[Callable[..., tuple]] = None,
+           ttl: Optional[float | Callable[..., Optional[float]]] = None,
+           tags: Optional[Callable[..., Iterable[str]]] = None,
+           refresh: Optional[Callable[..., Any]] = None,
+           stale_while_revalidate: Optional[float] = None,
+           cache: Optional[CacheBackend] = None) -> Callable:
+    """
+    Decorate a DAL function so its results are stored in the shared data cache.
+
+    Parameters:
+    namespace: str
+        Name used to separate this function's entries from the others.
+    key: callable, optional
+        Receives the call arguments and returns a tuple of plain values identifying the result.
+        Defaults to the positional arguments followed by the (name, value) keyword arguments.
+    ttl: float or callable, optional
+        Seconds an entry stays fresh, or a callable receiving the call arguments and
+        returning the TTL.  None means the entry never expires.
+    tags: callable, optional
+        Receives the call arguments and returns tags (see season_tag, team_tag) used for
+        targeted invalidation.
+    refresh: callable, optional
+        Receives the expired value followed by the call arguments and returns the new value.
+        Used instead of the function when an expired entry is still cached, so the old value
+        can be updated incrementally rather than rebuilt.
+    stale_while_revalidate: float, optional
+        Seconds past its TTL an entry is still served, while one background thread computes
+        the new value.  Calls missing an older entry wait for the new value as usual, but
+        if computing it fails they are served the expired entry rather than the error.
+
+    Concurrent calls missing the same key are coalesced (see SingleFlight): one computes the
+    value, the others wait for it.
+
+    The decorated function gains ``cache_clear()`` to drop all its entries,
+    ``cache_key(*args, **kwargs)`` to compute the key a call would use and
+    ``cache_set(value, *args, **kwargs)`` to store a value computed elsewhere for a call.
+    """
+    def decorator(func: Callable) -> Callable:
+        def cache_key(*args, **kwargs) -> tuple:
+            if key:
+                return (namespace,) + tuple(key(*args, **kwargs))
+            # Keyword arguments are part of the key too, in name order so f(a=1, b=2) and f(b=2, a=1) share it
+            return (namespace,) + args + tuple(sorted(kwargs.items()))
+
+        def cache_set(value: Any, *args, **kwargs) -> None:
+            entry_ttl = ttl(*args, **kwargs) if callable(ttl) else ttl
+            entry_tags = {namespace_tag(namespace)}
+            if tags:
+                entry_tags.update(tags(*args, **kwargs))
+            (cache or data_cache).set(cache_key(*args, **kwargs), value, entry_ttl, entry_tags)
+
+        def compute(stale: Any, *args, **kwargs) -> Any:
+            value = refresh(stale, *args, **kwargs) if refresh and stale is not _MISSING else func(*args, **kwargs)
+            cache_set(value, *args, **kwargs)
+            return value
+
+        def revalidate(k: tuple, flight: _Flight, stale: Any, args: tuple, kwargs: dict) -> None:
+            try:
+                value = compute(stale, *args, **kwargs)
+            except Exception as e:
+                logger.warning("Could not refresh %s, serving the expired value meanwhile: %r", k, e)
+                value = stale
+            single_flight.land(k, flight, value)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            store = cache or data_cache
+            k = cache_key(*args, **kwargs)
+            with span(func.__name__, DAL, key=k[1:]) as s:
+                value = store.get(k, _MISSING)
+                mark_cache_hit(value is not _MISSING)
+                if value is not _MISSING:
+                    return value
+
+                if stale_while_revalidate is not None:
+                    stale = store.peek(k, _MISSING, max_stale=stale_while_revalidate)
+                    if stale is not _MISSING:
+                        s.fields["stale"] = True
+                        flight = single_flight.start(k)
+                        if flight is not None:
+                            _revalidator.submit(revalidate, k, flight, stale, args, kwargs)
+                        return stale
+                # Expired entries stay cached, for refresh and for serving when computing fails
+                stale = store.peek(k, _MISSING) if refresh or stale_while_revalidate is not None else _MISSING
+
+                flight, leader = single_flight.join(k)
+                if not leader:
+                    s.fields["coalesced"] = True
+                    try:
+                        return single_flight.wait(flight)
+                    except TimeoutError as e:
+                        if stale_while_revalidate is None or stale is _MISSING:
+                            raise
+                        logger.warning("Still computing %s, serving the expired value: %r", k, e)
+                        s.fields["stale"] = True
+                        return stale
+                try:
+                    # A flight for the key may have landed between the miss and joining, one lookup
+                    # (rather than checking then getting) so an entry evicted in between is computed
+                    value = store.get(k, _MISSING)
+                    if value is _MISSING:
+                        value = compute(stale, *args, **kwargs)
+                except Exception as e:
+                    if stale_while_revalidate is None or stale is _MISSING:
+                        single_flight.land(k, flight, error=e)
+                        raise
+                    logger.warning("Could not compute %s, serving the expired value: %r", k, e)
+                    s.fields["stale"] = True
+                    value = stale
+                except BaseException as e:
+                    single_flight.land(k, flight, error=e)
+                    raise
+                single_flight.land(k, flight, value)
+                return value
+
+        wrapper.cache_key = cache_key
+        wrapper.cache_set = cache_set
+        wrapper.cache_clear = lambda: (cache or data_cache).invalidate(namespace_tag(namespace))
+        return wrapper
+    return decorator
+
+
+def invalidate_season(season_id: int | str) -> int:
+    """Drop everything cached for a season, across all DAL functions."""
+    return data_cache.invalidate(season_tag(season_id))
+
+
+def invalidate_team(team_abbrev: str) -> int:
+    """Drop everything cached for a team, across all DAL functions."""
+    return data_cache.invalidate(team_tag(team_abbrev))
@@ -1,7 +1,17 @@
 """
     Utilities and helpers for working with dataframes.
 """
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
 
 
 def col_or_blank(df: pd.DataFrame, col: str, fill: str = '') -> pd.Series:
@@ -24,3 +34,156 @@ def safe_numeric_col(df: pd.DataFrame, col: str, dtype: str = "Float64") -> pd.S
         # Create aligned nullable float Series if the column is missing
         s = pd.Series(pd.NA, index=df.index, dtype=dtype)
     return pd.to_numeric(s, errors="coerce")
+
+
+# Smallest first, the first nullable integer type that holds a column's range is used
+_INTEGER_TYPES = [("Int8", np.iinfo(np.int8)), ("Int16", np.iinfo(np.int16)),
+                  ("Int32", np.iinfo(np.int32)), ("Int64", np.iinfo(np.int64))]
+
+
+@dataclass
+class MemoryReport:
+    """Memory used by a frame before and after compaction."""
+    label: str
+    rows: int
+    columns_before: int
+    columns_after: int
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def saved_ratio(self) -> float:
+        return 1 - self.bytes_after / self.bytes_before if self.bytes_before else 0.0
+
+    def __str__(self):
+        return (f"{self.label}: {self.rows} rows, {self.columns_before} -> {self.columns_after} columns, "
+                f"{self.bytes_before / 1024:.1f} -> {self.bytes_after / 1024:.1f} KiB "
+                f"({self.saved_ratio:.0%} smaller)")
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Deep memory usage of a frame in bytes, including its index."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def memory_report(label: str, before: pd.DataFrame, after: pd.DataFrame) -> MemoryReport:
+    return MemoryReport(label, len(after), len(before.columns), len(after.columns),
+                        frame_memory(before), frame_memory(after))
+
+
+def prune_columns(df: pd.DataFrame, keep: Iterable[str]) -> pd.DataFrame:
+    """Return only the `keep` columns present in df, in the order given."""
+    return df[[c for c in keep if c in df.columns]]
+
+
+def compact_dtypes(df: pd.DataFrame, exclude: Iterable[str] = (),
+                   max_category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Return df with smaller dtypes: string columns with few distinct values (at most
+    max_category_ratio of the rows) become categoricals, and integer columns, or float columns
+    holding only whole numbers, become the smallest nullable integer type that fits.
+    Columns in `exclude` (e.g. floats used in arithmetic) are left alone.
+    """
+    excluded = set(exclude)
+    dtypes = {}
+    for col in df.columns:
+        if col not in excluded:
+            dtype = _compact_dtype(df[col], max_category_ratio)
+            if dtype is not None:
+                dtypes[col] = dtype
+    return df.astype(dtypes) if dtypes else df
+
+
+# Memory of every frame passed to compact_frame, before and after, since the process started
+_compaction_totals = {"frames": 0, "bytes_before": 0, "bytes_after": 0}
+_compaction_lock = threading.Lock()
+
+
+def compact_frame(df: pd.DataFrame, label: str, keep: Optional[Iterable[str]] = None,
+                  exclude: Iterable[str] = (), max_category_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Prune df to the `keep` columns (if given) and compact its dtypes.  The memory saved is added
+    to the totals (see compaction_info) and logged per frame at debug level.
+    """
+    compacted = compact_dtypes(prune_columns(df, keep) if keep is not None else df, exclude, max_category_ratio)
+    report = memory_report(label, df, compacted)
+    with _compaction_lock:
+        _compaction_totals["frames"] += 1
+        _compaction_totals["bytes_before"] += report.bytes_before
+        _compaction_totals["bytes_after"] += report.bytes_after
+    logger.debug("Compacted %s", report)
+    return compacted
+
+
+def compaction_info() -> dict[str, float]:
+    """The frames compacted since start, their memory before and after, and the share saved."""
+    with _compaction_lock:
+        totals = dict(_compaction_totals)
+    before = totals["bytes_before"]
+    return {**totals, "saved_ratio": 1 - totals["bytes_after"] / before if before else 0.0}
+
+
+def upsert_rows(df: pd.DataFrame, rows: pd.DataFrame, drop: Iterable = ()) -> pd.DataFrame:
+    """
+    Return df with the rows of `rows` replacing the rows of df with the same index (or added
+    when new), and the `drop` labels removed.  df is not modified and keeps its dtypes:
+    categorical columns gain any new categories, other columns of `rows` are cast to df's dtype.
+    """
+    rows = rows.reindex(columns=df.columns)
+    kept = df[~(df.index.isin(rows.index) | df.index.isin(list(drop)))]
+    widened, converted = {}, {}
+    for col in df.columns:
+        old = kept[col]
+        if isinstance(old.dtype, pd.CategoricalDtype):
+            # Adding categories keeps the existing codes, only the new rows are encoded.  The rows
+            # are few, so plain hash lookups beat pandas' vectorized set operations here.
+            values = rows[col].tolist()
+            added = [v for v in dict.fromkeys(values) if not pd.isna(v) and v not in old.cat.categories]
+            if added:
+                old = widened[col] = old.cat.add_categories(added)
+            converted[col] = pd.Categorical.from_codes(old.cat.categories.get_indexer(values), dtype=old.dtype)
+        else:
+            converted[col] = rows[col].astype(old.dtype)
+    if widened:
+        kept = kept.assign(**widened)
+    return pd.concat([kept, pd.DataFrame(converted, index=rows.index)])
+
+
+# Arrow tables converted by arrow_table, by (id of the source frame, columns)
+_arrow_tables: dict[tuple[int, tuple[str, ...]], pa.Table] = {}
+_arrow_tables_lock = threading.Lock()
+
+
+def arrow_table(df: pd.DataFrame, columns: Iterable[str]) -> pa.Table:
+    """
+    Return the columns of df as an Arrow table, ready for st.dataframe.
+
+    Frames served from the data cache are the same object on every rerun, so each is converted
+    once and Streamlit only has to write out the table.  The table is dropped with its frame, a
+    refreshed frame is a new object and is converted again.  The index is not included.
+    """
+    key = (id(df), tuple(columns))
+    table = _arrow_tables.get(key)
+    if table is None:
+        table = pa.Table.from_pandas(df[list(key[1])], preserve_index=False)
+        with _arrow_tables_lock:
+            if key not in _arrow_tables:
+                weakref.finalize(df, _arrow_tables.pop, key, None)
+            _arrow_tables[key] = table
+    return table
+
+
+def _compact_dtype(s: pd.Series, max_category_ratio: float) -> Optional[str]:
+    """The compact dtype for a column, or None to keep its current dtype."""
+    if len(s) == 0 or isinstance(s.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(s):
+        return None
+    if pd.api.types.is_numeric_dtype(s):
+        values = s.dropna().to_numpy(dtype="float64")
+        if len(values) == 0 or not (np.isfinite(values).all() and (values == np.round(values)).all()):
+            return None
+        low, high = values.min(), values.max()
+        return next(name for name, info in _INTEGER_TYPES if info.min <= low and high <= info.max)
+    # Only plain strings, columns of lists or dicts (e.g. tvBroadcasts) are left alone
+    if pd.api.types.infer_dtype(s, skipna=True) == "string" and s.nunique() <= max_category_ratio * len(s):
+        return "category"
+    return None
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 
 
 def json_pointer_get(data: dict, pointer: str, default: bool = None, raise_error: bool = False) -> Any:
@@ -62,3 +62,118 @@ def json_pointer_get(data: dict, pointer: str, default: bool = None, raise_error
                 raise ValueError(f"Could not find {token} unsupported type in {pointer}")
             return default
     return current
+
+
+class JsonPointer:
+    """
+    A JSON Pointer (RFC 6901) parsed once, so it can be resolved against many documents
+    without re-splitting and re-unescaping the pointer string each time.
+
+    Resolution follows the same rules as json_pointer_get, including "" and "/" pointing
+    at the whole document.
+    """
+    __slots__ = ("pointer", "tokens", "indexes")
+
+    def __init__(self, pointer: str):
+        self.pointer = pointer
+        raw_tokens = [] if pointer in ("", "/") else pointer.split("/")[1:]
+        self.tokens: tuple[str, ...] = tuple(t.replace("~1", "/").replace("~0", "~") for t in raw_tokens)
+        # Pre-convert tokens usable as list indexes, None otherwise
+        self.indexes: tuple[int | None, ...] = tuple(_as_index(t) for t in self.tokens)
+
+    def get(self, data: Any, default: Any = None, raise_error: bool = False) -> Any:
+        """Resolve the pointer against data, with the same default/raise semantics as json_pointer_get."""
+        # Fast path: standings, rosters and schedules are nested dicts all the way down
+        current = data
+        try:
+            for token in self.tokens:
+                if type(current) is not dict:
+                    break
+                current = current[token]
+            else:
+                return current
+        except KeyError:
+            pass
+        return self._resolve(data, default, raise_error)
+
+    def _resolve(self, data: Any, default: Any, raise_error: bool) -> Any:
+        current = data
+        for token, idx in zip(self.tokens, self.indexes):
+            if isinstance(current, dict):
+                if token in current:
+                    current = current[token]
+                    continue
+                if raise_error:
+                    raise ValueError(f"Could not find {token} in {self.pointer}")
+                return default
+            elif isinstance(current, list):
+                if idx is None:
+                    if raise_error:
+                        raise ValueError(f"Could not convert {token} to int in {self.pointer}")
+                    return default
+                if 0 <= idx < len(current):
+                    current = current[idx]
+                    continue
+                if raise_error:
+                    raise ValueError(f"Could not find {idx} out of range in {self.pointer}")
+                return default
+            else:
+                if raise_error:
+                    raise ValueError(f"Could not find {token} unsupported type in {self.pointer}")
+                return default
+        return current
+
+    def __str__(self) -> str:
+        return self.pointer
+
+    def __repr__(self) -> str:
+        return f"JsonPointer({self.pointer!r})"
+
+
+def _as_index(token: str) -> int | None:
+    try:
+        return int(token)
+    except ValueError:
+        return None
+
+
+class JsonField:
+    """One field of a JsonSchema: a compiled pointer plus its default and raise behaviour."""
+    __slots__ = ("pointer", "default", "raise_error")
+
+    def __init__(self, pointer: str | JsonPointer, default: Any = None, raise_error: bool = False):
+        self.pointer = pointer if isinstance(pointer, JsonPointer) else JsonPointer(pointer)
+        self.default = default
+        self.raise_error = raise_error
+
+
+class JsonSchema:
+    """
+    A named set of JSON pointers extracted together from each document.
+
+    Fields map an output name to either a pointer string (missing values become None)
+    or a JsonField carrying a default and raise_error, exactly like json_pointer_get.
+    """
+    def __init__(self, fields: dict[str, str | JsonPointer | JsonField]):
+        self.fields: dict[str, JsonField] = {
+            name: f if isinstance(f, JsonField) else JsonField(f) for name, f in fields.items()
+        }
+        self._plan = [(name, f.pointer.get, f.default, f.raise_error) for name, f in self.fields.items()]
+
+    def record(self, document: Any) -> dict[str, Any]:
+        """Extract every field from one document into a dict keyed by field name."""
+        return {name: get(document, default, raise_error) for name, get, default, raise_error in self._plan}
+
+    def records(self, documents: Iterable[Any]) -> list[dict[str, Any]]:
+        """Extract every field from each document, one dict per document."""
+        return [self.record(document) for document in documents]
+
+    def columns(self, documents: Iterable[Any]) -> dict[str, list[Any]]:
+        """Extract every field from each document in a single pass, one list per field (ready for a DataFrame)."""
+        columns: dict[str, list[Any]] = {name: [] for name in self.fields}
+        appenders = [(columns[name].append, get, default, raise_error)
+                     for name, get, default, raise_error in self._plan]
+        for document in documents:
+            for append, get, default, raise_error in appenders:
+                append(get(document, default, raise_error))
+        return columns
@@ -0,0 +1,227 @@
+"""
+The data cache's backend interface, and the in-process backend.
+
+:class:`CacheBackend` is the interface the DAL caches through (see app.helpers.data_cache),
+:class:`DataCache` keeps the values in process; it is sized in bytes, using the DataFrame
+memory usage for frames, and evicts least recently used entries once the budget is exceeded.
+The shared backends (app.helpers.cache_backends) build on both, this module imports neither.
+"""
+import logging
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Hashable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+MEMORY_BACKEND = "memory"
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory held by a cached value in bytes.  DataFrames and Series report
+    their own (deep) memory usage, containers and plain objects are walked recursively.
+    """
+    seen: set[int] = set()
+
+    def size_of(obj: Any) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        memory_usage = getattr(obj, "memory_usage", None)
+        if callable(memory_usage) and hasattr(obj, "index"):
+            usage = memory_usage(deep=True)
+            return int(usage.sum() if hasattr(usage, "sum") else usage)
+        size = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            size += sum(size_of(k) + size_of(v) for k, v in obj.items())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            size += sum(size_of(v) for v in obj)
+        elif hasattr(obj, "__dict__"):
+            size += size_of(vars(obj))
+        elif hasattr(obj, "__slots__"):
+            size += sum(size_of(getattr(obj, s)) for s in obj.__slots__ if hasattr(obj, s))
+        return size
+
+    return size_of(value)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how the cache has been used."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    rejected: int = 0
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: Optional[float]
+    tags: frozenset[str] = field(default_factory=frozenset)
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+class CacheBackend(ABC):
+    """The operations the DAL caches through, implemented by DataCache and the shared backends."""
+    stats: CacheStats
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if it is missing or expired."""
+
+    @abstractmethod
+    def peek(self, key: Hashable, default: Any = None, max_stale: Optional[float] = None) -> Any:
+        """
+        Return the value cached for key even if it has expired, as long as it expired at most
+        max_stale seconds ago (None for any age), without counting a lookup.
+        """
+
+    @abstractmethod
+    def contains(self, key: Hashable) -> bool:
+        """Return True when a fresh value is cached for key, without counting a lookup."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = ()) -> None:
+        """Cache value under key for ttl seconds (None never expires)."""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, tag: str) -> int:
+        """Remove every entry carrying tag, returns the number of entries removed."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    @abstractmethod
+    def info(self) -> dict[str, Any]:
+        """Summarize usage, suitable for logging or display."""
+
+
+class DataCache(CacheBackend):
+    """A thread safe, byte-bounded LRU cache with per-entry TTL and tag based invalidation."""
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if it is missing or expired.  Expired
+        entries stay cached until evicted or replaced, they can still be peeked.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expired(time.time()):
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def peek(self, key: Hashable, default: Any = None, max_stale: Optional[float] = None) -> Any:
+        """
+        Return the value cached for key even if it expired (at most max_stale seconds ago, when
+        given), without touching the stats or LRU order.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (max_stale is not None and entry.expired(time.time() - max_stale)):
+                return default
+            return entry.value
+
+    def contains(self, key: Hashable) -> bool:
+        """Return True when a fresh value is cached for key, without touching the stats or LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and not entry.expired(time.time())
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, tags: Iterable[str] = (),
+            size: Optional[int] = None) -> None:
+        """
+        Cache value under key for ttl seconds (None never expires), evicting old entries as needed.
+        The value's size is estimated unless the caller knows it.
+        """
+        if size is None:
+            size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                self.stats.rejected += 1
+                logger.warning("Not caching %s, its %d bytes exceed the cache budget", key, size)
+                return
+            expires_at = None if ttl is None else time.time() + ttl
+            self._entries[key] = _Entry(value, size, expires_at, frozenset(tags))
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate(self, tag: str) -> int:
+        """Remove every entry carrying tag, returns the number of entries removed."""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if tag in e.tags]
+            for key in keys:
+                self._remove(key)
+            self.stats.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def info(self) -> dict[str, Any]:
+        """Summarize usage, suitable for logging or display."""
+        with self._lock:
+            return {
+                "backend": MEMORY_BACKEND,
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "hit_rate": round(self.stats.hit_rate(), 3),
+                "evictions": self.stats.evictions,
+                "expirations": self.stats.expirations,
+                "invalidations": self.stats.invalidations,
+                "rejected": self.stats.rejected,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
@@ -0,0 +1,268 @@
+"""
+A resilient wrapper around the NHL client, so a slow or failing upstream degrades the app
+instead of stalling or crashing it.
+
+Every call to an endpoint method goes through, in order:
+
+- a circuit breaker: after a run of failures the API is not called at all for a while, calls
+  fail fast with CircuitOpenError, then a single trial call decides whether to resume;
+- a token-bucket rate limiter, shared by all sessions of the process; bulk fetches (see
+  bulk_calls in app.helpers.api_helper) also have their own lower rate and leave part of the shared budget to the
+  interactive calls;
+- a per-call timeout, enforced here whatever the wrapped client does;
+- bounded retries with jittered exponential backoff, for transient errors only (timeouts,
+  connection errors, 429 and 5xx responses), all within the call's deadline.
+
+Serving stale data while the upstream is slow or down is done above this layer, by the data
+cache (see ``stale_while_revalidate`` in app.helpers.data_cache).
+"""
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Optional
+
+import httpx
+from nhlpy.http_client import RateLimitExceededException, ServerErrorException
+
+from app.helpers.api_helper import DEFAULT_RETRIES, DEFAULT_TIMEOUT, RETRIES_ENV, TIMEOUT_ENV, in_bulk_calls
+
+logger = logging.getLogger(__name__)
+
+RATE_ENV = "NHL_API_RATE"
+BULK_RATE_ENV = "NHL_API_BULK_RATE"
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+DEFAULT_BULK_RATE = 8.0
+DEFAULT_BULK_BURST = 8
+BACKOFF_BASE = 0.25
+BACKOFF_MAX = 4.0
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+
+class CircuitOpenError(ConnectionError):
+    """The NHL API is not being called after repeated failures, the call failed fast."""
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """Return True when error means the API could not answer, rather than that the call was wrong."""
+    return isinstance(error, (TimeoutError, ConnectionError, httpx.TransportError,
+                              RateLimitExceededException, ServerErrorException))
+
+
+def is_transient(error: BaseException) -> bool:
+    """Return True for errors worth retrying: timeouts, connection errors, rate limiting and server errors."""
+    return is_unavailable(error) and not isinstance(error, CircuitOpenError)
+
+
+class TokenBucket:
+    """Allow `rate` calls per second on average, with bursts of up to `burst` calls."""
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None, reserve: float = 0) -> float:
+        """
+        Take a token, waiting for one if needed; returns the seconds waited.  With a reserve, wait
+        until more than `reserve` tokens are left, the reserve is kept for the other callers.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1 + reserve:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 + reserve - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                raise TimeoutError("Timed out waiting for the NHL API rate limit")
+            time.sleep(wait)
+            waited += wait
+
+
+class CircuitBreaker:
+    """
+    Closed (calls allowed) until `failure_threshold` consecutive failures, then open (calls
+    rejected) for `reset_timeout` seconds, then half-open: one trial call closes it again on
+    success or reopens it on failure.
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Return True if a call may go ahead now."""
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._trial_running = False
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.HALF_OPEN and not self._trial_running:
+                self._trial_running = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("NHL API circuit closed, calls resume")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def release(self) -> None:
+        """The call allowed did not reach the API, let another call be the trial."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning("NHL API circuit opened after %d failures, failing fast for %.0fs",
+                                   self.failures, self.reset_timeout)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self._trial_running = False
+
+
+class ResilientClient:
+    """
+    Wrap an NHLClient so every endpoint call is rate limited, timed out, retried and guarded
+    by a circuit breaker.  Attribute access mirrors the wrapped client, e.g.
+    ``resilient.teams.team_roster("SJS", 20242025)``.
+    """
+    def __init__(self,
+                 client: Any,
+                 rate: float = DEFAULT_RATE,
+                 burst: int = DEFAULT_BURST,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 retries: int = DEFAULT_RETRIES,
+                 breaker: Optional[CircuitBreaker] = None,
+                 bulk_rate: float = DEFAULT_BULK_RATE,
+                 bulk_burst: int = DEFAULT_BULK_BURST):
+        self._client = client
+        self.limiter = TokenBucket(rate, burst)
+        self.bulk_limiter = TokenBucket(bulk_rate, bulk_burst)
+        self.timeout = timeout
+        self.retries = retries
+        self.breaker = breaker or CircuitBreaker()
+        self.stats = {"calls": 0, "bulk_calls": 0, "attempts": 0, "retries": 0, "failures": 0, "timeouts": 0,
+                      "rejected": 0, "throttled_s": 0.0}
+        self._stats_lock = threading.Lock()
+        # Calls run here so the timeout holds even when the wrapped client ignores its own
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="nhl-api")
+
+    def __getattr__(self, group: str) -> Any:
+        return _ResilientGroup(self, group, getattr(self._client, group))
+
+    def call(self, endpoint: str, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """Call an endpoint method within the deadline, retrying transient failures."""
+        self._count("calls")
+        bulk = in_bulk_calls()
+        if bulk:
+            self._count("bulk_calls")
+        deadline = time.monotonic() + self.timeout * (self.retries + 1)
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                self._count("rejected")
+                raise CircuitOpenError(f"{endpoint}: the NHL API is failing, not calling it for now")
+            try:
+                if bulk:
+                    self._count("throttled_s", self.bulk_limiter.acquire(timeout=deadline - time.monotonic()))
+                self._count("throttled_s", self.limiter.acquire(timeout=deadline - time.monotonic(),
+                                                                reserve=self.limiter.burst / 2 if bulk else 0))
+            except TimeoutError:
+                # Our own rate limit ran out the deadline, the API was not called: not a failure of the API
+                self.breaker.release()
+                self._count("failures")
+                raise
+            try:
+                self._count("attempts")
+                result = self._call_with_timeout(func, args, kwargs, min(self.timeout, deadline - time.monotonic()))
+            except Exception as e:
+                transient = is_transient(e)
+                if transient:
+                    self.breaker.record_failure()
+                else:
+                    # Any other error, e.g. a 404, is still an answer: the API is up
+                    self.breaker.record_success()
+                delay = _backoff(attempt)
+                if not transient or attempt >= self.retries or time.monotonic() + delay >= deadline:
+                    self._count("failures")
+                    raise
+                attempt += 1
+                self._count("retries")
+                logger.warning("%s failed (%s), retry %d of %d in %.2fs", endpoint, e, attempt, self.retries, delay)
+                time.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def info(self) -> dict[str, Any]:
+        with self._stats_lock:
+            return {**self.stats, "circuit": self.breaker.state}
+
+    def _call_with_timeout(self, func: Callable[..., Any], args: tuple, kwargs: dict, timeout: float) -> Any:
+        future = self._executor.submit(func, *args, **kwargs)
+        try:
+            return future.result(timeout=max(timeout, 0.0))
+        except FutureTimeoutError:
+            # The call keeps its worker until it returns, its result is dropped
+            self._count("timeouts")
+            raise TimeoutError(f"NHL API call timed out after {timeout:.1f}s") from None
+
+    def _count(self, name: str, amount: float = 1) -> None:
+        with self._stats_lock:
+            self.stats[name] += amount
+
+
+class _ResilientGroup:
+    """One endpoint group of the client (teams, schedule, ...), with resilient methods."""
+    def __init__(self, owner: ResilientClient, group: str, target: Any):
+        self._owner = owner
+        self._group = group
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        endpoint = f"{self._group}.{name}"
+
+        def resilient_call(*args, **kwargs):
+            return self._owner.call(endpoint, attr, args, kwargs)
+        return resilient_call
+
+
+def _backoff(attempt: int) -> float:
+    """Full jitter: a random delay up to the exponential backoff for the attempt."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+def resilient_client_from_env(client: Any) -> ResilientClient:
+    """Wrap client with the rates, timeout and retries set in the environment (or the defaults)."""
+    return ResilientClient(client,
+                           rate=float(os.environ.get(RATE_ENV) or DEFAULT_RATE),
+                           timeout=float(os.environ.get(TIMEOUT_ENV) or DEFAULT_TIMEOUT),
+                           retries=int(os.environ.get(RETRIES_ENV) or DEFAULT_RETRIES),
+                           bulk_rate=float(os.environ.get(BULK_RATE_ENV) or DEFAULT_BULK_RATE))
@@ -0,0 +1,210 @@
+"""
+A persistent, on-disk cache for raw NHL API responses.
+
+The cache wraps an ``NHLClient`` and transparently stores the JSON returned by the
+endpoints the app relies on, so a restarted or freshly deployed process does not need
+to hit the NHL API for data it has already seen.  Each endpoint has its own TTL policy:
+data for completed seasons never expires, current-season standings and schedules are
+refreshed often, and the season list is refreshed daily.  While the API is unavailable,
+expired responses are served rather than failing the call.
+"""
+import datetime as dt
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from app.helpers.data_cache import DAY, HOUR, MINUTE
+from app.helpers.file_utilities import PROJECT_ROOT
+from app.helpers.resilient_client import is_unavailable
+from app.helpers.season_utilities import ttl_for_season
+from app.helpers.timing import mark_cache_hit
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "NHL_API_CACHE_DIR"
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".cache" / "nhl-api"
+
+# A policy receives the call arguments and returns the TTL in seconds, or None to never expire
+TTLPolicy = Callable[[tuple, dict], Optional[float]]
+
+
+def _season_arg(args: tuple, kwargs: dict, position: int, name: str = "season") -> Any:
+    """Return a season argument whether it was passed by position or keyword."""
+    if name in kwargs:
+        return kwargs[name]
+    return args[position] if len(args) > position else None
+
+
+def season_ttl(current_ttl: float, position: int, name: str = "season") -> TTLPolicy:
+    """Build a policy: never expire for completed seasons, `current_ttl` seconds otherwise."""
+    def policy(args: tuple, kwargs: dict) -> Optional[float]:
+        season = _season_arg(args, kwargs, position, name)
+        return ttl_for_season(season, current_ttl) if season else current_ttl
+    return policy
+
+
+def fixed_ttl(ttl: float) -> TTLPolicy:
+    """Build a policy that always expires after `ttl` seconds."""
+    return lambda args, kwargs: ttl
+
+
+def teams_ttl(args: tuple, kwargs: dict) -> Optional[float]:
+    """Teams as of a date more than a year ago never change, the current teams are refreshed daily."""
+    date = _season_arg(args, kwargs, 0, "date")
+    if date and date != "now":
+        try:
+            if dt.date.fromisoformat(date) < dt.date.today() - dt.timedelta(days=365):
+                return None
+        except ValueError:
+            pass
+    return DAY
+
+
+def weekly_schedule_ttl(args: tuple, kwargs: dict) -> Optional[float]:
+    """Weeks that ended more than a couple of days ago are final, recent and upcoming weeks refresh often."""
+    date = _season_arg(args, kwargs, 0, "date")
+    try:
+        if date and dt.date.fromisoformat(date) < dt.date.today() - dt.timedelta(days=9):
+            return None
+    except ValueError:
+        pass
+    return 5 * MINUTE
+
+
+def standings_ttl(args: tuple, kwargs: dict) -> Optional[float]:
+    """Standings by season expire with the season, standings as of a date before yesterday never change."""
+    if _season_arg(args, kwargs, 1) is not None:
+        return season_ttl(5 * MINUTE, position=1)(args, kwargs)
+    date = _season_arg(args, kwargs, 0, "date")
+    try:
+        if date and dt.date.fromisoformat(date) < dt.date.today() - dt.timedelta(days=1):
+            return None
+    except ValueError:
+        pass
+    return 5 * MINUTE
+
+
+# Keyed by "<group>.<method>" on NHLClient, only these endpoints are cached
+DEFAULT_POLICIES: dict[str, TTLPolicy] = {
+    "misc.season_specific_rules_and_info": fixed_ttl(DAY),
+    "teams.teams": teams_ttl,
+    "teams.team_roster": season_ttl(6 * HOUR, position=1),
+    "schedule.team_season_schedule": season_ttl(5 * MINUTE, position=1),
+    "schedule.weekly_schedule": weekly_schedule_ttl,
+    "standings.league_standings": standings_ttl,
+    "standings.season_standing_manifest": fixed_ttl(DAY),
+    "stats.player_career_stats": fixed_ttl(DAY),
+}
+
+
+class ResponseCache:
+    """
+    Wrap an NHLClient so calls to cached endpoints are served from disk when fresh.
+
+    Attribute access mirrors the wrapped client, e.g. ``cache.teams.team_roster("SJS", 20242025)``.
+    Endpoints without a policy are passed straight through to the client.
+    """
+    def __init__(self,
+                 client: Any,
+                 cache_dir: Optional[str | pathlib.Path] = None,
+                 policies: Optional[dict[str, TTLPolicy]] = None):
+        self._client = client
+        self.cache_dir = pathlib.Path(cache_dir or os.environ.get(CACHE_DIR_ENV) or DEFAULT_CACHE_DIR)
+        self.policies = DEFAULT_POLICIES if policies is None else policies
+
+    def __getattr__(self, group: str) -> Any:
+        return _CachedGroup(self, group, getattr(self._client, group))
+
+    def call(self, endpoint: str, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """Return the cached response for the endpoint call, fetching and storing it when stale."""
+        path = self._entry_path(endpoint, args, kwargs)
+        entry = self._read(path)
+        if entry is not None and not _expired(entry):
+            mark_cache_hit(True)
+            return entry["payload"]
+
+        mark_cache_hit(False)
+        try:
+            payload = func(*args, **kwargs)
+        except Exception as e:
+            if entry is None or not is_unavailable(e):
+                raise
+            logger.warning("%s unavailable (%r), serving the response stored at %s", endpoint, e,
+                           time.strftime("%Y-%m-%d %H:%M", time.localtime(entry["stored_at"])))
+            return entry["payload"]
+        ttl = self.policies[endpoint](args, kwargs)
+        self._write(path, {
+            "endpoint": endpoint,
+            "args": [repr(a) for a in args],
+            "kwargs": {k: repr(v) for k, v in kwargs.items()},
+            "stored_at": time.time(),
+            "expires_at": None if ttl is None else time.time() + ttl,
+            "payload": payload,
+        })
+        return payload
+
+    def clear(self, endpoint: Optional[str] = None) -> None:
+        """Remove cached responses, for one endpoint or for all of them."""
+        folders = [self.cache_dir / endpoint] if endpoint else self.cache_dir.glob("*")
+        for folder in folders:
+            for path in pathlib.Path(folder).glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def _entry_path(self, endpoint: str, args: tuple, kwargs: dict) -> pathlib.Path:
+        # str() keeps 20242025 and "20242025" on the same entry
+        key = json.dumps([[str(a) for a in args], {k: str(v) for k, v in sorted(kwargs.items())}])
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / endpoint / f"{digest}.json"
+
+    @staticmethod
+    def _read(path: pathlib.Path) -> Optional[dict]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # A corrupt or unreadable entry is just a miss, it will be overwritten
+            logger.warning("Ignoring unreadable response cache entry %s", path, exc_info=True)
+            return None
+
+    @staticmethod
+    def _write(path: pathlib.Path, entry: dict) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename, so concurrent readers never see a partial file
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_name, path)
+        except (OSError, TypeError, ValueError):
+            # Caching is best effort, the response is still returned to the caller
+            logger.warning("Could not write response cache entry %s", path, exc_info=True)
+
+
+class _CachedGroup:
+    """One endpoint group of the client (teams, schedule, ...), with cached methods."""
+    def __init__(self, cache: ResponseCache, group: str, target: Any):
+        self._cache = cache
+        self._group = group
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        endpoint = f"{self._group}.{name}"
+        if endpoint not in self._cache.policies or not callable(attr):
+            return attr
+
+        def cached_call(*args, **kwargs):
+            return self._cache.call(endpoint, attr, args, kwargs)
+        return cached_call
+
+
+def _expired(entry: dict) -> bool:
+    expires_at = entry.get("expires_at")
+    return expires_at is not None and time.time() >= expires_at
@@ -0,0 +1,38 @@
+"""
+    Utilities and helpers for reasoning about NHL seasons.
+"""
+import datetime as dt
+from typing import Optional
+
+# A season is treated as complete (its data will never change again) from October 1st of its end
+# year.  The Final usually ends in June, but not always: 2019-20 ended on September 28, 2020 and
+# 2020-21 on July 7, 2021.  October is after every Final so far and before the next season starts.
+SEASON_COMPLETE_MONTH = 10
+
+
+def season_end_year(season_id: int | str) -> Optional[int]:
+    """
+    Return the calendar year a season ends in, e.g. 2025 for 20242025,
+    or None when the id is not in the YYYYYYYY format.
+    """
+    s = str(season_id)
+    if len(s) != 8 or not s.isdigit():
+        return None
+    return int(s[4:])
+
+
+def is_completed_season(season_id: int | str, today: Optional[dt.date] = None) -> bool:
+    """
+    Return True when the season is over, so its rosters, schedules and standings are final.
+    Unrecognised ids are never considered complete.
+    """
+    end_year = season_end_year(season_id)
+    if end_year is None:
+        return False
+    today = today or dt.date.today()
+    return today >= dt.date(end_year, SEASON_COMPLETE_MONTH, 1)
+
+
+def ttl_for_season(season_id: int | str, current_ttl: Optional[float]) -> Optional[float]:
+    """Return the cache TTL for data about a season: None (never expire) once it is complete."""
+    return None if is_completed_season(season_id) else current_ttl
@@ -0,0 +1,185 @@
+"""
+Latency instrumentation: timing spans collected per Streamlit rerun.
+
+Wrap work in :func:`span` (or decorate it with :func:`timed`) to measure it.  Spans nest,
+so a DAL span that triggers an API call shows both the call and the DAL function's own
+(self) time.  Every finished span is logged as a structured ``key=value`` line, and when
+a rerun is being collected (see :func:`start_rerun`) the spans are kept so the rerun can
+be summarized by kind (api, dal, render) or shown in the performance panel.
+
+Collection follows contextvars, so work submitted to a thread pool with
+:func:`submit_with_context` is attributed to the rerun that submitted it.
+"""
+import contextlib
+import contextvars
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+API = "api"
+DAL = "dal"
+RENDER = "render"
+
+
+@dataclass
+class Span:
+    """One timed operation."""
+    name: str
+    kind: str
+    start: float
+    duration_ms: float = 0.0
+    cache_hit: Optional[bool] = None
+    fields: dict[str, Any] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+
+    @property
+    def self_ms(self) -> float:
+        """Time spent in this span itself, excluding nested spans."""
+        return max(self.duration_ms - sum(c.duration_ms for c in self.children), 0.0)
+
+
+class RerunTimings:
+    """The spans recorded during one rerun of the app."""
+    def __init__(self, label: str = "rerun"):
+        self.label = label
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def finish(self) -> "RerunTimings":
+        self.end = time.perf_counter()
+        summary = self.summary()
+        logger.info("rerun label=%s total_ms=%.1f %s spans=%d cache_hits=%d cache_misses=%d coalesced=%d stale=%d",
+                    self.label, self.total_ms,
+                    " ".join(f"{kind}_ms={ms:.1f}" for kind, ms in summary["self_ms_by_kind"].items()),
+                    len(self.spans), summary["cache_hits"], summary["cache_misses"], summary["coalesced"],
+                    summary["stale"])
+        for listener in list(_rerun_listeners):
+            listener(self)
+        return self
+
+    @property
+    def total_ms(self) -> float:
+        return ((self.end or time.perf_counter()) - self.start) * 1e3
+
+    def summary(self) -> dict[str, Any]:
+        """Aggregate self time by kind, cache hits/misses, coalesced calls and stale values across the rerun."""
+        with self._lock:
+            spans = list(self.spans)
+        by_kind: dict[str, float] = {}
+        for s in spans:
+            by_kind[s.kind] = by_kind.get(s.kind, 0.0) + s.self_ms
+        return {
+            "total_ms": self.total_ms,
+            "self_ms_by_kind": by_kind,
+            "cache_hits": sum(1 for s in spans if s.cache_hit is True),
+            "cache_misses": sum(1 for s in spans if s.cache_hit is False),
+            # Calls that waited for another thread computing the same value, see data_cache.SingleFlight
+            "coalesced": sum(1 for s in spans if s.fields.get("coalesced")),
+            # Expired values served while refreshed or after a failure, see data_cache.cached
+            "stale": sum(1 for s in spans if s.fields.get("stale")),
+        }
+
+    def rows(self) -> list[dict[str, Any]]:
+        """One flat row per span in start order, suitable for a DataFrame."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        return [{
+            "kind": s.kind,
+            "name": s.name,
+            "start_ms": round((s.start - self.start) * 1e3, 1),
+            "ms": round(s.duration_ms, 2),
+            "self_ms": round(s.self_ms, 2),
+            "cache_hit": s.cache_hit,
+            "coalesced": bool(s.fields.get("coalesced")),
+            "stale": bool(s.fields.get("stale")),
+            "thread": s.fields.get("thread", ""),
+        } for s in spans]
+
+
+# Called with every finished rerun, see add_rerun_listener
+_rerun_listeners: list[Callable[[RerunTimings], None]] = []
+
+_current_rerun: contextvars.ContextVar[Optional[RerunTimings]] = contextvars.ContextVar("current_rerun",
+                                                                                         default=None)
+_active_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("active_span", default=None)
+
+
+def start_rerun(label: str = "rerun") -> RerunTimings:
+    """Begin collecting spans for a rerun in the current context."""
+    timings = RerunTimings(label)
+    _current_rerun.set(timings)
+    _active_span.set(None)
+    return timings
+
+
+def current_rerun() -> Optional[RerunTimings]:
+    return _current_rerun.get()
+
+
+def add_rerun_listener(listener: Callable[[RerunTimings], None]) -> None:
+    """Call listener with each rerun as it finishes, e.g. to collect timings in a benchmark."""
+    _rerun_listeners.append(listener)
+
+
+def remove_rerun_listener(listener: Callable[[RerunTimings], None]) -> None:
+    _rerun_listeners.remove(listener)
+
+
+@contextlib.contextmanager
+def span(name: str, kind: str, **fields: Any) -> Iterator[Span]:
+    """Time the enclosed block as a span of the given kind, nested under any active span."""
+    parent = _active_span.get()
+    s = Span(name=name, kind=kind, start=time.perf_counter(), fields=fields)
+    s.fields.setdefault("thread", threading.current_thread().name)
+    token = _active_span.set(s)
+    try:
+        yield s
+    finally:
+        s.duration_ms = (time.perf_counter() - s.start) * 1e3
+        _active_span.reset(token)
+        if parent is not None:
+            parent.children.append(s)
+        rerun = _current_rerun.get()
+        if rerun is not None:
+            rerun.add(s)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("span kind=%s name=%s ms=%.2f self_ms=%.2f cache_hit=%s%s", kind, name,
+                         s.duration_ms, s.self_ms, s.cache_hit,
+                         "".join(f" {k}={v}" for k, v in fields.items()))
+
+
+def mark_cache_hit(hit: bool) -> None:
+    """Flag whether the innermost active span was served from a cache."""
+    s = _active_span.get()
+    if s is not None:
+        s.cache_hit = hit
+
+
+def timed(kind: str, name: Optional[str] = None) -> Callable:
+    """Decorate a function so each call is recorded as a span (named after the function by default)."""
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(span_name, kind):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def submit_with_context(executor: Executor, func: Callable, *args, **kwargs) -> Future:
+    """Submit work to an executor so its spans are attributed to the submitting rerun and span."""
+    return executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
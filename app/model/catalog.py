@@ -0,0 +1,136 @@
+"""
+Catalogs of the seasons and of a season's teams, indexed for constant time lookups.
+
+The DAL returns a catalog rather than a list: it is built once per fetch, is a sequence
+(``seasons[0]`` is the current season, iteration is in display order), and indexes its
+members by every key the pages look them up by.  Members are interned, so the same season
+or team fetched again (a refresh, another season's teams, a value read back from a shared
+cache) is the same object, which dict and list lookups match by identity without comparing
+its fields.
+"""
+import bisect
+import threading
+from collections.abc import Sequence
+from typing import Iterable, Optional, TypeVar, overload
+
+from app.model.season import Season
+from app.model.team import Team
+
+T = TypeVar("T", Season, Team)
+
+_interned: dict[Season | Team, Season | Team] = {}
+_intern_lock = threading.Lock()
+
+
+def intern_model(value: T) -> T:
+    """The canonical instance equal to value; the domain is small (a few thousand seasons and teams)."""
+    with _intern_lock:
+        return _interned.setdefault(value, value)
+
+
+class SeasonCatalog(Sequence[Season]):
+    """The seasons, most recent (the current season) first."""
+    def __init__(self, seasons: Iterable[Season]) -> None:
+        self.seasons: tuple[Season, ...] = tuple(sorted((intern_model(s) for s in seasons),
+                                                        key=lambda s: s.formatted_id, reverse=True))
+        self.by_id: dict[int, Season] = {s.id: s for s in self.seasons}
+        self.by_formatted_id: dict[str, Season] = {s.formatted_id: s for s in self.seasons}
+        self.by_start_date: dict[str, Season] = {s.start_date: s for s in self.seasons}
+        self.labels: tuple[str, ...] = tuple(s.formatted_id for s in self.seasons)
+        self._positions: dict[int, int] = {s.id: i for i, s in enumerate(self.seasons)}
+        self._ascending_starts: list[str] = sorted(self.by_start_date)
+
+    @property
+    def current(self) -> Optional[Season]:
+        return self.seasons[0] if self.seasons else None
+
+    def season(self, season_id: int | str) -> Optional[Season]:
+        """Return the season with an id (e.g. 20242025 or "20242025"), or None."""
+        return self.by_id.get(int(season_id))
+
+    def position(self, season_id: int | str, default: int = 0) -> int:
+        """The position of a season in the catalog, e.g. to preselect it in a list."""
+        return self._positions.get(int(season_id), default)
+
+    def season_for_date(self, date: str) -> Optional[Season]:
+        """Return the season played on an ISO date (YYYY-MM-DD), or None."""
+        ix = bisect.bisect_right(self._ascending_starts, date[:10]) - 1
+        if ix < 0:
+            return None
+        season = self.by_start_date[self._ascending_starts[ix]]
+        return season if date[:10] <= season.end_date else None
+
+    @overload
+    def __getitem__(self, index: int) -> Season: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Season, ...]: ...
+
+    def __getitem__(self, index):
+        return self.seasons[index]
+
+    def __len__(self) -> int:
+        return len(self.seasons)
+
+    def __reduce__(self):
+        # Only the seasons are pickled (e.g. into a shared cache), indexed and interned again on load
+        return SeasonCatalog, (self.seasons,)
+
+    def __str__(self) -> str:
+        return f"{len(self)} seasons, current {self.current.formatted_id if self.current else '-'}"
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class TeamCatalog(Sequence[Team]):
+    """The teams of a season, by name."""
+    def __init__(self, teams: Iterable[Team]) -> None:
+        self.teams: tuple[Team, ...] = tuple(sorted((intern_model(t) for t in teams), key=lambda t: t.name))
+        self.by_abbr: dict[str, Team] = {t.abbr: t for t in self.teams}
+        self.by_name: dict[str, Team] = {t.name: t for t in self.teams}
+        self.by_division: dict[str, list[Team]] = {}
+        self.by_conference: dict[str, list[Team]] = {}
+        for team in self.teams:
+            self.by_division.setdefault(team.division, []).append(team)
+            self.by_conference.setdefault(team.conference, []).append(team)
+        self.labels: tuple[str, ...] = tuple(t.name for t in self.teams)
+        self._positions: dict[str, int] = {t.abbr: i for i, t in enumerate(self.teams)}
+
+    def team(self, abbr: str) -> Optional[Team]:
+        """Return the team with an abbreviation, or None if it did not play that season."""
+        return self.by_abbr.get(abbr)
+
+    def position(self, abbr: str, default: Optional[int] = None) -> Optional[int]:
+        """The position of a team in the catalog, e.g. to preselect it in a list."""
+        return self._positions.get(abbr, default)
+
+    def division(self, division: str) -> list[Team]:
+        """Return the teams of a division, by name."""
+        return self.by_division.get(division, [])
+
+    def conference(self, conference: str) -> list[Team]:
+        """Return the teams of a conference, by name."""
+        return self.by_conference.get(conference, [])
+
+    @overload
+    def __getitem__(self, index: int) -> Team: ...
+    @overload
+    def __getitem__(self, index: slice) -> tuple[Team, ...]: ...
+
+    def __getitem__(self, index):
+        return self.teams[index]
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def __contains__(self, team: object) -> bool:
+        return isinstance(team, Team) and self.by_abbr.get(team.abbr) == team
+
+    def __reduce__(self):
+        return TeamCatalog, (self.teams,)
+
+    def __str__(self) -> str:
+        return f"{len(self)} teams"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,66 @@
+from typing import Any, Optional
+
+from app.helpers.json_utilities import json_pointer_get
+
+LIVE_STATES = ('LIVE', 'CRIT')
+FINAL_STATES = ('FINAL', 'OFF')
+
+
+class LiveGame:
+    """Represent the current state of a game, from the daily scores"""
+    def __init__(self, game_json: dict[str, Any]) -> None:
+        self.game_id = game_json['id']
+        self.state = game_json.get('gameState', 'FUT')
+        self.start_time_utc = game_json.get('startTimeUTC', '')
+        self.away_abbrev = json_pointer_get(game_json, '/awayTeam/abbrev', '')
+        self.home_abbrev = json_pointer_get(game_json, '/homeTeam/abbrev', '')
+        self.away_logo = json_pointer_get(game_json, '/awayTeam/logo', '')
+        self.home_logo = json_pointer_get(game_json, '/homeTeam/logo', '')
+        self.away_score: Optional[int] = json_pointer_get(game_json, '/awayTeam/score')
+        self.home_score: Optional[int] = json_pointer_get(game_json, '/homeTeam/score')
+        self.away_sog: Optional[int] = json_pointer_get(game_json, '/awayTeam/sog')
+        self.home_sog: Optional[int] = json_pointer_get(game_json, '/homeTeam/sog')
+        self.period: int = game_json.get('period') or json_pointer_get(game_json, '/periodDescriptor/number', 0)
+        self.period_type = json_pointer_get(game_json, '/periodDescriptor/periodType', 'REG')
+        self.time_remaining = json_pointer_get(game_json, '/clock/timeRemaining', '')
+        self.in_intermission = bool(json_pointer_get(game_json, '/clock/inIntermission', False))
+
+    @property
+    def is_live(self) -> bool:
+        return self.state in LIVE_STATES
+
+    @property
+    def is_final(self) -> bool:
+        return self.state in FINAL_STATES
+
+    @property
+    def period_label(self) -> str:
+        """Readable game status, e.g. "2nd 08:21", "1st intermission", "Final/OT", "Pre-game"."""
+        if self.is_final:
+            return "Final" if self.period_type == 'REG' else f"Final/{self.period_type}"
+        if self.state == 'PRE':
+            return "Pre-game"
+        if not self.is_live:
+            return "Upcoming"
+        if self.period_type in ('OT', 'SO'):
+            period = self.period_type
+        else:
+            period = {1: "1st", 2: "2nd", 3: "3rd"}.get(self.period, f"{self.period}th")
+        if self.in_intermission:
+            return f"{period} intermission"
+        return f"{period} {self.time_remaining}".strip()
+
+    def signature(self) -> tuple:
+        """The values shown on the scoreboard, two polls with the same signature render the same."""
+        return (self.state, self.away_score, self.home_score, self.away_sog, self.home_sog,
+                self.period, self.period_type, self.time_remaining, self.in_intermission)
+
+    def involves(self, team_abbrev: str) -> bool:
+        return team_abbrev in (self.away_abbrev, self.home_abbrev)
+
+    def __str__(self) -> str:
+        return (f"{self.away_abbrev} {self.away_score if self.away_score is not None else '-'} @ "
+                f"{self.home_abbrev} {self.home_score if self.home_score is not None else '-'} ({self.period_label})")
+
+    def __repr__(self) -> str:
+        return self.__str__()
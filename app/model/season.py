@@ -1,13 +1,24 @@
+from dataclasses import dataclass
+from typing import Any
 
 
+@dataclass(frozen=True, slots=True, repr=False)
 class Season:
-    """Represent a season in the NHL"""
-    def __init__(self, season_rule: dict) -> None:
-        self.id = season_rule['id']
-        self.formatted_id = season_rule['formattedSeasonId']
-        self.start_date = season_rule['startDate'][:10]
-        self.end_date = season_rule['endDate'][:10]
-        self.num_of_games = season_rule['numberOfGames']
+    """Represent a season in the NHL, immutable and compared (and hashed) by value"""
+    id: int
+    formatted_id: str
+    start_date: str
+    end_date: str
+    num_of_games: int
+
+    @classmethod
+    def from_rule(cls, season_rule: dict[str, Any]) -> "Season":
+        """Build a Season from the API's season rules record."""
+        return cls(id=season_rule['id'],
+                   formatted_id=season_rule['formattedSeasonId'],
+                   start_date=season_rule['startDate'][:10],
+                   end_date=season_rule['endDate'][:10],
+                   num_of_games=season_rule['numberOfGames'])
 
     def __str__(self) -> str:
         return f"{self.formatted_id} ({self.start_date}) - {self.num_of_games} games"
@@ -0,0 +1,80 @@
+from typing import Any, Optional
+
+import pandas as pd
+
+from app.model.team_summary import STANDINGS_SCHEMA, TeamSummary
+
+
+class SeasonStandings:
+    """
+    The league standings for one season, indexed for constant time lookups.
+
+    Every team's TeamSummary is built once, when the standings are fetched, and indexed by
+    team abbreviation, division, conference and league rank.  The same data is also
+    available as a league-wide DataFrame (one row per team, ordered by league rank).
+    """
+    def __init__(self, season_id: int | str, standings_json: list[dict[str, Any]]) -> None:
+        # Extract every field of every team in a single pass, shared by the models and the frame
+        self._load(season_id, STANDINGS_SCHEMA.records(standings_json))
+
+    @classmethod
+    def from_records(cls, season_id: int | str, records: list[dict[str, Any]]) -> "SeasonStandings":
+        """Build the standings from already extracted records, e.g. the rows of an archived frame."""
+        standings = cls.__new__(cls)
+        standings._load(season_id, records)
+        return standings
+
+    def _load(self, season_id: int | str, records: list[dict[str, Any]]) -> None:
+        self.season_id = season_id
+        records = sorted(records, key=lambda r: r["league_seq"])
+        self.teams: list[TeamSummary] = [TeamSummary.from_record(r) for r in records]
+        self.by_abbrev: dict[str, TeamSummary] = {t.team_abbrev: t for t in self.teams}
+        self.by_league_rank: dict[int, TeamSummary] = {t.league_seq: t for t in self.teams}
+        self.by_division: dict[str, list[TeamSummary]] = {}
+        self.by_conference: dict[str, list[TeamSummary]] = {}
+        for team in self.teams:
+            if team.division:
+                self.by_division.setdefault(team.division, []).append(team)
+            if team.conference:
+                self.by_conference.setdefault(team.conference, []).append(team)
+        for teams in self.by_division.values():
+            teams.sort(key=lambda t: t.division_seq)
+        for teams in self.by_conference.values():
+            teams.sort(key=lambda t: t.conference_seq)
+        self.frame = self._build_frame(records)
+
+    @staticmethod
+    def _build_frame(records: list[dict[str, Any]]) -> pd.DataFrame:
+        """One row per team with the TeamSummary attributes as columns, indexed by team abbreviation."""
+        if not records:
+            return pd.DataFrame(columns=list(STANDINGS_SCHEMA.fields))
+        return pd.DataFrame.from_records(records).set_index("team_abbrev", drop=False)
+
+    def team(self, team_abbrev: str) -> Optional[TeamSummary]:
+        """Return the standing for a team, or None if it did not play that season."""
+        return self.by_abbrev.get(team_abbrev)
+
+    def division(self, division: str) -> list[TeamSummary]:
+        """Return the teams of a division in standing order."""
+        return self.by_division.get(division, [])
+
+    def conference(self, conference: str) -> list[TeamSummary]:
+        """Return the teams of a conference in standing order."""
+        return self.by_conference.get(conference, [])
+
+    def league_rank(self, rank: int) -> Optional[TeamSummary]:
+        """Return the team at a league standing position (1 is first)."""
+        return self.by_league_rank.get(rank)
+
+    def compare(self, team_abbrevs: list[str]) -> pd.DataFrame:
+        """Return the standings rows for several teams, in the order requested."""
+        return self.frame.loc[[a for a in team_abbrevs if a in self.by_abbrev]]
+
+    def __len__(self) -> int:
+        return len(self.teams)
+
+    def __str__(self) -> str:
+        return f"{self.season_id} standings - {len(self)} teams"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -1,16 +1,23 @@
+from dataclasses import dataclass
+from typing import Any
 
 
+@dataclass(frozen=True, slots=True, repr=False)
 class Team:
-    """Represent a team in the NHL"""
-    def __init__(self, team_json: dict) -> None:
-        self.abbr = team_json['abbr']
-        self.name = team_json['name']
-        self.common_name = team_json['common_name']
-        self.logo_url = team_json['logo_url']
-        self.conference = team_json['conference']
-        self.division = team_json['division']
-        self.division_abbr = team_json['division_abbr']
-        self.conference_abbr = team_json['conference_abbr']
+    """Represent a team in the NHL, immutable and compared (and hashed) by value"""
+    abbr: str
+    name: str
+    common_name: str
+    logo_url: str
+    conference: str
+    division: str
+    division_abbr: str
+    conference_abbr: str
+
+    @classmethod
+    def from_record(cls, team_record: dict[str, Any]) -> "Team":
+        """Build a Team from a record with the attribute names as keys, e.g. an archived row."""
+        return cls(**{name: team_record[name] for name in cls.__slots__})
 
     def __str__(self) -> str:
         return f"{self.name} ({self.abbr})"
@@ -1,24 +1,59 @@
+from typing import Any
+
 import numpy as np
 
-from app.helpers.json_utilities import json_pointer_get
+from app.helpers.json_utilities import JsonField, JsonSchema
+
+# Where each TeamSummary attribute lives in a league standings entry
+STANDINGS_SCHEMA = JsonSchema({
+    "team_abbrev": JsonField("/teamAbbrev/default", raise_error=True),
+    "conference": JsonField("/conferenceName", ''),
+    "division": JsonField("/divisionName", ''),
+    "team_name": JsonField("/teamCommonName/default", raise_error=True),
+    "standing_date": JsonField("/date", raise_error=True),
+    "conference_seq": JsonField("/conferenceSequence", np.nan),
+    "division_seq": JsonField("/divisionSequence", np.nan),
+    "league_seq": JsonField("/leagueSequence", raise_error=True),
+    "games_played": JsonField("/gamesPlayed", raise_error=True),
+    "wins": JsonField("/wins", raise_error=True),
+    "losses": JsonField("/losses", raise_error=True),
+    "ties": JsonField("/ties", raise_error=True),
+    "points": JsonField("/points", raise_error=True),
+    "ot_losses": JsonField("/otLosses", raise_error=True),
+    "goal_for": JsonField("/goalFor", np.nan),
+    "goal_against": JsonField("/goalAgainst", np.nan),
+})
 
 
 class TeamSummary:
+    team_abbrev: str
+    conference: str
+    division: str
+    team_name: str
+    standing_date: str
+    conference_seq: int
+    division_seq: int
+    league_seq: int
+    games_played: int
+    wins: int
+    losses: int
+    ties: int
+    points: int
+    ot_losses: int
+    goal_for: int
+    goal_against: int
+
     def __init__(self, standings_json: dict):
-        self.team_abbrev = json_pointer_get(standings_json, "/teamAbbrev/default", raise_error=True)
-        self.conference = json_pointer_get(standings_json, "/conferenceName", '')
-        self.division = json_pointer_get(standings_json, "/divisionName", '')
-        self.team_name = json_pointer_get(standings_json, "/teamCommonName/default", raise_error=True)
-        self.standing_date = json_pointer_get(standings_json, "/date", raise_error=True)
-        self.conference_seq = json_pointer_get(standings_json, "/conferenceSequence", np.nan)
-        self.division_seq = json_pointer_get(standings_json, "/divisionSequence", np.nan)
-        self.league_seq = json_pointer_get(standings_json, "/leagueSequence", raise_error=True)
-        self.league_seq = json_pointer_get(standings_json, "/leagueSequence", raise_error=True)
-        self.games_played = json_pointer_get(standings_json, "/gamesPlayed", raise_error=True)
-        self.wins = json_pointer_get(standings_json, "/wins", raise_error=True)
-        self.losses = json_pointer_get(standings_json, "/losses", raise_error=True)
-        self.ties = json_pointer_get(standings_json, "/ties", raise_error=True)
-        self.points = json_pointer_get(standings_json, "/points", raise_error=True)
-        self.ot_losses = json_pointer_get(standings_json, "/otLosses", raise_error=True)
-        self.goal_for = json_pointer_get(standings_json, "/goalFor", np.nan)
-        self.goal_against = json_pointer_get(standings_json, "/goalAgainst", np.nan)
+        self.__dict__.update(STANDINGS_SCHEMA.record(standings_json))
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> "TeamSummary":
+        """Build a TeamSummary from a record already extracted with STANDINGS_SCHEMA."""
+        summary = cls.__new__(cls)
+        summary.__dict__.update(record)
+        return summary
+
+    @classmethod
+    def from_standings(cls, standings_json: list[dict]) -> list["TeamSummary"]:
+        """Build the TeamSummary of every team in a standings list in one pass."""
+        return [cls.from_record(record) for record in STANDINGS_SCHEMA.records(standings_json)]
@@ -1,21 +1,52 @@
 """
 This module provides components for the bottom tabs in the NHL Display Board app.
 """
+import logging
+
 import streamlit as st
 
-from app.data.schedule_dal import get_regular_schedule, trim_schedule_df_for_display
-from app.data.standings_dal import get_team_standing
-from app.model.season import Season
-from app.model.team import Team
+from app.data.page_loader import BoardData
+from app.data.schedule_dal import SCHEDULE_DISPLAY_COLUMNS
+from app.helpers.dataframe_utilities import arrow_table
+from app.helpers.timing import RENDER, timed
+from app.web.components.fragment import fragment
 from app.web.components.stat_table import StatTable
 
+logger = logging.getLogger(__name__)
+
+HISTORY_DISPLAY_COLUMNS = ["season", "games_played", "wins", "losses", "ties", "ot_losses", "points", "point_pct",
+                           "goal_for", "goal_against", "league_seq", "league_teams", "division", "division_seq"]
+SKATER_LEADERBOARD_COLUMNS = ["seasons", "gamesPlayed", "goals", "assists", "points", "pim", "points_per_game",
+                              "goals_per_game"]
+GOALIE_LEADERBOARD_COLUMNS = ["seasons", "gamesPlayed", "wins", "shutouts", "goalsAgainst", "shotsAgainst",
+                              "save_pct"]
+# By column name without its "nhl_" or "all_" prefix
+LEADERBOARD_COLUMN_CONFIG = {
+    "seasons": "Seasons",
+    "gamesPlayed": "GP",
+    "goals": "G",
+    "assists": "A",
+    "points": "P",
+    "pim": "PIM",
+    "points_per_game": st.column_config.NumberColumn("P/GP", format="%.2f"),
+    "goals_per_game": st.column_config.NumberColumn("G/GP", format="%.2f"),
+    "wins": "W",
+    "shutouts": "SO",
+    "goalsAgainst": "GA",
+    "shotsAgainst": "SA",
+    "save_pct": st.column_config.NumberColumn("SV%", format="%.3f"),
+}
+
 
-def render_regular_schedule(season: Season, team: Team):
+@timed(RENDER)
+def render_regular_schedule(board: BoardData):
     """Render the regular schedule for a team in a season."""
     st.subheader("Regular Schedule")
-    regular_schedule_df = get_regular_schedule(team.abbr, season.id)
+    if board.failed("schedule"):
+        st.warning("The schedule is not available right now.")
+        return
     st.dataframe(
-        trim_schedule_df_for_display(regular_schedule_df),
+        arrow_table(board.schedule, SCHEDULE_DISPLAY_COLUMNS),
         hide_index=True,
         column_config={
             "gameDate": st.column_config.DateColumn("Date", format="YYYY-MM-DD"),
@@ -27,9 +58,10 @@ def render_regular_schedule(season: Season, team: Team):
     )
 
 
-def render_standing_information(season: Season, team: Team):
+@timed(RENDER)
+def render_standing_information(board: BoardData):
     """Render the standing information for a team in a season, if available."""
-    standing = get_team_standing(team.abbr, season.id)
+    season, standing = board.season, board.standing
     if standing:
         st.subheader(f"{standing.team_name} {season.formatted_id} Season Summary")
         st.caption(f"as of {standing.standing_date}")
@@ -71,21 +103,122 @@ def render_standing_information(season: Season, team: Team):
         st.write(f"Standings for season {season.formatted_id} are not available.")
 
 
-def render_bottom_tabs(season: Season, team: Team):
-    """Build the tabbed display on the bottom of the page"""
+@timed(RENDER)
+def render_franchise_history(board: BoardData):
+    """Render the team's points, record and league rank in every season it played."""
+    # Imported here, the history is only loaded once its tab is opened
+    from app.data.franchise_dal import get_franchise_history
+
+    team = board.team
+    st.subheader(f"{team.name} Franchise History")
+    try:
+        history = get_franchise_history(team.abbr)
+    except Exception:
+        logger.exception("Failed to load the franchise history for %s", team.abbr)
+        st.warning("The franchise history is not available right now.")
+        return
+    if not len(history):
+        st.write(f"No standings are available for {team.name}.")
+        return
+    frame = history.frame
+    summary = f"{len(history)} seasons"
+    # Seasons without a league rank (every rank missing) have no best finish
+    ranked = frame["league_seq"].dropna()
+    if not ranked.empty:
+        best = frame.loc[ranked.idxmin()]
+        summary += f", best league finish {best['league_seq']} of {best['league_teams']} in {best['season']}"
+    if history.failed:
+        summary += f" ({len(history.failed)} seasons could not be loaded)"
+    st.caption(summary)
+    st.dataframe(
+        arrow_table(frame, HISTORY_DISPLAY_COLUMNS),
+        hide_index=True,
+        column_config={
+            "season": "Season",
+            "games_played": "GP",
+            "wins": "W",
+            "losses": "L",
+            "ties": "T",
+            "ot_losses": "OTL",
+            "points": "Points",
+            "point_pct": st.column_config.NumberColumn("Point %", format="%.3f"),
+            "goal_for": "GF",
+            "goal_against": "GA",
+            "league_seq": "League rank",
+            "league_teams": "Teams",
+            "division": "Division",
+            "division_seq": "Division rank",
+        }
+    )
+
+
+@timed(RENDER)
+def render_career_leaderboard(board: BoardData):
+    """Render the career totals of the roster's skaters and goalies, in the NHL or in all leagues."""
+    # Imported here, the leaderboard is only loaded once its tab is opened
+    from app.data.career_leaderboard import get_career_leaderboard
+
+    season, team = board.season, board.team
+    st.subheader(f"{season.formatted_id} {team.name} Career Leaderboard")
+    try:
+        leaderboard = get_career_leaderboard(season, team)
+    except Exception:
+        logger.exception("Failed to load the career leaderboard for %s %s", team.abbr, season.id)
+        st.warning("The career leaderboard is not available right now.")
+        return
+    if leaderboard.failed:
+        st.caption(f"The careers of {len(leaderboard.failed)} players could not be loaded.")
+
+    split = st.radio("Career", ["NHL", "All leagues"], horizontal=True, key="leaderboard_split",
+                     label_visibility="collapsed")
+    prefix = "nhl_" if split == "NHL" else "all_"
+    for label, frame, columns in (("Skaters", leaderboard.skaters, SKATER_LEADERBOARD_COLUMNS),
+                                  ("Goalies", leaderboard.goalies, GOALIE_LEADERBOARD_COLUMNS)):
+        if frame.empty:
+            continue
+        st.markdown(f"**{label}**")
+        st.dataframe(
+            arrow_table(frame, ["sweaterNumber", "lastName", "firstName", "positionCode",
+                                *(prefix + c for c in columns)]),
+            hide_index=True,
+            column_config={
+                "sweaterNumber": st.column_config.NumberColumn("No.", width=10),
+                "lastName": "Last name",
+                "firstName": "First name",
+                "positionCode": st.column_config.TextColumn("Pos", width=10),
+                **{prefix + c: config for c, config in LEADERBOARD_COLUMN_CONFIG.items()},
+            }
+        )
+
+
+@fragment
+@timed(RENDER)
+def render_bottom_tabs(board: BoardData):
+    """Build the tabbed display on the bottom of the page, a fragment so widgets in the tabs rerun only the tabs"""
     st.divider()
-    tab_season_summery, tab_future = st.tabs(["Season Summary", "Future Features"])
+    # Switching tabs reruns the fragment, so the history and leaderboard are only loaded while their tab is open
+    tab_season_summery, tab_history, tab_leaderboard = st.tabs(
+        ["Season Summary", "Franchise History", "Career Leaderboard"], key="bottom_tabs", on_change="rerun")
 
     with (tab_season_summery):
-        if season and team:
-            render_standing_information(season, team)
-            render_regular_schedule(season, team)
+        if board.season and board.team:
+            render_standing_information(board)
+            render_regular_schedule(board)
         else:
             st.write(
                 "Please select a season and team to view the season summary."
             )
 
-    with tab_future:
-        st.write(
-            "This tab is a placeholder for additional features we will build out later."
-        )
+    with tab_history:
+        if not board.team:
+            st.write("Please select a team to view its franchise history.")
+        elif tab_history.open:
+            render_franchise_history(board)
+
+    with tab_leaderboard:
+        if not board.team:
+            st.write("Please select a season and team to compare the careers of its players.")
+        elif board.failed("roster"):
+            st.warning("The roster is not available right now.")
+        elif tab_leaderboard.open:
+            render_career_leaderboard(board)
@@ -3,18 +3,42 @@ Render the contents of the main app container
 """
 import streamlit as st
 
-from app.data.roster_dal import get_team_roster
-from app.model.season import Season
-from app.model.team import Team
+from app.data.page_loader import BoardData
+from app.data.prefetch import prefetch_career_stats
+from app.helpers.dataframe_utilities import arrow_table
+from app.helpers.timing import RENDER, timed
+from app.web.components.fragment import fragment
 
+ROSTER_DISPLAY_COLUMNS = ['sweaterNumber', 'lastName', 'firstName', 'positionCode', 'shootsCatches',
+                          'weightInPounds', 'heightInInches', 'birthDate', 'birthCountry']
 
-def render_roster(season: Season, team: Team):
-    """Render the roster for a team in a particular season"""
+
+def warm_career_stats(board: BoardData):
+    """Prefetch career stats for the roster in the background, replacing the job of a previous roster"""
+    key = (board.season.id, board.team.abbr)
+    job = st.session_state.get("career_prefetch")
+    if job is not None and job.key == key:
+        return
+    if job is not None:
+        job.cancel()
+    st.session_state.career_prefetch = prefetch_career_stats(board.roster.index, key)
+
+
+@fragment
+@timed(RENDER)
+def render_roster(board: BoardData):
+    """
+    Render the roster for a team in a particular season.
+
+    A fragment, so selecting a player reruns only the roster (with the same board data)
+    on the way to the player profile.
+    """
+    season, team = board.season, board.team
     if not team:
         st.info("Please select a team to view the roster.")
         return
 
-    df = get_team_roster(season, team)
+    df = board.roster
 
     left, right = st.columns([1, 10], vertical_alignment="center")
     with left:
@@ -24,10 +48,15 @@ def render_roster(season: Season, team: Team):
         st.markdown(f"<h2>{season.formatted_id} {team.name}</h2>",
                     unsafe_allow_html=True)
 
+    if board.failed("roster"):
+        st.warning(f"The {season.formatted_id} roster for the {team.name} is not available right now.")
+        return
+
+    warm_career_stats(board)
+
     st.session_state.selected_player = None  # player select does not persist
     event = st.dataframe(
-        df[['sweaterNumber', 'lastName', 'firstName', 'positionCode', 'shootsCatches',
-            'weightInPounds', 'heightInInches', 'birthDate', 'birthCountry']],
+        arrow_table(df, ROSTER_DISPLAY_COLUMNS),
         hide_index=True,
         column_config={
             "sweaterNumber": st.column_config.NumberColumn("No.", width=10),
@@ -4,11 +4,14 @@ Represents a CSS file utility for including CSS resources within a Streamlit app
 This module provides functionality to resolve the path of a CSS resource file
 and include it seamlessly into a Streamlit application using Streamlit's HTML
 rendering capabilities. It simplifies the process of styling a Streamlit app
-through custom CSS.
+through custom CSS.  The file is read once per change, not on every rerun.
 """
+import os
+
 import streamlit as st
 
 from app.helpers.file_utilities import resolve_resource_path
+from app.web.components.render_memo import memoize_render
 
 
 class CSS:
@@ -20,7 +23,15 @@ class CSS:
 
     def include(self):
         """Include the CSS file in the Streamlit app."""
-        st.html(self.resource_path)  # leverages the fact that Streamlit will wrap CSS in <style> tags
+        # Style-only HTML is sent without taking up space in the page
+        st.html(_stylesheet_html(self.resource_path, os.stat(self.resource_path).st_mtime_ns))
+
+
+@memoize_render("css")
+def _stylesheet_html(path: str, mtime_ns: int) -> str:
+    """The stylesheet wrapped in style tags, keyed on its modification time so an edit is picked up."""
+    with open(path, encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
 
 
 def hide_sidebar() -> None:
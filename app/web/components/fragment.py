@@ -0,0 +1,38 @@
+"""
+Run page components as Streamlit fragments.
+
+An interaction with a widget inside a fragment (e.g. selecting a roster row) reruns only that
+fragment, with the arguments it was given in the last full rerun, instead of the whole page:
+the CSS, masthead, sidebar lookups and the other components are left as they are.
+
+A fragment rerunning on its own is timed as a rerun of its own, labelled after the component,
+so its cost shows in the rerun log next to the full reruns it replaces.
+"""
+import functools
+from datetime import timedelta
+from typing import Callable, Optional
+
+import streamlit as st
+
+from app.helpers.timing import current_rerun, start_rerun
+
+
+def fragment(func: Optional[Callable] = None, *,
+             run_every: Optional[int | float | timedelta | str] = None) -> Callable:
+    """Like st.fragment (as a decorator or called on a function), timing reruns of the fragment alone"""
+    if func is None:
+        return functools.partial(fragment, run_every=run_every)
+
+    @functools.wraps(func)
+    def timed_fragment(*args, **kwargs):
+        rerun = current_rerun()
+        if rerun is not None and rerun.end is None:
+            # Part of a full rerun, already being timed
+            return func(*args, **kwargs)
+        timings = start_rerun(func.__name__)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            timings.finish()
+
+    return st.fragment(timed_fragment, run_every=run_every)
@@ -0,0 +1,84 @@
+"""
+This module provides the live scoreboard, shown on the board while the selected team plays today.
+
+The scoreboard is a Streamlit fragment that reruns on its own at the game's poll interval,
+so during a game only the scoreboard is refreshed instead of the whole page.  When the
+interval changes (e.g. at an intermission) or the game ends, the page is rerun once so the
+fragment is rescheduled and the schedule and standings pick up the result.
+"""
+import logging
+
+import streamlit as st
+
+from app.data.live_dal import diff_live_games, get_team_game, poll_interval, refresh_final_results
+from app.data.page_loader import BoardData
+from app.data.season_dal import get_seasons
+from app.helpers.timing import RENDER, timed
+from app.web.components.fragment import fragment
+
+logger = logging.getLogger(__name__)
+
+
+@timed(RENDER)
+def render_live_scoreboard(board: BoardData):
+    """Render the selected team's game today, updating on its own while the game is on"""
+    if not board.team or board.season.id != get_seasons().current.id:
+        return
+    try:
+        game = get_team_game(board.team.abbr)
+    except Exception:
+        logger.warning("Live scores for %s are not available", board.team.abbr, exc_info=True)
+        return
+    if game is None:
+        return
+
+    interval = poll_interval(game)
+    st.session_state.live_poll_interval = interval
+    fragment(render_live_game, run_every=interval)(board.team.abbr, board.season.id)
+
+
+@timed(RENDER)
+def render_live_game(team_abbrev: str, season_id: int):
+    """Poll the team's game and render the scoreboard, announcing goals and period changes"""
+    try:
+        game = get_team_game(team_abbrev)
+    except Exception:
+        logger.warning("Live scores for %s are not available", team_abbrev, exc_info=True)
+        st.caption("Live scores are not available right now.")
+        return
+    if game is None:
+        return
+
+    # By team, so switching teams does not compare two different games
+    live_games = st.session_state.setdefault("live_games", {})
+    previous = live_games.get(team_abbrev)
+    for change in diff_live_games(previous, game):
+        st.toast(change, icon="🚨")
+    live_games[team_abbrev] = game
+
+    with st.container(border=True):
+        away, status, home = st.columns([2, 1, 2], vertical_alignment="center")
+        for column, abbrev, logo, score, sog in ((away, game.away_abbrev, game.away_logo, game.away_score,
+                                                  game.away_sog),
+                                                 (home, game.home_abbrev, game.home_logo, game.home_score,
+                                                  game.home_sog)):
+            with column:
+                left, right = st.columns([1, 2], vertical_alignment="center")
+                if logo:
+                    left.image(logo, width=60)
+                right.metric(abbrev, score if score is not None else "-")
+                if sog is not None:
+                    right.caption(f"{sog} shots on goal")
+        with status:
+            st.markdown(f"**{'🔴 ' if game.is_live else ''}{game.period_label}**")
+
+    if previous is not None and previous.game_id == game.game_id and not previous.is_final and game.is_final:
+        # The result changes the schedules and the standings, rerun the page to show them
+        try:
+            refresh_final_results(game, season_id)
+        except Exception:
+            logger.warning("Results of game %s could not be refreshed", game.game_id, exc_info=True)
+        st.rerun()
+    elif poll_interval(game) != st.session_state.get("live_poll_interval"):
+        # Reschedule the fragment at the new interval
+        st.rerun()
@@ -0,0 +1,49 @@
+"""
+This module provides the optional performance panel, a per-rerun latency breakdown.
+
+The panel is shown in the sidebar when the page is opened with ``?debug=perf`` or when
+the ``NHL_PERF_PANEL`` environment variable is set.
+"""
+import os
+
+import streamlit as st
+
+from app.helpers.data_cache import data_cache, single_flight
+from app.helpers.dataframe_utilities import compaction_info
+from app.helpers.timing import RerunTimings
+from app.web.components.render_memo import render_memo_info
+
+PERF_PANEL_ENV = "NHL_PERF_PANEL"
+
+
+def perf_panel_enabled() -> bool:
+    """Return True when the performance panel was requested via query parameter or environment."""
+    return bool(os.environ.get(PERF_PANEL_ENV)) or st.query_params.get("debug") == "perf"
+
+
+def render_perf_panel(timings: RerunTimings, in_sidebar: bool = True):
+    """Render the timing breakdown of a finished rerun: totals by kind, then every span."""
+    summary = timings.summary()
+    target = st.sidebar if in_sidebar else st
+    with target.expander(f"Performance: {summary['total_ms']:.0f} ms", expanded=False):
+        by_kind = summary["self_ms_by_kind"]
+        cols = st.columns(3)
+        for col, kind in zip(cols, ("api", "dal", "render")):
+            col.metric(kind, f"{by_kind.get(kind, 0.0):.0f} ms")
+        st.caption(f"cache hits {summary['cache_hits']}, misses {summary['cache_misses']}, "
+                   f"coalesced {summary['coalesced']}, stale {summary['stale']}; "
+                   f"data cache hit rate {data_cache.info()['hit_rate']:.0%}, "
+                   f"{single_flight.info()['coalesced']} calls coalesced since start")
+        compaction = compaction_info()
+        if compaction["frames"]:
+            st.caption(f"{compaction['frames']} frames compacted since start, "
+                       f"{compaction['bytes_before'] / 1024:.0f} -> {compaction['bytes_after'] / 1024:.0f} KiB "
+                       f"({compaction['saved_ratio']:.0%} smaller)")
+        reuse = render_memo_info()
+        if reuse:
+            st.caption("render reuse: " + ", ".join(f"{name} {info['reuse_rate']:.0%}" for name, info in reuse.items()))
+        rows = timings.rows()
+        if rows:
+            import pandas as pd  # imported here, the panel is only shown when debugging
+
+            st.dataframe(pd.DataFrame(rows), hide_index=True)
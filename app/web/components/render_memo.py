@@ -0,0 +1,72 @@
+"""
+Memoized output of the HTML components.
+
+The stat tables, the stylesheet, the badge rows and the masthead render to HTML that
+depends only on their inputs, and run on every rerun of every session.  Decorating the
+function building a component's HTML with :func:`memoize_render` builds it once per process
+for each distinct input and shares it across sessions; :func:`render_memo_info` reports how
+often each component's output was reused.
+"""
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+DEFAULT_MAX_ENTRIES = 512
+
+
+class RenderMemo:
+    """The HTML built by one function, keyed by its (hashable) arguments, least recently used dropped first."""
+    def __init__(self, name: str, build: Callable[..., str], max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.name = name
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._build = build
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, *args: Hashable) -> str:
+        with self._lock:
+            html = self._entries.get(args)
+            if html is not None:
+                self._entries.move_to_end(args)
+                self.hits += 1
+                return html
+        # Built outside the lock, two sessions missing the same input at once both build it
+        html = self._build(*args)
+        with self._lock:
+            self.misses += 1
+            self._entries[args] = html
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return html
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            calls = self.hits + self.misses
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses,
+                    "reuse_rate": round(self.hits / calls, 3) if calls else 0.0}
+
+
+# Every memoized component, by name
+_memos: dict[str, RenderMemo] = {}
+
+
+def memoize_render(name: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> Callable[[Callable[..., str]], RenderMemo]:
+    """Decorate a function returning a component's HTML so it is built once per distinct arguments."""
+    def decorator(build: Callable[..., str]) -> RenderMemo:
+        memo = RenderMemo(name, build, max_entries)
+        functools.update_wrapper(memo, build)
+        _memos[name] = memo
+        return memo
+    return decorator
+
+
+def render_memo_info() -> dict[str, dict[str, Any]]:
+    """Reuse counts of every memoized component since the process started."""
+    return {name: memo.info() for name, memo in _memos.items()}
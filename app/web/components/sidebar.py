@@ -1,6 +1,8 @@
 """
 This module provides components for the sidebar in the NHL Display Board app.
 """
+import base64
+import os
 from typing import Tuple, Optional
 
 import streamlit as st
@@ -9,10 +11,13 @@ from app.data.season_dal import get_seasons
 from app.data.team_dal import get_teams_for_season
 
 from app.helpers.file_utilities import resolve_resource_path
+from app.helpers.timing import RENDER, timed
 from app.model.season import Season
 from app.model.team import Team
+from app.web.components.render_memo import memoize_render
 
 
+@timed(RENDER)
 def render_masthead(heading: str = "Display Board",
                     widths=None,
                     in_sidebar: bool = True):
@@ -27,77 +32,79 @@ def render_masthead(heading: str = "Display Board",
 
     logo_path = resolve_resource_path("resources/images/NHL-logo.svg")
     with left:
-        st.image(logo_path, width=60)
+        st.markdown(_logo_html(logo_path, os.stat(logo_path).st_mtime_ns), unsafe_allow_html=True)
 
     with right:
-        st.markdown(
-            f"""
+        st.markdown(_heading_html(heading), unsafe_allow_html=True)
+
+
+@memoize_render("masthead_logo")
+def _logo_html(path: str, mtime_ns: int) -> str:
+    """
+    The logo inlined as a data URI, read and encoded once per change of the file instead of
+    by st.image on every rerun.
+    """
+    with open(path, encoding="utf-8") as f:
+        svg = f.read()
+    if "xmlns" not in svg:
+        svg = svg.replace("<svg", '<svg xmlns="http://www.w3.org/2000/svg"', 1)
+    data = base64.b64encode(svg.encode("utf-8")).decode("ascii")
+    return f'<img src="data:image/svg+xml;base64,{data}" width="60" alt="NHL">'
+
+
+@memoize_render("masthead")
+def _heading_html(heading: str) -> str:
+    return f"""
             <div style="display:flex;align-items:center;">
                 <h1 style="margin:0; padding:0;">{heading}</h1>
             </div>
-            """,
-            unsafe_allow_html=True,
-        )
+            """
 
 
+@timed(RENDER)
 def sidebar_filters() -> Tuple[Season, Optional[Team]]:
     """ handle the season and team filters, return the selection"""
     st.sidebar.header("Filters")
 
     # Seasons (descending, default to current)
     seasons = get_seasons()
-    current_season = seasons[0]
-    current_season_id = current_season.id
-
-    labels = [s.formatted_id for s in seasons]
-    values = [s.id for s in seasons]
-
-    # Default index to current season (first item because the list is descending)
-    default_index = 0 if values and values[0] == current_season_id else 0
+    current_season = seasons.current
 
     # Preserve the last selected season on return to the main page
-    if "last_season_id" in st.session_state:
-        selected_season_ix = values.index(st.session_state["last_season_id"])
-    else:
-        selected_season_ix = default_index
+    selected_season_ix = seasons.position(st.session_state.get("last_season_id", current_season.id))
 
     selected_season_label = st.sidebar.selectbox(
         "Season",
-        options=labels,
+        options=seasons.labels,
         index=selected_season_ix,
         key="season_select",
     )
-    season_ix = labels.index(selected_season_label)
-    selected_season = seasons[season_ix]
+    selected_season = seasons.by_formatted_id[selected_season_label]
 
     # Initialize session state for team selection (None on first render)
     if "selected_team_abbr" not in st.session_state:
         st.session_state["selected_team_abbr"] = None
     if "last_season_id" not in st.session_state:
-        st.session_state["last_season_id"] = values[default_index] if values else None
+        st.session_state["last_season_id"] = current_season.id
 
     # Teams for the selected season
     teams = get_teams_for_season(
         selected_season.start_date if selected_season != current_season else None
     )
-    team_labels = [t.name for t in teams]
-    team_values = [t.abbr for t in teams]
 
     # If the season changed, keep the selected team only if it exists in this season
     if st.session_state.get("last_season_id") != selected_season.id:
-        if st.session_state.get("selected_team_abbr") not in team_values:
+        if teams.team(st.session_state.get("selected_team_abbr")) is None:
             st.session_state["selected_team_abbr"] = None
         st.session_state["last_season_id"] = selected_season.id
 
     # Build select options with a place-holder first entry
     placeholder = "— Select a team —"
-    team_options = [placeholder] + team_labels
+    team_options = [placeholder, *teams.labels]
 
     # Determine the index: placeholder when no valid remembered team
-    if st.session_state["selected_team_abbr"] in team_values:
-        idx = 1 + team_values.index(st.session_state["selected_team_abbr"])
-    else:
-        idx = 0
+    team_ix = teams.position(st.session_state["selected_team_abbr"])
+    idx = 0 if team_ix is None else 1 + team_ix
 
     chosen_label = st.sidebar.selectbox(
         "Team",
@@ -107,12 +114,7 @@ def sidebar_filters() -> Tuple[Season, Optional[Team]]:
     )
 
     # Update remembered selection
-    if chosen_label == placeholder:
-        st.session_state["selected_team_abbr"] = None
-        selected_team: Optional[Team] = None
-    else:
-        chosen_ix = team_labels.index(chosen_label)
-        selected_team = teams[chosen_ix]
-        st.session_state["selected_team_abbr"] = selected_team.abbr
+    selected_team: Optional[Team] = teams.by_name.get(chosen_label)
+    st.session_state["selected_team_abbr"] = selected_team.abbr if selected_team else None
 
     return selected_season, selected_team
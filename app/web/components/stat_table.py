@@ -5,6 +5,8 @@ from typing import Any
 
 import streamlit as st
 
+from app.web.components.render_memo import memoize_render
+
 
 class StatTable:
     """A component for displaying statistics in a table format."""
@@ -31,10 +33,15 @@ class StatTable:
         return self
 
     def render(self) -> None:
-        """Render the table."""
-        table_html = f'<table class="{self.table_class}">'
-        for label, value in self.stats.items():
-            table_html += (f'<tr><td class="{self.label_class}">{label}</td>' +
-                           f'<td class="{self.value_class}">{value}</td></tr>')
-        table_html += "</table>"
-        st.markdown(table_html, unsafe_allow_html=True)
+        """Render the table, its HTML is built once per distinct content."""
+        st.markdown(self.html(), unsafe_allow_html=True)
+
+    def html(self) -> str:
+        return _table_html(self.table_class, self.label_class, self.value_class, tuple(self.stats.items()))
+
+
+@memoize_render("stat_table")
+def _table_html(table_class: str, label_class: str, value_class: str, stats: tuple[tuple[str, str], ...]) -> str:
+    rows = "".join(f'<tr><td class="{label_class}">{label}</td><td class="{value_class}">{value}</td></tr>'
+                   for label, value in stats)
+    return f'<table class="{table_class}">{rows}</table>'
@@ -21,12 +21,13 @@ setup_logging(debug=True)
 
 from app.web.components.css import CSS
 from app.web.components.sidebar import render_masthead, sidebar_filters
-from app.web.components.container import render_roster
-from app.web.components.bottom_tabs import render_bottom_tabs
+from app.web.components.perf_panel import perf_panel_enabled, render_perf_panel
+from app.helpers.timing import start_rerun
 
 
 def main():
     """Main function to run the app"""
+    timings = start_rerun("display_board")
     st.set_page_config(
         page_title="NHL Display Board",
         page_icon="🏒",
@@ -42,12 +43,33 @@ def main():
     # Sidebar filters
     selected_season, selected_team = sidebar_filters()
 
+    # Imported once the masthead and filters are drawn: these pull in pandas and the data access
+    # layer, which a new process would otherwise import before putting anything on screen
+    from app.data.page_loader import load_board_data
+    from app.data.warmup import start_warmup_once
+    from app.web.components.bottom_tabs import render_bottom_tabs
+    from app.web.components.container import render_roster
+    from app.web.components.live_scoreboard import render_live_scoreboard
+
+    # With NHL_WARMUP_ON_START, the first page run of the process warms the whole season's caches
+    start_warmup_once()
+
+    # Fetch roster, standing and schedule concurrently rather than as each component renders
+    board = load_board_data(selected_season, selected_team)
+
     # Top large pane: roster display for selected season/team
     with st.container():
-        render_roster(selected_season, selected_team)
+        render_roster(board)
+
+    # Live scoreboard while the team plays today, refreshed on its own between page reruns
+    render_live_scoreboard(board)
 
     # Bottom: tabbed pane for extendable functionality
-    render_bottom_tabs(selected_season, selected_team)
+    render_bottom_tabs(board)
+
+    timings.finish()
+    if perf_panel_enabled():
+        render_perf_panel(timings)
 
 
 if __name__ == "__main__":
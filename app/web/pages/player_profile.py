@@ -1,12 +1,15 @@
 """
 A Streamlit application module for displaying player profile.
 """
-import numpy as np
-import pandas as pd
+import math
+import textwrap
+
 import streamlit as st
 
-from app.data.stats import get_career_stats
+from app.helpers.timing import RENDER, start_rerun, timed
 from app.web.components.css import hide_sidebar, CSS
+from app.web.components.perf_panel import perf_panel_enabled, render_perf_panel
+from app.web.components.render_memo import memoize_render
 from app.web.components.sidebar import render_masthead
 from app.web.components.stat_table import StatTable
 
@@ -24,7 +27,7 @@ def build_stat_summary(player_info: dict, stats: dict) -> StatTable:
 
     # Some players don't have a sweater number, so handle that gracefully
     if ('sweaterNumber' in stats and stats['sweaterNumber'] and
-            not np.isnan(stats['sweaterNumber'])):
+            not math.isnan(stats['sweaterNumber'])):
         number = int(stats['sweaterNumber'])
     else:
         number = ''
@@ -39,18 +42,15 @@ def build_stat_summary(player_info: dict, stats: dict) -> StatTable:
         "Birth location": birth_location})
 
 
-# format a season from the stats into something more readable
-def format_season(x):
-    """Format season as a pretty string"""
-    s = str(x)
-    # Keep this edge case unmodified if needed
-    if s == "19992000":
-        return "1999-2000"
-    return f"{s[:4]}-{s[-2:]}"
-
-
 def render_badges_row(badges, size_px=60, gap_px=12):
     """ Render a row of badges"""
+    badge_key = tuple((b["logoUrl"]["default"], b["title"]["default"]) for b in badges)
+    st.markdown(_badges_html(badge_key, size_px, gap_px), unsafe_allow_html=True)
+
+
+@memoize_render("badges")
+def _badges_html(badges: tuple[tuple[str, str], ...], size_px: int, gap_px: int) -> str:
+    """The style and markup of a row of (logo url, title) badges."""
     style = f"""
         <style>
         .badges-row {{
@@ -67,39 +67,27 @@ def render_badges_row(badges, size_px=60, gap_px=12):
         }}
         </style>
     """
-    st.markdown(style, unsafe_allow_html=True)
     imgs = "\n".join([
-        f'<img src="{b["logoUrl"]["default"]}" ' +
-        f'alt="{b["title"]["default"]}" ' +
-        f'title="{b["title"]["default"]}">'     # tooltip on hover
-        for b in badges]
+        f'<img src="{logo_url}" ' +
+        f'alt="{title}" ' +
+        f'title="{title}">'     # tooltip on hover
+        for logo_url, title in badges]
     )
-    st.markdown(f'<div class="badges-row">{imgs}</div>', unsafe_allow_html=True)
-
-
-st.set_page_config(
-    page_title="Player Profile",
-    page_icon="🏒",
-    layout="wide",
-    initial_sidebar_state="collapsed",
-)
+    # One element: st.markdown dedents its body, which the unindented row would prevent
+    return textwrap.dedent(style) + f'<div class="badges-row">{imgs}</div>'
 
-hide_sidebar()
-CSS('resources/css/stat-table.css').include()
 
+@timed(RENDER, "player_profile")
+def render_player_profile(player: dict):
+    """Render the profile, headline stats and career tables for a player"""
+    # Imported here, the page without a selected player needs neither the DAL nor pandas
+    from app.data.stats import get_career_frames, get_career_stats
 
-# Check if the selected product data exists in session state
-if 'selected_player' in st.session_state and st.session_state.selected_player:
-    player = st.session_state.selected_player
     player_id = player['player_id']
 
     career_stats = get_career_stats(player_id)
-    season_totals_df = pd.json_normalize(career_stats['seasonTotals'], sep='.')
-
-    season_totals_df['formatted_season'] = season_totals_df['season'].apply(format_season)
-
-    regular_season_totals_df = season_totals_df[season_totals_df['gameTypeId'] == 2]
-    playoffs_season_totals_df = season_totals_df[season_totals_df['gameTypeId'] == 3]
+    # Normalized, split and trimmed once per player, then served from the cache on reruns
+    career = get_career_frames(player_id, player.get('positionCode'))
 
     render_masthead("Player Profile", in_sidebar=False, widths=[1, 15])
     st.header(f"{player['firstName']} {player['lastName']}")
@@ -124,26 +112,6 @@ if 'selected_player' in st.session_state and st.session_state.selected_player:
 
     st.divider()
 
-    if player['positionCode'] == 'G':
-        columns_to_display = [
-            'formatted_season', 'leagueAbbrev', 'teamName.default', 'gamesPlayed', 'goalsAgainstAvg',
-            'goalsAgainst', 'shutouts', 'wins', 'losses'
-        ]
-        if 'savePctg' in regular_season_totals_df.columns:
-            columns_to_display.insert(columns_to_display.index('goalsAgainstAvg') + 1, 'savePctg')
-        if 'ties' in regular_season_totals_df.columns:
-            columns_to_display.insert(columns_to_display.index('wins') + 1, 'ties')
-        for c in ['assists', 'gamesStarted', 'goals', 'pim', 'shotsAgainst', 'timeOnIce', 'otLosses']:
-            if c in regular_season_totals_df.columns:
-                columns_to_display.append(c)
-    else:
-        columns_to_display = [
-            'formatted_season', 'leagueAbbrev', 'teamName.default', 'gamesPlayed', 'goals', 'assists', 'points', 'pim'
-        ]
-        for c in ['plusMinus', 'avgToi', 'shots', 'shootingPctg', 'faceoffWinningPctg']:
-            if c in regular_season_totals_df.columns:
-                columns_to_display.append(c)
-
     col_configs = {
         "formatted_season": "season",
         "leagueAbbrev": "league",
@@ -151,19 +119,39 @@ if 'selected_player' in st.session_state and st.session_state.selected_player:
     }
 
     st.subheader("Regular Season Stats")
-    st.dataframe(regular_season_totals_df[columns_to_display],
+    st.dataframe(career.regular,
                  column_config=col_configs,
                  hide_index=True)
 
     st.subheader("Playoff Season Stats")
-    st.dataframe(playoffs_season_totals_df[columns_to_display],
+    st.dataframe(career.playoffs,
                  column_config=col_configs,
                  hide_index=True)
 
+
+st.set_page_config(
+    page_title="Player Profile",
+    page_icon="🏒",
+    layout="wide",
+    initial_sidebar_state="collapsed",
+)
+
+hide_sidebar()
+CSS('resources/css/stat-table.css').include()
+
+timings = start_rerun("player_profile")
+
+# Check if the selected product data exists in session state
+if 'selected_player' in st.session_state and st.session_state.selected_player:
+    render_player_profile(st.session_state.selected_player)
 else:
     st.warning("No player selected. Please go back and select a player.")
 
 st.divider()
 
+timings.finish()
+if perf_panel_enabled():
+    render_perf_panel(timings, in_sidebar=False)
+
 if st.button("Go Back"):
     st.switch_page("display_board_app.py")
@@ -0,0 +1 @@
+# Offline benchmarks for the NHL Display Board, run with `python -m benchmarks.<module>`.
@@ -0,0 +1,162 @@
+"""
+Benchmark: the data cache backends, in process versus shared between worker processes.
+
+First the DAL values for a team (seasons, teams, roster, schedules, standings, career
+frames) are stored in each backend: the in-process DataCache, SQLite and Redis (served by
+the local stand-in, benchmarks.fake_redis).  For the shared backends a second cache over the
+same store plays another worker: its first lookup reads and decodes the value, the next
+ones only check the version.  Stored sizes are compared with Arrow IPC for the frames.
+
+Then several worker processes load the board for every team one after the other, each with
+its own fake NHL client, and the API calls and cached bytes of each worker are reported for
+the in-process and the SQLite backend.
+
+    python -m benchmarks.bench_cache_backends [--workers 4] [--repeat 50]
+"""
+import argparse
+import io
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Any, Callable
+
+import pandas as pd
+import pyarrow as pa
+
+from app.helpers import use_client
+from app.helpers.cache_backends import SQLITE_PATH_ENV, RedisStore, SharedCache, SQLiteStore, encode_value
+from app.helpers.data_cache import BACKEND_ENV, DataCache
+from benchmarks.fake_client import FakeNHLClient
+from benchmarks.fake_redis import FakeRedis
+
+
+def dal_values(team_abbrev: str) -> dict[str, Any]:
+    """The values the DAL caches for one team, built offline."""
+    from app.data.roster_dal import get_team_roster
+    from app.data.schedule_dal import get_league_schedule, get_regular_schedule
+    from app.data.season_dal import get_seasons
+    from app.data.standings_dal import get_season_standings
+    from app.data.stats import get_career_frames
+    from app.data.team_dal import get_teams_for_season
+
+    season = get_seasons().current
+    team = get_teams_for_season(None).team(team_abbrev)
+    roster = get_team_roster(season, team)
+    return {
+        "seasons": get_seasons(),
+        "teams": get_teams_for_season(None),
+        "roster": roster,
+        "schedule": get_regular_schedule(team.abbr, season.id),
+        "league_schedule": get_league_schedule(season),
+        "standings": get_season_standings(season.id),
+        "career_frames": get_career_frames(int(roster.index[0])),
+    }
+
+
+def best_us(func: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1e6
+
+
+def arrow_size(value: Any) -> str:
+    if not isinstance(value, pd.DataFrame):
+        return "-"
+    sink = io.BytesIO()
+    table = pa.Table.from_pandas(value)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return str(sink.tell())
+
+
+def bench_lookups(values: dict[str, Any], repeat: int, directory: str) -> None:
+    caches = {
+        "memory": DataCache(),
+        "sqlite": SharedCache(SQLiteStore(os.path.join(directory, "bench.sqlite"), 1 << 30)),
+        "redis": SharedCache(RedisStore(FakeRedis())),
+    }
+    for cache in caches.values():
+        for key, value in values.items():
+            cache.set(("bench", key), value)
+    shared = [name for name in caches if name != "memory"]
+    print(f"{'value':16s} {'bytes':>8s} {'arrow':>8s}   "
+          + "   ".join(f"{name + ' hit us':>14s}" for name in caches)
+          + "   " + "   ".join(f"{name + ' cold us':>15s}" for name in shared))
+
+    for key, value in values.items():
+        hits = [best_us(lambda: cache.get(("bench", key)), repeat) for cache in caches.values()]
+        # A fresh cache over the same store is another worker, its first lookup decodes the value
+        colds = [best_us(lambda: SharedCache(caches[name].store).get(("bench", key)), repeat) for name in shared]
+        print(f"{key:16s} {len(encode_value(value)):8d} {arrow_size(value):>8s}   "
+              + "   ".join(f"{us:14.1f}" for us in hits) + "   " + "   ".join(f"{us:15.1f}" for us in colds))
+
+
+def worker(queue: Any) -> None:
+    """One app worker process: load the board for every team, report its API calls and cache size."""
+    logging.disable(logging.WARNING)
+    fake = FakeNHLClient()
+    use_client(fake)
+    from app.data.page_loader import load_board_data
+    from app.data.season_dal import get_seasons
+    from app.data.team_dal import get_teams_for_season
+    from app.helpers.data_cache import data_cache
+
+    season = get_seasons().current
+    start = time.perf_counter()
+    for team in get_teams_for_season(None):
+        load_board_data(season, team)
+    elapsed = time.perf_counter() - start
+    info = data_cache.info()
+    queue.put((fake.total_calls(), elapsed, info.get("local_bytes", info["bytes"])))
+
+
+def bench_workers(workers: int, directory: str) -> None:
+    context = multiprocessing.get_context("spawn")
+    print(f"\n{workers} workers loading every team's board, one after the other")
+    for backend in ("memory", "sqlite"):
+        path = os.path.join(directory, f"workers-{backend}.sqlite")
+        results = []
+        # Spawned workers inherit the environment, the data cache is created when they import the app
+        os.environ.update({BACKEND_ENV: backend, SQLITE_PATH_ENV: path})
+        try:
+            for _ in range(workers):
+                queue = context.Queue()
+                process = context.Process(target=worker, args=(queue,))
+                process.start()
+                results.append(queue.get())
+                process.join()
+        finally:
+            for name in (BACKEND_ENV, SQLITE_PATH_ENV):
+                os.environ.pop(name, None)
+        calls = [r[0] for r in results]
+        print(f"  {backend:7s} api calls per worker {calls} (total {sum(calls)}), "
+              f"load s {[round(r[1], 2) for r in results]}, "
+              f"cached MiB per worker {[round(r[2] / 2 ** 20, 1) for r in results]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--team", default="SJS", help="team whose values are stored")
+    parser.add_argument("--workers", type=int, default=4, help="worker processes to run")
+    parser.add_argument("--repeat", type=int, default=50, help="lookups timed per value, the best is shown")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    previous_client = use_client(FakeNHLClient())
+    try:
+        values = dal_values(args.team)
+    finally:
+        use_client(previous_client)
+
+    with tempfile.TemporaryDirectory() as directory:
+        bench_lookups(values, args.repeat, directory)
+        bench_workers(args.workers, directory)
+
+
+if __name__ == "__main__":
+    main()
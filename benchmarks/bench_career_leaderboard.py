@@ -0,0 +1,87 @@
+"""
+Benchmark: aggregating the careers of a roster's players.
+
+The career stats payloads of a roster are fetched once from the fake client, then the
+leaderboard is built from them repeatedly, without the API or the cache:
+
+- per player: each payload normalized into its own frame (build_career_frames, as the player
+  profile does), the frames concatenated and aggregated;
+- batch: every payload's season totals gathered into one frame in a single pass and
+  aggregated with vectorized group-bys (app.data.career_leaderboard).
+
+    python -m benchmarks.bench_career_leaderboard [--team TOR] [--rosters 1] [--repeat 20]
+"""
+import argparse
+import logging
+import statistics
+import time
+from typing import Any, Callable
+
+import pandas as pd
+
+from app.helpers import use_client
+from benchmarks.fake_client import FakeNHLClient
+
+
+def per_player(roster: pd.DataFrame, payloads: dict[int, dict]) -> pd.DataFrame:
+    """The leaderboard built from one normalized frame per player."""
+    from app.data import career_leaderboard
+    from app.data.stats import build_career_frames
+
+    frames = []
+    for player_id, payload in payloads.items():
+        regular = build_career_frames(player_id, payload).regular
+        frames.append(regular.assign(player_id=player_id))
+    totals = pd.concat(frames, ignore_index=True).rename(columns={"formatted_season": "season"})
+    for field in career_leaderboard.TOTAL_FIELDS:
+        totals[field] = pd.to_numeric(totals[field], errors="coerce") if field in totals else float("nan")
+    nhl = career_leaderboard.aggregate_careers(totals[totals["leagueAbbrev"] == career_leaderboard.NHL])
+    all_leagues = career_leaderboard.aggregate_careers(totals)
+    return roster.reindex(columns=career_leaderboard.PLAYER_COLUMNS).join(
+        [nhl.add_prefix("nhl_"), all_leagues.add_prefix("all_")], how="left")
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """Median wall time of func in ms."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--team", default="TOR", help="team abbreviation")
+    parser.add_argument("--rosters", type=int, default=1, help="rosters aggregated at once, to scale the players")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per approach, the median is shown")
+    args = parser.parse_args()
+
+    from app.data import career_leaderboard
+    from app.data.roster_dal import get_team_roster
+    from app.data.season_dal import get_seasons
+    from app.data.team_dal import get_teams_for_season
+
+    logging.disable(logging.WARNING)
+    use_client(FakeNHLClient())
+    season, teams = get_seasons().current, get_teams_for_season(None)
+    team = teams.team(args.team)
+    rosters = [get_team_roster(season, t) for t in [team, *(t for t in teams if t != team)][:args.rosters]]
+    roster = pd.concat(rosters)
+    payloads, _ = career_leaderboard.fetch_career_stats(roster.index)
+    rows = sum(len(p.get("seasonTotals", ())) for p in payloads.values())
+    print(f"{len(payloads)} players, {rows} season totals\n")
+
+    batch = career_leaderboard.build_career_leaderboard(roster, payloads)
+    check = per_player(roster, payloads)
+    same = all(check[c].astype(float).equals(batch.loc[check.index, c].astype(float))
+               for c in ("nhl_points", "all_gamesPlayed", "all_save_pct"))
+    per_player_ms = measure(lambda: per_player(roster, payloads), args.repeat)
+    batch_ms = measure(lambda: career_leaderboard.build_career_leaderboard(roster, payloads), args.repeat)
+    print(f"{'per player':12s} {per_player_ms:8.1f} ms")
+    print(f"{'batch':12s} {batch_ms:8.1f} ms  ({per_player_ms / batch_ms:.1f}x faster, same totals: {same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Memory report: cached DAL frames before and after dtype compaction.
+
+Builds every team's roster and schedule, the league schedule and a sample of career
+frames from the fixtures, and reports their deep memory usage as built and as cached
+(pruned columns, categoricals, small nullable integers), per frame kind and in total.
+
+    python -m benchmarks.bench_dtypes [--players 50]
+"""
+import argparse
+from collections import defaultdict
+
+from app.data.roster_dal import ROSTER_COLUMNS, build_team_roster
+from app.data.schedule_dal import (FLOAT_SCHEDULE_COLUMNS, REGULAR_SCHEDULE_COLUMNS, build_league_schedule,
+                                   build_regular_schedule)
+from app.data.stats import RATE_COLUMNS, build_career_frames
+from app.helpers.dataframe_utilities import compact_dtypes, frame_memory, prune_columns
+from benchmarks.fixtures import (CURRENT_SEASON, TEAM_ABBREVS, career_stats_payload, league_games,
+                                 roster_payload, team_schedule_payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--players", type=int, default=50, help="number of career frames to build")
+    args = parser.parse_args()
+
+    totals: dict[str, list[int]] = defaultdict(lambda: [0, 0])
+
+    def add(kind, before, after):
+        totals[kind][0] += frame_memory(before)
+        totals[kind][1] += frame_memory(after)
+
+    player_ids = []
+    for team in TEAM_ABBREVS:
+        roster = build_team_roster(roster_payload(team, CURRENT_SEASON))
+        add("roster", roster, compact_dtypes(prune_columns(roster, ROSTER_COLUMNS)))
+        player_ids.extend(roster.index)
+        schedule = build_regular_schedule(team_schedule_payload(team, CURRENT_SEASON), team)
+        add("schedule", schedule,
+            compact_dtypes(prune_columns(schedule, REGULAR_SCHEDULE_COLUMNS), FLOAT_SCHEDULE_COLUMNS))
+
+    league = build_league_schedule(league_games(CURRENT_SEASON))
+    add("league schedule", league, compact_dtypes(league, FLOAT_SCHEDULE_COLUMNS))
+
+    for player_id in player_ids[:args.players]:
+        frames = build_career_frames(int(player_id), career_stats_payload(player_id))
+        for frame in (frames.regular, frames.playoffs):
+            add("career", frame, compact_dtypes(frame, RATE_COLUMNS))
+
+    grand = [0, 0]
+    for kind, (before, after) in totals.items():
+        grand[0] += before
+        grand[1] += after
+        print(f"{kind:16s} {before / 1024:10.1f} KiB -> {after / 1024:10.1f} KiB  ({1 - after / before:4.0%} smaller)")
+    print(f"{'total':16s} {grand[0] / 1024:10.1f} KiB -> {grand[1] / 1024:10.1f} KiB  "
+          f"({1 - grand[1] / grand[0]:4.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
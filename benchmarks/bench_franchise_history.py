@@ -0,0 +1,135 @@
+"""
+Benchmark: building a team's franchise history from every season's standings.
+
+Against the fake client with simulated network latency, wrapped in the app's client stack
+(create_client: on-disk response cache, rate limits, timeouts, retries), on a cold cache
+each time, while a page keeps making interactive calls alongside:
+
+- serial: the standings of every season fetched one after the other, as a naive page would;
+- parallel, shared budget: fetched a few at a time on the history's pool, as the pages' calls;
+- parallel bulk: get_franchise_history, a few seasons at a time as bulk calls, at their own lower
+  rate and after the page's calls (app.data.franchise_dal);
+- then the cached history, and another team's history, built from the cached standings.
+
+The page's calls (the daily scores, every 100 ms) show how long the history makes them wait:
+bulk calls only take what the page leaves of the shared budget, so the history takes longer
+while the pages are busy, but never holds up their calls.
+
+    python -m benchmarks.bench_franchise_history [--team TOR] [--delay 0.1] [--seasons 0]
+"""
+import argparse
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from typing import Any, Callable
+
+from app.helpers import client, use_client
+from app.helpers.api_helper import create_client
+from app.helpers.data_cache import data_cache
+from app.helpers.resilient_client import DEFAULT_BULK_RATE, DEFAULT_RATE
+from app.helpers.response_cache import CACHE_DIR_ENV
+from benchmarks import fixtures
+from benchmarks.fake_client import FakeNHLClient
+
+PAGE_INTERVAL = 0.1
+
+
+class Page(threading.Thread):
+    """Make an interactive call every PAGE_INTERVAL seconds until stopped, timing each call."""
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.stop = threading.Event()
+        self.times: list[float] = []
+
+    def run(self):
+        while not self.stop.wait(PAGE_INTERVAL):
+            start = time.perf_counter()
+            client.game_center.daily_scores()
+            self.times.append((time.perf_counter() - start) * 1e3)
+
+
+def timed(fake: FakeNHLClient, func: Callable[[], Any]) -> tuple[Any, float, int, list[float]]:
+    """Run func alongside a page, returns its result, wall time in ms, standings calls and the page's call times."""
+    fake.calls.clear()
+    page = Page()
+    page.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = (time.perf_counter() - start) * 1e3
+    page.stop.set()
+    page.join()
+    return result, elapsed, fake.calls["standings.league_standings"], page.times
+
+
+def page_summary(times: list[float]) -> str:
+    if not times:
+        return ""
+    return f"page calls median {statistics.median(times):6.1f} ms, max {max(times):6.1f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--team", default="TOR", help="team abbreviation")
+    parser.add_argument("--other-team", default="MTL", help="team loaded after the first")
+    parser.add_argument("--delay", type=float, default=0.1, help="simulated latency per API call in seconds")
+    parser.add_argument("--seasons", type=int, default=0, help="only the most recent seasons (0: all)")
+    args = parser.parse_args()
+
+    from app.data import franchise_dal, season_dal
+    from app.data.standings_dal import get_season_standings
+
+    logging.disable(logging.WARNING)
+    fake = FakeNHLClient(delay=args.delay)
+    cache_dir = tempfile.TemporaryDirectory(prefix="nhl-api-bench-")
+    os.environ[CACHE_DIR_ENV] = cache_dir.name
+    use_client(create_client(fake))
+    seasons = season_dal.get_seasons()
+    if args.seasons:
+        # The history is built from the seasons in the catalog, served from the cache below
+        seasons = type(seasons)(seasons[:args.seasons])
+        season_dal.get_seasons.cache_set(seasons)
+    for season in seasons:
+        # Build the fake's payloads up front, only the simulated latency is measured
+        fixtures.league_games(season.id)
+
+    def cold(func: Callable[[], Any]) -> Callable[[], Any]:
+        def run():
+            # A new client stack (full rate limit budgets) and empty caches
+            stack = create_client(fake)
+            stack.clear()
+            use_client(stack)
+            data_cache.clear()
+            season_dal.get_seasons.cache_set(seasons)
+            return func()
+        return run
+
+    print(f"{len(seasons)} seasons, {args.delay * 1e3:.0f} ms per API call, "
+          f"{franchise_dal._executor._max_workers} standings at a time, "
+          f"{DEFAULT_RATE:.0f} calls/s shared, {DEFAULT_BULK_RATE:.0f} calls/s bulk\n")
+    _, ms, calls, page = timed(fake, cold(lambda: [get_season_standings(s.id) for s in seasons]))
+    print(f"{'serial, cold cache':34s} {ms:9.1f} ms  standings calls {calls:3d}  {page_summary(page)}")
+
+    def shared() -> list[Any]:
+        futures = [franchise_dal._executor.submit(get_season_standings, s.id) for s in seasons]
+        return [f.result() for f in futures]
+    _, ms, calls, page = timed(fake, cold(shared))
+    print(f"{'parallel, shared budget':34s} {ms:9.1f} ms  standings calls {calls:3d}  {page_summary(page)}")
+
+    history, ms, calls, page = timed(fake, cold(lambda: franchise_dal.get_franchise_history(args.team)))
+    print(f"{'parallel bulk, cold cache':34s} {ms:9.1f} ms  standings calls {calls:3d}  {page_summary(page)}")
+    print(f"{'':34s} {len(history)} seasons, {history.frame.memory_usage(deep=True).sum()} bytes, "
+          f"{fake.calls['standings.season_standing_manifest']} manifest call")
+
+    _, ms, calls, _ = timed(fake, lambda: franchise_dal.get_franchise_history(args.team))
+    print(f"{'cached':34s} {ms:9.3f} ms  standings calls {calls:3d}")
+
+    _, ms, calls, _ = timed(fake, lambda: franchise_dal.get_franchise_history(args.other_team))
+    print(f"{args.other_team + ', standings cached':34s} {ms:9.1f} ms  standings calls {calls:3d}")
+    cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
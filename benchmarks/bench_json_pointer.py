@@ -0,0 +1,55 @@
+"""
+Micro-benchmark: json_pointer_get versus compiled JsonPointer / JsonSchema extraction.
+
+Populates the TeamSummary fields of a full league standings list three ways:
+one json_pointer_get call per field, one compiled JsonPointer per field, and a
+single JsonSchema pass (records and columns).
+
+    python -m benchmarks.bench_json_pointer [--repeat 200]
+"""
+import argparse
+import timeit
+
+from app.helpers.json_utilities import json_pointer_get
+from app.model.team_summary import STANDINGS_SCHEMA
+from benchmarks.fixtures import CURRENT_SEASON, standings_payload
+
+
+def by_json_pointer_get(standings: list[dict]) -> list[dict]:
+    fields = [(name, f.pointer.pointer, f.default, f.raise_error) for name, f in STANDINGS_SCHEMA.fields.items()]
+    return [{name: json_pointer_get(s, pointer, default, raise_error) for name, pointer, default, raise_error in fields}
+            for s in standings]
+
+
+def by_compiled_pointer(standings: list[dict]) -> list[dict]:
+    fields = [(name, f.pointer, f.default, f.raise_error) for name, f in STANDINGS_SCHEMA.fields.items()]
+    return [{name: pointer.get(s, default, raise_error) for name, pointer, default, raise_error in fields}
+            for s in standings]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200, help="iterations per variant")
+    args = parser.parse_args()
+
+    standings = standings_payload(CURRENT_SEASON)["standings"]
+    expected = by_json_pointer_get(standings)
+    assert by_compiled_pointer(standings) == expected
+    assert STANDINGS_SCHEMA.records(standings) == expected
+
+    variants = {
+        "json_pointer_get": lambda: by_json_pointer_get(standings),
+        "JsonPointer.get": lambda: by_compiled_pointer(standings),
+        "JsonSchema.records": lambda: STANDINGS_SCHEMA.records(standings),
+        "JsonSchema.columns": lambda: STANDINGS_SCHEMA.columns(standings),
+    }
+    baseline = None
+    print(f"{len(standings)} teams x {len(STANDINGS_SCHEMA.fields)} fields, {args.repeat} iterations")
+    for name, func in variants.items():
+        per_call = min(timeit.repeat(func, number=args.repeat, repeat=3)) / args.repeat
+        baseline = baseline or per_call
+        print(f"{name:20s} {per_call * 1e6:10.1f} us/standings  {baseline / per_call:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
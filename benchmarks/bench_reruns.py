@@ -0,0 +1,76 @@
+"""
+Benchmark: what an interaction reruns on the main board, the whole page versus one fragment.
+
+Loads the board for a team through Streamlit's AppTest (offline, against the fake client),
+then reruns the page with warm caches.  Every rerun is timed by app.helpers.timing and
+collected as it finishes; the report puts the full rerun next to the roster fragment, which
+is all that a roster row selection reruns now (before, it reran the full page), and the
+bottom tabs fragment.  The render spans of a full rerun are listed too.
+
+    python -m benchmarks.bench_reruns [--team SJS] [--repeat 20]
+"""
+import argparse
+import logging
+import statistics
+import time
+from collections import defaultdict
+
+from app.helpers import use_client
+from app.helpers.timing import RENDER, RerunTimings, add_rerun_listener, remove_rerun_listener
+from benchmarks.fake_client import FakeNHLClient
+from benchmarks.run import APP_SCRIPT, DEFAULT_TEAM, _run_app
+
+FRAGMENTS = ("render_roster", "render_bottom_tabs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--team", default=DEFAULT_TEAM, help="team abbreviation to display")
+    parser.add_argument("--repeat", type=int, default=20, help="warm reruns to time")
+    args = parser.parse_args()
+
+    reruns: list[RerunTimings] = []
+    logging.disable(logging.INFO)
+    previous_client = use_client(FakeNHLClient())
+    try:
+        from streamlit.testing.v1 import AppTest
+        from app.data.team_dal import get_teams_for_season
+        team_name = get_teams_for_season(None).team(args.team).name
+
+        at = AppTest.from_file(str(APP_SCRIPT), default_timeout=60)
+        _run_app(at)
+        at.selectbox(key="team_select").select(team_name)
+        _run_app(at)
+
+        add_rerun_listener(reruns.append)
+        walls = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            _run_app(at)
+            walls.append((time.perf_counter() - start) * 1e3)
+    finally:
+        remove_rerun_listener(reruns.append)
+        use_client(previous_client)
+
+    spans = defaultdict(list)
+    for timings in reruns:
+        for s in timings.spans:
+            if s.kind == RENDER:
+                spans[s.name].append(s.duration_ms)
+
+    full = statistics.median(t.total_ms for t in reruns)
+    print(f"{args.repeat} warm reruns of the board for {args.team} (median ms)\n")
+    print(f"{'full page rerun (timed)':34s} {full:8.2f}")
+    print(f"{'full page rerun (AppTest wall)':34s} {statistics.median(walls):8.2f}")
+    for name in FRAGMENTS:
+        ms = statistics.median(spans[name])
+        print(f"{name + ' fragment':34s} {ms:8.2f}  ({ms / full:.0%} of the page)")
+
+    print("\nrender spans of a full rerun:")
+    medians = {name: statistics.median(values) for name, values in spans.items()}
+    for name, ms in sorted(medians.items(), key=lambda item: -item[1]):
+        print(f"  {name:32s} {ms:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark: loading boards while the NHL API is flaky, slow or down.
+
+Boards are loaded for several teams against the fake client with injected failures, with and
+without the resilient client (app.helpers.resilient_client) in front of it:
+
+- flaky: a share of the calls fail with a server error, on a cold cache;
+- slow: the cached values have expired and the API is slow, so they are served stale while
+  they are refreshed in the background (stale_while_revalidate in app.helpers.data_cache);
+- outage: no call connects, once with expired values cached and once on a cold cache.
+
+    python -m benchmarks.bench_resilience [--teams 16] [--delay 0.3] [--failure-rate 0.3]
+"""
+import argparse
+import logging
+import time
+from typing import Any
+
+from app.helpers import use_client
+from app.helpers.data_cache import data_cache, single_flight
+from app.helpers.resilient_client import ResilientClient
+from app.helpers.timing import start_rerun
+from app.model.season import Season
+from app.model.team import Team
+from benchmarks.fake_client import FakeNHLClient
+
+
+def selection(teams: int) -> tuple[Season, list[Team]]:
+    """The current season and the first `teams` teams, fetched from a healthy API."""
+    from app.data.season_dal import get_seasons
+    from app.data.team_dal import get_teams_for_season
+
+    previous_client = use_client(FakeNHLClient())
+    try:
+        return get_seasons().current, list(get_teams_for_season(None)[:teams])
+    finally:
+        use_client(previous_client)
+
+
+def load_boards(api: Any, season: Season, teams: list[Team]) -> dict[str, Any]:
+    """Load the board of each team through api, returns failed parts, stale values and wall time."""
+    from app.data.page_loader import load_board_data
+
+    previous_client = use_client(api)
+    timings = start_rerun("bench")
+    try:
+        start = time.perf_counter()
+        failed = sum(len(load_board_data(season, team).errors) for team in teams)
+        elapsed = time.perf_counter() - start
+    finally:
+        use_client(previous_client)
+    return {"wall_ms": elapsed * 1e3, "failed": failed, "stale": timings.summary()["stale"]}
+
+
+def expire_cache() -> None:
+    """Age every entry past its TTL, including those for completed seasons that never expire."""
+    now = time.time()
+    # The benchmark runs on the default in-process DataCache
+    for entry in data_cache._entries.values():
+        entry.expires_at = now
+
+
+def wait_for_revalidation(timeout: float = 30.0) -> float:
+    """Wait for the background refreshes to finish, returns the seconds waited."""
+    start = time.perf_counter()
+    while single_flight.info()["in_flight"] and time.perf_counter() - start < timeout:
+        time.sleep(0.01)
+    return time.perf_counter() - start
+
+
+def report(label: str, fake: FakeNHLClient, result: dict[str, Any], resilient: ResilientClient = None) -> None:
+    line = (f"{label:34s} {result['wall_ms']:8.1f} ms  failed parts {result['failed']:3d}  "
+            f"served stale {result['stale']:3d}  api calls {fake.total_calls():3d}")
+    if resilient is not None:
+        info = resilient.info()
+        line += (f"  retries {info['retries']:3d}  rejected {info['rejected']:3d}  "
+                 f"throttled {info['throttled_s']:.2f}s  circuit {info['circuit']}")
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--teams", type=int, default=16, help="teams whose board is loaded")
+    parser.add_argument("--delay", type=float, default=0.3, help="simulated latency of the slow API in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.3, help="share of the flaky API's calls failing")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    season, teams = selection(args.teams)
+    print(f"{args.teams} boards, flaky API failing {args.failure_rate:.0%} of calls, "
+          f"slow API {args.delay * 1e3:.0f} ms per call\n")
+
+    for label, wrap in (("flaky, plain client", False), ("flaky, resilient client", True)):
+        data_cache.clear()
+        fake = FakeNHLClient(failure_rate=args.failure_rate)
+        resilient = ResilientClient(fake) if wrap else None
+        report(label, fake, load_boards(resilient or fake, season, teams), resilient)
+
+    fake = FakeNHLClient(delay=args.delay)
+    resilient = ResilientClient(fake)
+    data_cache.clear()
+    report("slow, cold cache", fake, load_boards(resilient, season, teams), resilient)
+    expire_cache()
+    fake.calls.clear()
+    report("slow, expired cache", fake, load_boards(resilient, season, teams), resilient)
+    waited = wait_for_revalidation()
+    print(f"{'':34s} background refresh done {waited * 1e3:.0f} ms later, api calls {fake.total_calls()}")
+
+    expire_cache()
+    fake.outage = True
+    fake.calls.clear()
+    report("outage, expired cache", fake, load_boards(resilient, season, teams), resilient)
+    wait_for_revalidation()
+    data_cache.clear()
+    fake.calls.clear()
+    resilient = ResilientClient(fake)
+    report("outage, cold cache", fake, load_boards(resilient, season, teams), resilient)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+Benchmark: regular season schedule derivation, vectorized pipeline versus the previous implementation.
+
+The previous implementation (per-row ``.apply`` score formatting and nested ``np.where``
+string building) is kept below as the reference.  The benchmark first validates that
+build_regular_schedule produces an identical frame for every team, then times one
+schedule and a 32-team batch for both.  Finally it times an incremental refresh of a
+cached schedule (nothing changed, one game went live) against a full rebuild.
+
+    python -m benchmarks.bench_schedule [--season 20242025] [--repeat 5]
+"""
+import argparse
+import copy
+import time
+
+import numpy as np
+import pandas as pd
+
+from app.data.schedule_dal import (FLOAT_SCHEDULE_COLUMNS, REGULAR_SCHEDULE_COLUMNS, build_regular_schedule,
+                                   update_regular_schedule)
+from app.helpers.dataframe_utilities import compact_frame
+from app.helpers.dataframe_utilities import col_or_blank, safe_numeric_col
+from benchmarks.fixtures import CURRENT_SEASON, TEAM_ABBREVS, team_schedule_payload
+
+
+def legacy_regular_schedule(schedule_json: dict, team_abbrev: str) -> pd.DataFrame:
+    """The schedule derivation as it was before vectorization, used as the reference output."""
+    # Keep only regular season games (gameType=2)
+    regular_season_games = [g for g in schedule_json.get('games', []) if g.get('gameType') == 2]
+
+    # Flatten nested JSON to columns like 'awayTeam.score', 'homeTeam.abbrev', etc.
+    df = pd.json_normalize(regular_season_games, sep='.').set_index('id')
+
+    # Determine which games have been played (FUT = future)
+    game_played = df['gameState'].ne('FUT')
+
+    # Scores only for played games (nullable integers for display)
+    away_raw = safe_numeric_col(df, "awayTeam.score")
+    home_raw = safe_numeric_col(df, "homeTeam.score")
+    df["awayTeamScore"] = away_raw.where(game_played).astype("Int64")
+    df["homeTeamScore"] = home_raw.where(game_played).astype("Int64")
+
+    # Coerce to nullable float for safe arithmetic
+    df['awayScore'] = df['awayTeamScore'].astype('Float64')
+    df['homeScore'] = df['homeTeamScore'].astype('Float64')
+
+    # Team name columns
+    df['awayTeam'] = df.get('awayTeam.commonName.default')
+    df['homeTeam'] = df.get('homeTeam.commonName.default')
+
+    # Compute goalDiff from TEAM perspective (NaN for unplayed)
+    home_game = df.get('homeTeam.abbrev', '').eq(team_abbrev)
+    df['goalDiff'] = np.where(
+        game_played,
+        np.where(home_game,
+                 df['homeScore'] - df['awayScore'],
+                 df['awayScore'] - df['homeScore']),
+        np.nan
+    )
+
+    # W/L/T for played games
+    sign_series: pd.Series = np.sign(pd.to_numeric(df['goalDiff'], errors='coerce'))
+    df['winLossTie'] = np.where(
+        game_played, sign_series.map({1.0: 'W', -1.0: 'L', 0.0: 'T'}), ''
+    )
+    df['opponent'] = np.where(
+        home_game,
+        'vs ' + df['awayTeam'],
+        '@' + df['homeTeam'])
+
+    # Outcome and award fields: only show when played; empty otherwise
+    outcome_series = col_or_blank(df, 'gameOutcome.lastPeriodType', '')
+    df['gameOutcome'] = np.where(game_played, outcome_series, '')
+
+    # Build integer-like score strings (e.g., "2" not "2.0"), blank when not applicable
+    home_score_str: pd.Series = df['homeScore'].apply(
+        lambda v: '' if pd.isna(v) else f'{int(v)}'
+    )
+    away_score_str: pd.Series = df['awayScore'].apply(
+        lambda v: '' if pd.isna(v) else f'{int(v)}'
+    )
+
+    # A regulation outcome is assumed unless overtime or shootout
+    # No need to annotate a tie as OT, that's assumed
+    game_outcome_str: pd.Series = np.where(
+        (df['winLossTie'] == 'T') |
+        (df['gameOutcome'].isna()) |
+        (df['gameOutcome'] == '') |
+        (df['gameOutcome'] == 'REG'),
+        '',
+        df['gameOutcome']
+    )
+
+    df['scoreSummary'] = np.where(
+        game_played,
+        np.where(home_game,
+                 home_score_str + '-' +
+                 away_score_str + ' ' +
+                 df['winLossTie'] + ' ' +
+                 game_outcome_str,
+
+                 away_score_str + '-' +
+                 home_score_str + ' ' +
+                 df['winLossTie'] + ' ' +
+                 game_outcome_str),
+        ''
+    )
+
+    wg_first: pd.Series = col_or_blank(df, 'winningGoalie.firstInitial.default', '')
+    wg_last: pd.Series  = col_or_blank(df, 'winningGoalie.lastName.default', '')
+    df['winningGoalieDisplay'] = np.where(
+        game_played,
+        wg_first.astype('string').str.cat(wg_last.astype('string'), sep=' ').str.strip(),
+        ''
+    )
+
+    wgs_first: pd.Series = col_or_blank(df, 'winningGoalScorer.firstInitial.default', '')
+    wgs_last: pd.Series = col_or_blank(df, 'winningGoalScorer.lastName.default', '')
+    df['winningGoalScorerDisplay'] = np.where(
+        game_played,
+        wgs_first.astype('string').str.cat(wgs_last.astype('string'), sep=' ').str.strip(),
+        ''
+    )
+    return df
+
+
+def best_of(func, repeat: int) -> float:
+    """Return the best wall time of `repeat` runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--season", default=CURRENT_SEASON, help="season id, e.g. 20242025")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the best is reported")
+    args = parser.parse_args()
+
+    payloads = {team: team_schedule_payload(team, args.season) for team in TEAM_ABBREVS}
+    for team, payload in payloads.items():
+        pd.testing.assert_frame_equal(build_regular_schedule(payload, team), legacy_regular_schedule(payload, team))
+    print(f"validated identical output for {len(payloads)} teams, season {args.season}")
+
+    one_team = TEAM_ABBREVS[0]
+    variants = {"legacy": legacy_regular_schedule, "vectorized": build_regular_schedule}
+    results = {}
+    for name, build in variants.items():
+        single = best_of(lambda: build(payloads[one_team], one_team), args.repeat)
+        batch = best_of(lambda: [build(p, t) for t, p in payloads.items()], args.repeat)
+        results[name] = (single, batch)
+        print(f"{name:10s} per schedule {single * 1e3:8.2f} ms   {len(payloads)}-team batch {batch * 1e3:8.1f} ms")
+    legacy, vectorized = results["legacy"], results["vectorized"]
+    print(f"speedup    per schedule {legacy[0] / vectorized[0]:8.2f}x   batch {legacy[1] / vectorized[1]:15.2f}x")
+
+    def full_build(payload):
+        return compact_frame(build_regular_schedule(payload, one_team), one_team,
+                             keep=REGULAR_SCHEDULE_COLUMNS, exclude=FLOAT_SCHEDULE_COLUMNS)
+
+    cached = full_build(payloads[one_team])
+    live = copy.deepcopy(payloads[one_team])
+    upcoming = [g for g in live['games'] if g.get('gameType') == 2 and g['gameState'] == 'FUT']
+    if upcoming:
+        upcoming[0].update(gameState='LIVE')
+        upcoming[0]['awayTeam']['score'], upcoming[0]['homeTeam']['score'] = 1, 0
+    merged, report = update_regular_schedule(cached, live, one_team, args.season)
+    pd.testing.assert_frame_equal(merged.astype(object), full_build(live).astype(object))
+    full = best_of(lambda: full_build(live), args.repeat)
+    unchanged = best_of(lambda: update_regular_schedule(cached, payloads[one_team], one_team, args.season), args.repeat)
+    one_live = best_of(lambda: update_regular_schedule(cached, live, one_team, args.season), args.repeat)
+    print(f"refresh    full rebuild {full * 1e3:8.2f} ms   incremental, unchanged {unchanged * 1e3:6.2f} ms"
+          f"   one game live {one_live * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: many sessions loading the same team's board at once, right after a cache miss.
+
+Each session is a thread calling load_board_data for the same team at the same moment,
+against the fake client with simulated network latency.  The run is repeated with request
+coalescing off and on (app.helpers.data_cache.single_flight), and once more with the roster
+endpoint failing, to show that a failure is shared rather than retried by every session.
+
+    python -m benchmarks.bench_single_flight [--sessions 32] [--delay 0.05]
+"""
+import argparse
+import logging
+import threading
+import time
+from typing import Any
+
+from app.helpers import use_client
+from app.helpers.data_cache import data_cache, single_flight
+from benchmarks.fake_client import FakeNHLClient
+
+
+def run_sessions(fake: FakeNHLClient, sessions: int, coalesce: bool) -> dict[str, Any]:
+    """Load the board in `sessions` threads released together, returns calls, errors and wall time."""
+    from app.data.page_loader import load_board_data
+    from app.data.season_dal import get_seasons
+    from app.data.team_dal import get_teams_for_season
+
+    season = get_seasons().current
+    team = get_teams_for_season(None).team("SJS")
+    data_cache.clear()
+    fake.calls.clear()
+    single_flight.enabled = coalesce
+    coalesced_before = single_flight.info()["coalesced"]
+
+    barrier = threading.Barrier(sessions)
+    errors = []
+
+    def session():
+        barrier.wait()
+        board = load_board_data(season, team)
+        errors.extend(board.errors)
+
+    threads = [threading.Thread(target=session) for _ in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {
+        "wall_ms": (time.perf_counter() - start) * 1e3,
+        "calls": dict(fake.calls),
+        "errors": len(errors),
+        "coalesced": single_flight.info()["coalesced"] - coalesced_before,
+    }
+
+
+def report(label: str, result: dict[str, Any]) -> None:
+    calls = ", ".join(f"{name.split('.')[-1]} {n}" for name, n in sorted(result["calls"].items()))
+    print(f"{label:28s} {result['wall_ms']:8.1f} ms  api calls {sum(result['calls'].values()):3d} ({calls})  "
+          f"coalesced {result['coalesced']:3d}  failed parts {result['errors']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=32, help="sessions loading the board at once")
+    parser.add_argument("--delay", type=float, default=0.05, help="simulated API latency in seconds")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    fake = FakeNHLClient(delay=args.delay)
+    previous_client = use_client(fake)
+    try:
+        print(f"{args.sessions} sessions, {args.delay * 1e3:.0f} ms API latency\n")
+        report("without coalescing", run_sessions(fake, args.sessions, coalesce=False))
+        report("with coalescing", run_sessions(fake, args.sessions, coalesce=True))
+
+        def unavailable(*args, **kwargs):
+            raise ConnectionError("roster endpoint unavailable")
+        fake.teams.team_roster = fake.endpoint("teams.team_roster", unavailable)
+        report("roster failing, without", run_sessions(fake, args.sessions, coalesce=False))
+        report("roster failing, with", run_sessions(fake, args.sessions, coalesce=True))
+    finally:
+        single_flight.enabled = True
+        use_client(previous_client)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: cold start, import time per module and time to first render.
+
+Each page runs in a fresh Python process, the way a new app server (or a redeploy) meets
+its first session: streamlit is imported first, as the server has done before running any
+page, then the page runs once through Streamlit's AppTest against the fake client, with
+``-X importtime`` recording every import the run makes.  Reported per page, as the median
+of the processes:
+
+- first render: from the start of the run to the first element sent to the browser;
+- first run: the whole first run of the page;
+- team selected (board only): the rerun after picking a team, which needs the data modules;
+- the imports made by the run with the highest cumulative time, and the heavy dependencies.
+
+    python -m benchmarks.bench_startup [--repeat 3] [--top 10]
+"""
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any
+
+from app.helpers.file_utilities import PROJECT_ROOT
+
+PAGES = {
+    "display_board": PROJECT_ROOT / "app" / "web" / "display_board_app.py",
+    "player_profile": PROJECT_ROOT / "app" / "web" / "pages" / "player_profile.py",
+}
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "nhlpy", "httpx")
+# Written to stderr by the child when the run starts, only imports after it are counted
+RUN_MARKER = "-- bench_startup run --"
+
+
+def child(page: str) -> None:
+    """Run one page once in this (fresh) process and print its timings as JSON."""
+    import streamlit  # noqa: F401  the server has imported streamlit before any page runs
+    from streamlit.delta_generator import DeltaGenerator
+    from streamlit.testing.v1 import AppTest
+
+    from app.helpers import use_client
+    from benchmarks.fake_client import FakeNHLClient
+
+    logging.disable(logging.WARNING)
+    first_element: list[float] = []
+    enqueue = DeltaGenerator._enqueue
+
+    def timed_enqueue(self, *args, **kwargs):
+        if not first_element:
+            first_element.append(time.perf_counter())
+        return enqueue(self, *args, **kwargs)
+    DeltaGenerator._enqueue = timed_enqueue
+
+    use_client(FakeNHLClient())
+    at = AppTest.from_file(str(PAGES[page]), default_timeout=60)
+    print(RUN_MARKER, file=sys.stderr, flush=True)
+    start = time.perf_counter()
+    at.run()
+    result: dict[str, Any] = {
+        "first_render_ms": (first_element[0] - start) * 1e3 if first_element else None,
+        "first_run_ms": (time.perf_counter() - start) * 1e3,
+        "failed": bool(at.exception),
+    }
+    if page == "display_board":
+        at.selectbox(key="team_select").select_index(1)
+        start = time.perf_counter()
+        at.run()
+        result["team_selected_ms"] = (time.perf_counter() - start) * 1e3
+        result["failed"] = result["failed"] or bool(at.exception)
+    print(json.dumps(result))
+
+
+def parse_importtime(lines: list[str]) -> list[tuple[str, int, float]]:
+    """(module, depth, cumulative ms) for each ``-X importtime`` line."""
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        module = name.strip()
+        imports.append((module, (len(name) - len(name.lstrip()) - 1) // 2, int(cumulative) / 1e3))
+    return imports
+
+
+def run_page(page: str) -> dict[str, Any]:
+    """Run a page in a fresh process, returns its timings and the imports made by the run."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "benchmarks.bench_startup", "--child", page],
+                          capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=300)
+    if proc.returncode:
+        raise RuntimeError(f"{page} failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(proc.stderr.split(RUN_MARKER, 1)[1].splitlines())
+    return result
+
+
+def report(page: str, runs: list[dict[str, Any]], top: int) -> None:
+    def median(name: str) -> str:
+        values = [r[name] for r in runs if r.get(name) is not None]
+        return f"{statistics.median(values):8.1f} ms" if values else "       - ms"
+
+    print(f"{page}: first render {median('first_render_ms')}, first run {median('first_run_ms')}"
+          + (f", team selected {median('team_selected_ms')}" if "team_selected_ms" in runs[0] else "")
+          + (", FAILED" if any(r["failed"] for r in runs) else ""))
+    imports = runs[0]["imports"]
+    top_level = sorted((i for i in imports if i[1] == 0), key=lambda i: i[2], reverse=True)[:top]
+    for module, _, ms in top_level:
+        print(f"    {module:48s} {ms:8.1f} ms")
+    heavy = {module: ms for module, _, ms in imports if module in HEAVY_MODULES}
+    print("    heavy dependencies imported by the first run: "
+          + (", ".join(f"{m} {heavy[m]:.0f} ms" for m in HEAVY_MODULES if m in heavy) or "none"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3, help="fresh processes per page, the median is shown")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports shown per page")
+    parser.add_argument("--child", choices=PAGES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+        return
+    for page in PAGES:
+        report(page, [run_page(page) for _ in range(args.repeat)], args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+A local stand-in for nhlpy's NHLClient, serving the payloads from benchmarks.fixtures.
+
+Only the endpoints used by the app are implemented.  Every call is counted per
+endpoint, an optional delay simulates network latency, and failures can be injected: a
+share of calls failing with a server error, or an outage where no call connects.
+"""
+import collections
+import copy
+import random
+import time
+from typing import Any, Callable
+
+from benchmarks import fixtures
+
+
+class _FakeGroup:
+    """One endpoint group (teams, schedule, ...) whose methods return fixture payloads."""
+    def __init__(self, owner: "FakeNHLClient", group: str, methods: dict[str, Callable[..., Any]]):
+        for name, builder in methods.items():
+            setattr(self, name, owner.endpoint(f"{group}.{name}", builder))
+
+
+class FakeNHLClient:
+    """Serve fixture payloads through the same attribute structure as NHLClient."""
+    def __init__(self, delay: float = 0.0, failure_rate: float = 0.0, seed: int = 0):
+        self.delay = delay
+        self.failure_rate = failure_rate
+        self.outage = False
+        self.calls: collections.Counter[str] = collections.Counter()
+        self._random = random.Random(seed)
+        self.misc = _FakeGroup(self, "misc", {
+            "season_specific_rules_and_info": fixtures.seasons_payload,
+        })
+        self.teams = _FakeGroup(self, "teams", {
+            "teams": fixtures.teams_payload,
+            "team_roster": fixtures.roster_payload,
+        })
+        self.schedule = _FakeGroup(self, "schedule", {
+            "team_season_schedule": fixtures.team_schedule_payload,
+            "weekly_schedule": fixtures.weekly_schedule_payload,
+        })
+        self.standings = _FakeGroup(self, "standings", {
+            "league_standings": fixtures.league_standings_payload,
+            "season_standing_manifest": fixtures.standings_manifest_payload,
+        })
+        self.game_center = _FakeGroup(self, "game_center", {
+            "daily_scores": fixtures.daily_scores_payload,
+        })
+        self.stats = _FakeGroup(self, "stats", {
+            "player_career_stats": fixtures.career_stats_payload,
+        })
+
+    def endpoint(self, name: str, builder: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a payload builder so calls are counted, delayed, fail as injected, and return a private copy."""
+        def call(*args, **kwargs):
+            self.calls[name] += 1
+            if self.outage:
+                raise ConnectionError(f"{name}: connection refused")
+            if self.delay:
+                time.sleep(self.delay)
+            if self.failure_rate and self._random.random() < self.failure_rate:
+                # Imported here, the startup benchmark counts nhlpy among the app's own imports
+                from nhlpy.http_client import ServerErrorException
+                raise ServerErrorException(f"{name}: 503 Service Unavailable", 503)
+            # The real client returns freshly parsed JSON on every call, so never share payloads
+            return copy.deepcopy(builder(*args, **kwargs))
+        return call
+
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
@@ -0,0 +1,79 @@
+"""
+A local stand-in for a redis.Redis client, for running the Redis data cache backend offline.
+
+Implements the commands app.helpers.cache_backends.RedisStore uses, with Redis semantics
+for values (bytes), key expiry (px) and sets, and counts every command.
+"""
+import collections
+import fnmatch
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+
+class FakeRedis:
+    """An in-memory, thread safe subset of the redis.Redis API."""
+    def __init__(self):
+        self.calls: collections.Counter[str] = collections.Counter()
+        self._data: dict[str, Any] = {}
+        self._expires: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            self.calls["get"] += 1
+            return self._live(name)
+
+    def getrange(self, name: str, start: int, end: int) -> bytes:
+        with self._lock:
+            self.calls["getrange"] += 1
+            value = self._live(name)
+            return b"" if value is None else value[start:end + 1]
+
+    def set(self, name: str, value: bytes, px: Optional[int] = None) -> bool:
+        with self._lock:
+            self.calls["set"] += 1
+            self._data[name] = bytes(value)
+            self._expires.pop(name, None)
+            if px is not None:
+                self._expires[name] = time.time() + px / 1000
+            return True
+
+    def sadd(self, name: str, *values: str) -> int:
+        with self._lock:
+            self.calls["sadd"] += 1
+            members = self._data.setdefault(name, set())
+            added = {v.encode() for v in values} - members
+            members.update(added)
+            return len(added)
+
+    def smembers(self, name: str) -> "set[bytes]":
+        with self._lock:
+            self.calls["smembers"] += 1
+            return set(self._live(name) or ())
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            self.calls["delete"] += 1
+            removed = 0
+            for name in names:
+                name = name.decode() if isinstance(name, bytes) else name
+                if self._live(name) is not None:
+                    removed += 1
+                self._data.pop(name, None)
+                self._expires.pop(name, None)
+            return removed
+
+    def scan_iter(self, match: str = "*") -> Iterator[bytes]:
+        with self._lock:
+            self.calls["scan"] += 1
+            names = [n for n in list(self._data) if self._live(n) is not None and fnmatch.fnmatchcase(n, match)]
+        return iter(n.encode() for n in names)
+
+    def _live(self, name: str) -> Any:
+        """The value of name, None when it is missing or has expired (expired keys are dropped)."""
+        expires_at = self._expires.get(name)
+        if expires_at is not None and time.time() >= expires_at:
+            self._data.pop(name, None)
+            self._expires.pop(name, None)
+        return self._data.get(name)
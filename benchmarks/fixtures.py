@@ -0,0 +1,351 @@
+"""
+NHL API payloads for offline benchmarks.
+
+Each builder returns a payload shaped like the corresponding nhl-api-py call.  When a
+recorded response exists in benchmarks/recorded/<name>.json it is returned as is,
+otherwise a deterministic synthetic payload is generated (seeded by its arguments), so
+benchmark runs are repeatable without network access.
+"""
+import datetime as dt
+import json
+import pathlib
+import random
+from typing import Any
+
+RECORDED_DIR = pathlib.Path(__file__).resolve().parent / "recorded"
+
+DIVISIONS = {
+    "Atlantic": ("Eastern", "E", "A", ["BOS", "BUF", "DET", "FLA", "MTL", "OTT", "TBL", "TOR"]),
+    "Metropolitan": ("Eastern", "E", "M", ["CAR", "CBJ", "NJD", "NYI", "NYR", "PHI", "PIT", "WSH"]),
+    "Central": ("Western", "W", "C", ["CHI", "COL", "DAL", "MIN", "NSH", "STL", "UTA", "WPG"]),
+    "Pacific": ("Western", "W", "P", ["ANA", "CGY", "EDM", "LAK", "SEA", "SJS", "VAN", "VGK"]),
+}
+TEAM_ABBREVS = [abbr for _, _, _, teams in DIVISIONS.values() for abbr in teams]
+CURRENT_SEASON = 20242025
+LAST_NAMES = ["Smith", "Brown", "Tremblay", "Martin", "Roy", "Wilson", "Johnson", "Lee", "Gagnon", "Miller",
+              "Anderson", "Taylor", "Thomas", "Moore", "White", "Harris", "Clark", "Lewis", "Young", "King",
+              "Wright", "Hill", "Scott", "Green", "Adams", "Baker", "Nelson", "Carter"]
+ROSTER_POSITIONS = ["C", "L", "R"] * 5 + ["D"] * 8 + ["G"] * 3
+FIRST_NAMES = ["Connor", "Logan", "Tyler", "Ryan", "Alex", "Mikko", "Jack", "Nico", "Erik", "Sam"]
+
+
+def _recorded(name: str) -> Any:
+    path = RECORDED_DIR / f"{name}.json"
+    if path.exists():
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    return None
+
+
+def _common_name(abbr: str) -> str:
+    return f"{abbr.title()}s"
+
+
+def seasons_payload() -> list[dict]:
+    recorded = _recorded("seasons")
+    if recorded is not None:
+        return recorded
+    seasons = []
+    for start in range(1917, CURRENT_SEASON // 10000 + 1):
+        sid = start * 10000 + start + 1
+        seasons.append({
+            "id": sid,
+            "formattedSeasonId": f"{start}-{str(start + 1)[-2:]}",
+            "startDate": f"{start}-10-04T00:00:00",
+            "endDate": f"{start + 1}-06-20T00:00:00",
+            "numberOfGames": 82 if start >= 2021 else 80,
+        })
+    return seasons
+
+
+def teams_payload(date: str = "now") -> list[dict]:
+    recorded = _recorded(f"teams-{date}")
+    if recorded is not None:
+        return recorded
+    teams = []
+    for division, (conference, conf_abbr, div_abbr, abbrevs) in DIVISIONS.items():
+        for abbr in abbrevs:
+            teams.append({
+                "abbr": abbr,
+                "name": f"{abbr.title()} City {_common_name(abbr)}",
+                "common_name": _common_name(abbr),
+                "logo": f"https://assets.nhle.com/logos/nhl/svg/{abbr}_light.svg",
+                "conference": {"name": conference, "abbr": conf_abbr},
+                "division": {"name": division, "abbr": div_abbr},
+                "franchise_id": TEAM_ABBREVS.index(abbr) + 1,
+            })
+    return teams
+
+
+def _player(rng: random.Random, pid: int, position: str, number: int) -> dict:
+    country = rng.choice(["CAN", "CAN", "USA", "SWE", "FIN", "CZE"])
+    player = {
+        "id": pid,
+        "headshot": f"https://assets.nhle.com/mugs/nhl/{pid}.png",
+        "firstName": {"default": rng.choice(FIRST_NAMES)},
+        "lastName": {"default": rng.choice(LAST_NAMES)},
+        "sweaterNumber": number,
+        "positionCode": position,
+        "shootsCatches": rng.choice(["L", "R"]),
+        "heightInInches": rng.randint(68, 78),
+        "weightInPounds": rng.randint(170, 230),
+        "heightInCentimeters": 185,
+        "weightInKilograms": 90,
+        "birthDate": f"{rng.randint(1985, 2004)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+        "birthCity": {"default": f"Town{rng.randint(1, 99)}"},
+        "birthCountry": country,
+    }
+    if country in ("CAN", "USA"):
+        player["birthStateProvince"] = {"default": rng.choice(["ON", "QC", "MN", "MA"])}
+    return player
+
+
+def roster_payload(team_abbr: str, season: int | str) -> dict:
+    recorded = _recorded(f"roster-{team_abbr}-{season}")
+    if recorded is not None:
+        return recorded
+    rng = random.Random(f"{team_abbr}{season}")
+    base = 8470000 + TEAM_ABBREVS.index(team_abbr) * 100
+    numbers = rng.sample(range(1, 99), 26)
+    players = [_player(rng, base + i, pos, numbers[i]) for i, pos in enumerate(ROSTER_POSITIONS)]
+    return {"forwards": players[:15], "defensemen": players[15:23], "goalies": players[23:]}
+
+
+def _league_games(season: int | str) -> list[dict]:
+    """Build a full league season where every team plays 82 games."""
+    season = int(season)
+    start = dt.date(season // 10000, 10, 8)
+    rng = random.Random(season)
+    games = []
+    game_no = 1
+    today = dt.date(2025, 1, 15) if season == CURRENT_SEASON else dt.date(2100, 1, 1)
+    for day in range(0, 180):
+        date = start + dt.timedelta(days=day)
+        teams = TEAM_ABBREVS[:]
+        rng.shuffle(teams)
+        for home, away in zip(teams[0:14:2], teams[1:14:2]):
+            if game_no > 1312:
+                break
+            played = date < today
+            home_score, away_score = rng.randint(0, 6), rng.randint(0, 6)
+            outcome = "REG"
+            if home_score == away_score:
+                outcome = rng.choice(["OT", "SO"])
+                home_score += rng.choice([0, 1])
+                away_score += 1 if home_score == away_score else 0
+            game = {
+                "id": (season // 10000) * 1000000 + 20000 + game_no,
+                "season": season,
+                "gameType": 2,
+                "gameDate": date.isoformat(),
+                "venue": {"default": f"{home} Arena"},
+                "neutralSite": False,
+                "startTimeUTC": f"{date.isoformat()}T00:00:00Z",
+                "gameState": ("OFF" if played else "FUT"),
+                "awayTeam": {"id": TEAM_ABBREVS.index(away) + 1, "commonName": {"default": _common_name(away)},
+                             "placeName": {"default": away.title()}, "abbrev": away,
+                             "logo": f"https://assets.nhle.com/logos/nhl/svg/{away}_light.svg"},
+                "homeTeam": {"id": TEAM_ABBREVS.index(home) + 1, "commonName": {"default": _common_name(home)},
+                             "placeName": {"default": home.title()}, "abbrev": home,
+                             "logo": f"https://assets.nhle.com/logos/nhl/svg/{home}_light.svg"},
+                "periodDescriptor": {"periodType": outcome, "maxRegulationPeriods": 3},
+            }
+            if played:
+                game["awayTeam"]["score"] = away_score
+                game["homeTeam"]["score"] = home_score
+                game["gameOutcome"] = {"lastPeriodType": outcome}
+                game["winningGoalie"] = {"playerId": 1, "firstInitial": {"default": "J."},
+                                         "lastName": {"default": rng.choice(LAST_NAMES)}}
+                if rng.random() > 0.05:
+                    game["winningGoalScorer"] = {"playerId": 2, "firstInitial": {"default": "T."},
+                                                 "lastName": {"default": rng.choice(LAST_NAMES)}}
+            games.append(game)
+            game_no += 1
+    return games
+
+
+_LEAGUE_GAMES: dict[int, list[dict]] = {}
+
+
+def league_games(season: int | str) -> list[dict]:
+    """Every regular season game of a season, built once and reused by the schedule payloads."""
+    season = int(season)
+    if season not in _LEAGUE_GAMES:
+        _LEAGUE_GAMES[season] = _league_games(season)
+    return _LEAGUE_GAMES[season]
+
+
+def team_schedule_payload(team_abbr: str, season: int | str) -> dict:
+    recorded = _recorded(f"schedule-{team_abbr}-{season}")
+    if recorded is not None:
+        return recorded
+    games = [g for g in league_games(season)
+             if team_abbr in (g["homeTeam"]["abbrev"], g["awayTeam"]["abbrev"])]
+    # A couple of preseason games, which the DAL filters out
+    pre = [dict(g, id=g["id"] - 10000, gameType=1) for g in games[:2]]
+    return {"previousSeason": int(season) - 10001, "currentSeason": int(season),
+            "clubTimezone": "US/Pacific", "games": json.loads(json.dumps(pre + games))}
+
+
+def weekly_schedule_payload(date: str) -> dict:
+    """The league schedule for the 7 days starting at date, as returned by schedule.weekly_schedule."""
+    start = dt.date.fromisoformat(date)
+    season = (start.year if start.month >= 7 else start.year - 1)
+    season = season * 10000 + season + 1
+    days = []
+    for i in range(7):
+        day = (start + dt.timedelta(days=i)).isoformat()
+        # Dated by the day, the weekly schedule's games have no gameDate of their own
+        games = [json.loads(json.dumps({k: v for k, v in g.items() if k != "gameDate"}))
+                 for g in league_games(season) if g["gameDate"] == day]
+        days.append({"date": day, "numberOfGames": len(games), "games": games})
+    return {"nextStartDate": (start + dt.timedelta(days=7)).isoformat(),
+            "previousStartDate": (start - dt.timedelta(days=7)).isoformat(),
+            "gameWeek": days}
+
+
+# The fixture's "today" in the current season, the score endpoint's "now"
+FIXTURE_TODAY = dt.date(2025, 1, 15)
+# States given to the games of FIXTURE_TODAY, in order (the remaining games are upcoming)
+_LIVE_STATES = [
+    {"gameState": "LIVE", "period": 2, "clock": {"timeRemaining": "08:21", "running": True, "inIntermission": False}},
+    {"gameState": "LIVE", "period": 1, "clock": {"timeRemaining": "00:00", "running": False, "inIntermission": True}},
+    {"gameState": "CRIT", "period": 3, "clock": {"timeRemaining": "01:30", "running": True, "inIntermission": False}},
+    {"gameState": "FINAL", "period": 3, "clock": {"timeRemaining": "00:00", "running": False, "inIntermission": False}},
+    {"gameState": "PRE", "period": 0, "clock": {"timeRemaining": "20:00", "running": False, "inIntermission": False}},
+]
+
+
+def daily_scores_payload(date: str | None = None) -> dict:
+    """Scores for a day as returned by game_center.daily_scores, with games in every live state for today."""
+    day = dt.date.fromisoformat(date) if date and date != "now" else FIXTURE_TODAY
+    season = (day.year if day.month >= 7 else day.year - 1)
+    season = season * 10000 + season + 1
+    rng = random.Random(day.toordinal())
+    games = []
+    for i, g in enumerate(g for g in league_games(season) if g["gameDate"] == day.isoformat()):
+        game = {k: json.loads(json.dumps(g[k])) for k in ("id", "season", "gameType", "gameDate", "venue",
+                                                           "startTimeUTC", "awayTeam", "homeTeam")}
+        state = _LIVE_STATES[i] if day == FIXTURE_TODAY and i < len(_LIVE_STATES) else None
+        if state:
+            game.update(json.loads(json.dumps(state)))
+            game["periodDescriptor"] = {"number": state["period"], "periodType": "REG", "maxRegulationPeriods": 3}
+            if state["gameState"] != "PRE":
+                for team in ("awayTeam", "homeTeam"):
+                    game[team]["score"] = rng.randint(0, 4)
+                    game[team]["sog"] = rng.randint(5, 35)
+        else:
+            game["gameState"] = g["gameState"]
+            for team in ("awayTeam", "homeTeam"):
+                if "score" in g[team]:
+                    game[team]["sog"] = rng.randint(20, 40)
+        games.append(game)
+    return {"prevDate": (day - dt.timedelta(days=1)).isoformat(), "currentDate": day.isoformat(),
+            "nextDate": (day + dt.timedelta(days=1)).isoformat(), "games": games}
+
+
+def standings_payload(season: int | str) -> dict:
+    recorded = _recorded(f"standings-{season}")
+    if recorded is not None:
+        return recorded
+    rows = {abbr: {"w": 0, "l": 0, "otl": 0, "gf": 0, "ga": 0, "gp": 0} for abbr in TEAM_ABBREVS}
+    for g in league_games(season):
+        if g["gameState"] == "FUT":
+            continue
+        h, a = g["homeTeam"], g["awayTeam"]
+        for me, them in ((h, a), (a, h)):
+            r = rows[me["abbrev"]]
+            r["gp"] += 1
+            r["gf"] += me["score"]
+            r["ga"] += them["score"]
+            if me["score"] > them["score"]:
+                r["w"] += 1
+            elif g["gameOutcome"]["lastPeriodType"] == "REG":
+                r["l"] += 1
+            else:
+                r["otl"] += 1
+    standings = []
+    for division, (conference, _, _, abbrevs) in DIVISIONS.items():
+        for abbr in abbrevs:
+            r = rows[abbr]
+            standings.append({
+                "conferenceName": conference, "divisionName": division,
+                "conferenceAbbrev": conference[0], "divisionAbbrev": division[0],
+                "teamAbbrev": {"default": abbr}, "teamName": {"default": f"{abbr.title()} City {_common_name(abbr)}"},
+                "teamCommonName": {"default": _common_name(abbr)},
+                "teamLogo": f"https://assets.nhle.com/logos/nhl/svg/{abbr}_light.svg",
+                "date": "2025-01-15", "seasonId": int(season),
+                "gamesPlayed": r["gp"], "wins": r["w"], "losses": r["l"], "ties": 0, "otLosses": r["otl"],
+                "points": 2 * r["w"] + r["otl"], "goalFor": r["gf"], "goalAgainst": r["ga"],
+                "goalDifferential": r["gf"] - r["ga"],
+            })
+    standings.sort(key=lambda s: (-s["points"], -s["goalDifferential"]))
+    for i, s in enumerate(standings):
+        s["leagueSequence"] = i + 1
+    for key, seq in (("conferenceName", "conferenceSequence"), ("divisionName", "divisionSequence")):
+        counts: dict[str, int] = {}
+        for s in standings:
+            counts[s[key]] = counts.get(s[key], 0) + 1
+            s[seq] = counts[s[key]]
+    return {"wildCardIndicator": True, "standings": standings}
+
+
+def standings_manifest_payload() -> list[dict]:
+    recorded = _recorded("standings-manifest")
+    if recorded is not None:
+        return recorded
+    return [{"id": s["id"], "standingsStart": s["startDate"][:10], "standingsEnd": s["endDate"][:10]}
+            for s in seasons_payload()]
+
+
+def league_standings_payload(date: str | None = None, season: int | str | None = None) -> dict:
+    """The standings of a season, or of the season played on a date (the current season by default)."""
+    if season is None:
+        season = CURRENT_SEASON
+        if date and date != "now":
+            season = next((s["id"] for s in standings_manifest_payload()
+                           if s["standingsStart"] <= date <= s["standingsEnd"]), CURRENT_SEASON)
+    return standings_payload(season)
+
+
+def career_stats_payload(player_id: int | str) -> dict:
+    recorded = _recorded(f"career-{player_id}")
+    if recorded is not None:
+        return recorded
+    rng = random.Random(int(player_id))
+    # Roster players are numbered by position, the last three of each team are goalies
+    goalie = int(player_id) % 100 >= len(ROSTER_POSITIONS) - 3
+    totals = []
+    first = rng.randint(2005, 2020)
+    for year in range(first, 2025):
+        season = year * 10000 + year + 1
+        for league, team in ((("OHL", "Kitchener Rangers"),) if year < first + 2 else (("NHL", "Sharks"),)):
+            for game_type in ((2, 3) if rng.random() < 0.5 else (2,)):
+                gp = rng.randint(5, 82) if game_type == 2 else rng.randint(4, 20)
+                row = {"season": season, "gameTypeId": game_type, "leagueAbbrev": league,
+                       "teamName": {"default": team}, "sequence": 1, "gamesPlayed": gp}
+                if goalie:
+                    row.update({"goalsAgainstAvg": round(rng.uniform(2, 3.5), 2), "savePctg": 0.91,
+                                "goalsAgainst": gp * 3, "shutouts": rng.randint(0, 5), "wins": gp // 2,
+                                "losses": gp // 3, "otLosses": gp // 10, "gamesStarted": gp, "assists": 1,
+                                "goals": 0, "pim": 2, "shotsAgainst": gp * 30, "timeOnIce": f"{gp * 60}:00"})
+                else:
+                    goals, assists = rng.randint(0, gp // 2), rng.randint(0, gp // 2)
+                    row.update({"goals": goals, "assists": assists, "points": goals + assists,
+                                "pim": rng.randint(0, 60), "plusMinus": rng.randint(-20, 20)})
+                    if league == "NHL":
+                        row.update({"avgToi": "17:45", "shots": gp * 2, "shootingPctg": 0.1,
+                                    "faceoffWinningPctg": 0.5})
+                totals.append(row)
+    payload = {
+        "playerId": int(player_id), "isActive": True,
+        "firstName": {"default": rng.choice(FIRST_NAMES)}, "lastName": {"default": rng.choice(LAST_NAMES)},
+        "sweaterNumber": rng.randint(1, 98), "position": "G" if goalie else "C",
+        "seasonTotals": totals,
+    }
+    if rng.random() < 0.5:
+        payload["heroImage"] = f"https://assets.nhle.com/mugs/actionshots/1296x729/{player_id}.jpg"
+    if rng.random() < 0.3:
+        payload["badges"] = [{"logoUrl": {"default": "https://assets.nhle.com/badges/4n_face-off.svg"},
+                              "title": {"default": "4 Nations Face-Off"}}]
+    return payload
@@ -0,0 +1,44 @@
+"""
+Record live NHL API responses as benchmark fixtures.
+
+Saves the payloads the benchmarks use into benchmarks/recorded/, where
+benchmarks.fixtures picks them up in place of the synthetic payloads.  Needs network access.
+
+    python -m benchmarks.record [--season 20242025] [--teams SJS EDM] [--players 8478402]
+"""
+import argparse
+import json
+
+from nhlpy import NHLClient
+
+from benchmarks.fixtures import CURRENT_SEASON, RECORDED_DIR, TEAM_ABBREVS
+
+
+def save(name: str, payload: object) -> None:
+    RECORDED_DIR.mkdir(parents=True, exist_ok=True)
+    path = RECORDED_DIR / f"{name}.json"
+    path.write_text(json.dumps(payload))
+    print(f"recorded {path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--season", default=str(CURRENT_SEASON), help="season id, e.g. 20242025")
+    parser.add_argument("--teams", nargs="*", default=TEAM_ABBREVS, help="team abbreviations to record")
+    parser.add_argument("--players", nargs="*", type=int, default=[], help="player ids for career stats")
+    args = parser.parse_args()
+
+    client = NHLClient()
+    save("seasons", client.misc.season_specific_rules_and_info())
+    save("teams-now", client.teams.teams())
+    save("standings-manifest", client.standings.season_standing_manifest())
+    save(f"standings-{args.season}", client.standings.league_standings(season=args.season))
+    for team in args.teams:
+        save(f"roster-{team}-{args.season}", client.teams.team_roster(team, args.season))
+        save(f"schedule-{team}-{args.season}", client.schedule.team_season_schedule(team, args.season))
+    for player_id in args.players:
+        save(f"career-{player_id}", client.stats.player_career_stats(player_id))
+
+
+if __name__ == "__main__":
+    main()
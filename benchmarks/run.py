@@ -0,0 +1,196 @@
+"""
+Offline benchmark suite for the DAL functions and page renders.
+
+Every NHL API call is served by benchmarks.fake_client.FakeNHLClient, so results only
+reflect the app's own work (JSON transforms, pandas, Streamlit rendering).  Each case is
+run cold (the data cache is cleared first) and reports its best and mean wall time, its
+peak traced memory and the number of API calls it made.  The report is written as JSON;
+when a baseline report is given, any case slower than the baseline by more than the
+threshold fails the run with exit status 1.
+
+    python -m benchmarks.run [--repeat 5] [--report benchmarks/results/latest.json]
+                             [--baseline benchmarks/results/baseline.json] [--threshold 0.25]
+                             [--only get_team_roster ...]
+"""
+import argparse
+import datetime as dt
+import json
+import logging
+import pathlib
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from app.helpers import use_client
+from app.helpers.data_cache import data_cache
+from app.helpers.file_utilities import PROJECT_ROOT
+from benchmarks.fake_client import FakeNHLClient
+
+RESULTS_DIR = PROJECT_ROOT / "benchmarks" / "results"
+APP_SCRIPT = PROJECT_ROOT / "app" / "web" / "display_board_app.py"
+PLAYER_PROFILE_SCRIPT = PROJECT_ROOT / "app" / "web" / "pages" / "player_profile.py"
+DEFAULT_TEAM = "SJS"
+
+
+@dataclass
+class Case:
+    """One benchmarked operation, run against a cold data cache."""
+    name: str
+    func: Callable[[], Any]
+
+
+def build_cases(team_abbrev: str) -> list[Case]:
+    """Build the suite for the current (fixture) season and the given team."""
+    # Imported here so the fake client is installed before any DAL work happens
+    from app.data.roster_dal import get_team_roster
+    from app.data.schedule_dal import get_league_schedule, get_regular_schedule
+    from app.data.season_dal import get_seasons
+    from app.data.standings_dal import get_season_standings, get_team_standing
+    from app.data.stats import get_career_frames, get_career_stats
+    from app.data.team_dal import get_teams_for_season
+
+    season = get_seasons().current
+    team = get_teams_for_season(None).team(team_abbrev)
+    roster = get_team_roster(season, team)
+    player = roster.iloc[0].fillna('').to_dict()
+    player["player_id"] = int(roster.index[0])
+
+    return [
+        Case("get_seasons", get_seasons),
+        Case("get_teams_for_season", lambda: get_teams_for_season(None)),
+        Case("get_team_roster", lambda: get_team_roster(season, team)),
+        Case("get_regular_schedule", lambda: get_regular_schedule(team.abbr, season.id)),
+        Case("get_league_schedule", lambda: get_league_schedule(season)),
+        Case("get_season_standings", lambda: get_season_standings(season.id)),
+        Case("get_team_standing", lambda: get_team_standing(team.abbr, season.id)),
+        Case("get_career_stats", lambda: get_career_stats(player["player_id"])),
+        Case("get_career_frames", lambda: get_career_frames(player["player_id"])),
+        Case("render_main", lambda: render_main(team.name)),
+        Case("render_player_profile", lambda: render_player_profile(player)),
+    ]
+
+
+def _run_app(at: Any) -> None:
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{at.exception[0].message}")
+
+
+def render_main(team_name: str) -> None:
+    """Full main() render through Streamlit's app-testing harness: first paint, then a team selection."""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(str(APP_SCRIPT), default_timeout=60)
+    _run_app(at)
+    at.selectbox(key="team_select").select(team_name)
+    _run_app(at)
+
+
+def render_player_profile(player: dict) -> None:
+    """Player profile page render, including career stats normalization."""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(str(PLAYER_PROFILE_SCRIPT), default_timeout=60)
+    at.session_state["selected_player"] = player
+    _run_app(at)
+
+
+def measure(case: Case, fake: FakeNHLClient, repeat: int) -> dict[str, Any]:
+    """Time `repeat` cold runs of a case, then one more under tracemalloc for peak memory."""
+    timings = []
+    for _ in range(repeat):
+        data_cache.clear()
+        fake.calls.clear()
+        start = time.perf_counter()
+        case.func()
+        timings.append(time.perf_counter() - start)
+    api_calls = fake.total_calls()
+
+    data_cache.clear()
+    tracemalloc.start()
+    try:
+        case.func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_ms": round(min(timings) * 1e3, 3),
+        "mean_ms": round(statistics.mean(timings) * 1e3, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "api_calls": api_calls,
+    }
+
+
+def compare(report: dict, baseline: dict, threshold: float, min_delta_ms: float) -> list[str]:
+    """Return a description of every case slower than baseline * (1 + threshold)."""
+    regressions = []
+    for name, result in report["cases"].items():
+        base = baseline.get("cases", {}).get(name)
+        if not base:
+            continue
+        limit = base["wall_ms"] * (1 + threshold)
+        if result["wall_ms"] > limit and result["wall_ms"] - base["wall_ms"] >= min_delta_ms:
+            regressions.append(f"{name}: {result['wall_ms']:.1f} ms vs baseline {base['wall_ms']:.1f} ms "
+                               f"(limit {limit:.1f} ms)")
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="cold runs per case, the best is compared")
+    parser.add_argument("--team", default=DEFAULT_TEAM, help="team abbreviation used by team cases")
+    parser.add_argument("--only", nargs="*", help="run only the named cases")
+    parser.add_argument("--report", type=pathlib.Path, default=RESULTS_DIR / "latest.json",
+                        help="where to write the JSON report")
+    parser.add_argument("--baseline", type=pathlib.Path, help="baseline report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown versus the baseline, as a fraction (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="ignore slowdowns smaller than this many milliseconds (timer noise)")
+    args = parser.parse_args(argv)
+
+    # Keep the app's and Streamlit's DEBUG/INFO logging out of the timings and the console.  Levels
+    # can't be used because AppTest re-applies logger.level from .streamlit/config.toml on every run.
+    logging.disable(logging.INFO)
+    fake = FakeNHLClient()
+    previous_client = use_client(fake)
+    try:
+        cases = build_cases(args.team)
+        if args.only:
+            cases = [c for c in cases if c.name in args.only]
+        report = {
+            "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "repeat": args.repeat,
+            "team": args.team,
+            "cases": {},
+        }
+        for case in cases:
+            result = measure(case, fake, args.repeat)
+            report["cases"][case.name] = result
+            print(f"{case.name:24s} {result['wall_ms']:10.2f} ms  (mean {result['mean_ms']:9.2f})"
+                  f"  peak {result['peak_kib']:10.1f} KiB  api calls {result['api_calls']}")
+    finally:
+        use_client(previous_client)
+
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    args.report.write_text(json.dumps(report, indent=2))
+    print(f"report written to {args.report}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.threshold, args.min_delta_ms)
+        if regressions:
+            print("performance regressions:\n  " + "\n  ".join(regressions))
+            return 1
+        print(f"no regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())